@@ -4,6 +4,21 @@ logic — its only job is to choose the right tool, pass well-formed
 arguments, and synthesize a response.
 """
 
-from agent.sales_agent import SalesAgent, build_registry, build_hook_manager
+from agent.fast_path import FastPathRouter
+from agent.runtime import Runtime, build_runtime
+from agent.sales_agent import (
+    AgentEvent,
+    SalesAgent,
+    build_hook_manager,
+    build_registry,
+)
 
-__all__ = ["SalesAgent", "build_registry", "build_hook_manager"]
+__all__ = [
+    "AgentEvent",
+    "FastPathRouter",
+    "Runtime",
+    "SalesAgent",
+    "build_registry",
+    "build_hook_manager",
+    "build_runtime",
+]
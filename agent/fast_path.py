@@ -0,0 +1,101 @@
+"""Zero-LLM fast path for purely conversational turns.
+
+Greetings, thanks and goodbyes map to skills that return constant strings,
+yet going through the agent costs two LLM round trips (pick the tool, then
+re-word its output). `FastPathRouter` recognizes such turns locally and
+names the skill to run; `SalesAgent` then invokes it through
+`ToolRegistry.invoke`, so validation, audit logging and metrics still apply.
+
+Matching is deliberately conservative: after normalization the *whole*
+message must match one of the rules. Anything carrying a business request
+("hi, tell me about Acme") falls through to the agent. Precision matters
+more than recall here — a miss only costs the usual LLM path, a false hit
+answers the wrong question.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple
+
+_ADDRESSEE = r"(?: (?:there|jordan|team|all|everyone|again|mate))?"
+
+#: (skill name, full-match pattern) pairs, checked in order. Farewells come
+#: first so "thanks, bye" closes the conversation rather than acknowledging.
+DEFAULT_RULES: Sequence[Tuple[str, str]] = (
+    (
+        "say_goodbye",
+        r"(?:(?:ok(?:ay)? |great |thanks? |thank you )?(?:"
+        r"bye(?: bye)?|goodbye|good bye|bye for now|see (?:you|ya)(?: later| soon)?"
+        r"|talk (?:to you )?(?:later|soon)|ttyl|later|catch you later"
+        r"|(?:that s|thats|that is) all(?: for now)?(?: thanks?| thank you)?"
+        r"|have a (?:good|great|nice) (?:day|one|evening|weekend)"
+        r")" + _ADDRESSEE + r")",
+    ),
+    (
+        "acknowledge_thanks",
+        r"(?:(?:ok(?:ay)? |great |perfect |awesome |cool )?(?:"
+        r"(?:thanks?|thank you)(?: (?:a lot|so much|very much|a ton|again))?"
+        r"(?: for (?:the|your|all the) help)?"
+        r"|thx|ty|tysm|many thanks|cheers|much appreciated|(?:i )?appreciate it"
+        r")" + _ADDRESSEE + r")",
+    ),
+    (
+        "greet_user",
+        r"(?:(?:hi|hello|hey|hiya|howdy|yo|greetings|hey hey|hi hi"
+        r"|good (?:morning|afternoon|evening)"
+        r")" + _ADDRESSEE + r")",
+    ),
+)
+
+_NOISE = re.compile(r"[^\w\s]|_")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase, drop punctuation/emoji, collapse whitespace."""
+    return _SPACES.sub(" ", _NOISE.sub(" ", (text or "").lower())).strip()
+
+
+class FastPathRouter:
+    """Map high-confidence conversational messages to a skill name."""
+
+    def __init__(
+        self,
+        rules: Sequence[Tuple[str, str]] = DEFAULT_RULES,
+        *,
+        max_length: int = 60,
+    ):
+        self._rules: List[Tuple[str, Pattern[str]]] = [
+            (skill, re.compile(pattern)) for skill, pattern in rules
+        ]
+        self._max_length = max_length
+        self._hits = 0
+        self._misses = 0
+
+    def match(self, user_input: str) -> Optional[str]:
+        """Return the skill to run for `user_input`, or `None` to use the agent."""
+        if not user_input or len(user_input) > self._max_length:
+            return None
+        text = normalize(user_input)
+        return next((name for name, rx in self._rules if rx.fullmatch(text)), None)
+
+    def record(self, hit: bool) -> None:
+        """Count a turn's outcome.
+
+        A match is only a hit once its skill has actually answered the turn;
+        an unregistered or failing skill sends the turn to the agent, so the
+        caller records it as a miss.
+        """
+        if hit:
+            self._hits += 1
+        else:
+            self._misses += 1
+
+    def stats(self) -> Dict[str, float]:
+        total = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / total, 4) if total else 0.0,
+        }
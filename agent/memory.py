@@ -0,0 +1,214 @@
+"""Bounded conversation memory: recent turns verbatim + a rolling summary.
+
+Replaying a whole session into every prompt makes long threads slower and
+more expensive on every turn. `SummarizingMemory` instead keeps the last
+`keep_turns` exchanges verbatim and folds anything older into a running
+summary, so the prompt stays roughly constant in size however long the
+conversation gets.
+
+The summary lives beside the raw history, in a sibling history keyed
+``<session_id>_summary`` holding one JSON message — the same trick the
+opportunity handler uses for its field state. It records how many raw
+messages it already covers, so each update only summarizes the messages
+that just fell out of the verbatim window instead of starting over.
+
+Summarizing costs an LLM call, so it stays off the response path:
+`save_turn` only appends the exchange and schedules a background fold.
+Folds are single-flight per session; turns saved while one runs are
+folded together in one follow-up call. Until a fold lands, `load` simply
+returns a few more verbatim messages. Reads skip the messages the summary
+already covers, using the history's `aget_messages_from` when it has one
+(Redis `LRANGE`, `SessionStore`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, Set, Tuple
+
+from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+
+from observability.logging import get_logger
+
+_LOG = get_logger("essales.memory")
+
+SUMMARY_PROMPT = (
+    "Progressively summarize the conversation between a sales rep and the "
+    "assistant, adding onto the previous summary. Keep names, companies, "
+    "amounts, dates and open requests; drop pleasantries. Stay under "
+    "{max_words} words.\n\n"
+    "Previous summary:\n{summary}\n\n"
+    "New lines of conversation:\n{new_lines}\n\n"
+    "New summary:"
+)
+
+Summarizer = Callable[[str, Sequence[BaseMessage]], Awaitable[str]]
+
+
+def approx_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token for English text)."""
+    return (len(text) + 3) // 4
+
+
+def llm_summarizer(llm: Any, max_words: int = 150) -> Summarizer:
+    """Build a `Summarizer` that asks `llm` to extend the running summary."""
+
+    async def _summarize(summary: str, new_messages: Sequence[BaseMessage]) -> str:
+        prompt = SUMMARY_PROMPT.format(
+            max_words=max_words,
+            summary=summary or "(none)",
+            new_lines=_render(new_messages),
+        )
+        reply = await llm.ainvoke(prompt)
+        return str(getattr(reply, "content", reply)).strip()
+
+    return _summarize
+
+
+class SummarizingMemory:
+    """Per-session chat memory with a bounded prompt footprint.
+
+    Args:
+        history_factory: `session_id -> BaseChatMessageHistory`; called for
+            both the raw history and its ``_summary`` sibling.
+        summarizer: folds messages into the running summary.
+        keep_turns: exchanges (user + assistant message pairs) kept verbatim.
+        token_budget: upper bound on the tokens the verbatim window may
+            occupy; older turns are summarized early to respect it.
+        token_counter: tokenizer used for the budget; defaults to a
+            character-based estimate so no model tokenizer is required.
+    """
+
+    def __init__(
+        self,
+        history_factory: Callable[[str], BaseChatMessageHistory],
+        summarizer: Summarizer,
+        *,
+        keep_turns: int = 6,
+        token_budget: int = 1500,
+        token_counter: Callable[[str], int] = approx_tokens,
+    ):
+        self._history_factory = history_factory
+        self._summarizer = summarizer
+        self._keep_messages = max(1, keep_turns) * 2
+        self._token_budget = token_budget
+        self._count = token_counter
+        self._folding: Dict[str, asyncio.Task] = {}
+        self._refold: Set[str] = set()
+
+    async def load(self, session_id: str) -> List[BaseMessage]:
+        """Messages to place in the prompt's `chat_history` slot."""
+        state, recent = await self._read(session_id)
+        out: List[BaseMessage] = []
+        if state["summary"]:
+            out.append(
+                SystemMessage(
+                    content=f"Summary of the earlier conversation:\n{state['summary']}"
+                )
+            )
+        out.extend(recent)
+        return out
+
+    async def save_turn(self, session_id: str, user_input: str, output: str) -> None:
+        """Append one exchange; overflow is folded into the summary in the background."""
+        await self._history_factory(session_id).aadd_messages(
+            [HumanMessage(content=user_input), AIMessage(content=output)]
+        )
+        if session_id in self._folding:
+            self._refold.add(session_id)  # the running fold picks this turn up
+            return
+        self._folding[session_id] = asyncio.ensure_future(self._fold(session_id))
+
+    async def wait_for_summaries(self) -> None:
+        """Wait for background folds to finish (tests, shutdown)."""
+        while self._folding:
+            await asyncio.gather(*self._folding.values(), return_exceptions=True)
+
+    async def _fold(self, session_id: str) -> None:
+        try:
+            while True:
+                self._refold.discard(session_id)
+                await self._fold_once(session_id)
+                if session_id not in self._refold:
+                    return
+        except Exception:  # noqa: BLE001 — the next turn retries the fold
+            _LOG.warning(
+                '{"event":"memory_summary_failed","session_id":"%s"}',
+                session_id,
+                exc_info=True,
+            )
+        finally:
+            # Unregistered here rather than in a done callback, so a turn
+            # saved after the last check always starts a new fold.
+            self._folding.pop(session_id, None)
+
+    async def _fold_once(self, session_id: str) -> None:
+        state, recent = await self._read(session_id)
+        overflow = self._overflow(recent)
+        if not overflow:
+            return
+        summary = await self._summarizer(state["summary"], recent[:overflow])
+        state = {"summary": summary, "covered": state["covered"] + overflow}
+        summary_history = self._history_factory(f"{session_id}_summary")
+        await summary_history.aclear()
+        await summary_history.aadd_messages([AIMessage(content=json.dumps(state))])
+        _LOG.info(
+            '{"event":"memory_summarized","session_id":"%s","folded":%s,"covered":%s}',
+            session_id,
+            overflow,
+            state["covered"],
+        )
+
+    async def _read(self, session_id: str) -> Tuple[Dict[str, Any], List[BaseMessage]]:
+        """The summary state and the raw messages it doesn't cover yet."""
+        history = self._history_factory(session_id)
+        state = await self._load_state(session_id)
+        length, recent = await _messages_from(history, state["covered"])
+        if state["covered"] > length:
+            # The raw history expired or was evicted without its summary;
+            # the summary no longer describes it, so start over.
+            state = {"summary": "", "covered": 0}
+            length, recent = await _messages_from(history, 0)
+        return state, recent
+
+    def _overflow(self, recent: Sequence[BaseMessage]) -> int:
+        """How many of the oldest un-summarized messages to fold now.
+
+        Always a whole number of exchanges, and never the latest one.
+        """
+        fold = max(0, len(recent) - self._keep_messages)
+        fold -= fold % 2
+        tokens = sum(self._count(str(m.content)) for m in recent[fold:])
+        while tokens > self._token_budget and len(recent) - fold > 2:
+            tokens -= sum(self._count(str(m.content)) for m in recent[fold:fold + 2])
+            fold += 2
+        return fold
+
+    async def _load_state(self, session_id: str) -> Dict[str, Any]:
+        messages = await self._history_factory(f"{session_id}_summary").aget_messages()
+        for msg in reversed(messages):
+            try:
+                state = json.loads(msg.content)
+                covered = int(state.get("covered", 0))
+            except (TypeError, ValueError, AttributeError):
+                continue
+            return {"summary": state.get("summary", ""), "covered": covered}
+        return {"summary": "", "covered": 0}
+
+
+async def _messages_from(
+    history: BaseChatMessageHistory, start: int
+) -> Tuple[int, List[BaseMessage]]:
+    """``(length, messages[start:])``, reading only the tail when the history can."""
+    read_from = getattr(history, "aget_messages_from", None)
+    if read_from is not None:
+        return await read_from(start)
+    messages = await history.aget_messages()
+    return len(messages), messages[start:]
+
+
+def _render(messages: Sequence[BaseMessage]) -> str:
+    role = {"human": "Rep", "ai": "Assistant"}
+    return "\n".join(f"{role.get(m.type, m.type)}: {m.content}" for m in messages)
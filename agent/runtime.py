@@ -0,0 +1,101 @@
+"""Production wiring shared by the entry points.
+
+`main.py` (the bot and HTTP API) and `python -m mcp` (the stdio MCP
+server) serve the same skills, so they must build them the same way:
+the same handlers (local company extraction, the shared profile cache),
+the same hook pipeline (background post-hooks, Redis-backed result
+cache) and the same metrics sink. `build_runtime` does that once for both.
+
+Handlers are still built through `Deferred`, so an entry point imports a
+handler module (and its SDKs) only when a tool first needs it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from agent.sales_agent import build_hook_manager, build_registry
+from config.settings import (
+    LOCAL_EXTRACTION_ENABLED,
+    LOCAL_EXTRACTION_MIN_CONFIDENCE,
+    METRICS_WINDOW_S,
+    POST_HOOK_QUEUE_POLICY,
+    POST_HOOK_QUEUE_SIZE,
+    PROFILE_CACHE_MAX_ENTRIES,
+    PROFILE_CACHE_STALE_S,
+    PROFILE_CACHE_TTL_S,
+    REDIS_URL,
+)
+from data.chat_history import get_redis
+from hooks import BackgroundDispatcher, HookManager, MetricsHook
+from mcp.registry import ToolRegistry
+from skills.catalog import Deferred
+
+
+@dataclass(frozen=True)
+class Runtime:
+    """What an entry point serves: the registry and what it reports to."""
+
+    metrics: MetricsHook
+    hook_manager: HookManager
+    registry: ToolRegistry
+
+    async def aclose(self) -> None:
+        """Flush queued audit/metrics records."""
+        await self.hook_manager.aclose()
+
+
+def build_company_handler(llm: Any, metrics: Optional[MetricsHook] = None):  # type: ignore[no-untyped-def]
+    """`CompanyHandler` with local extraction and the shared profile cache."""
+    from data.profile_cache import ProfileCache
+    from handlers.company import CompanyHandler
+    from handlers.entity_extractor import EntityExtractor
+
+    extractor = None
+    if LOCAL_EXTRACTION_ENABLED:
+        extractor = EntityExtractor(min_confidence=LOCAL_EXTRACTION_MIN_CONFIDENCE)
+    # Shared with the other workers through Redis when it's configured.
+    profile_cache = ProfileCache(
+        ttl_s=PROFILE_CACHE_TTL_S,
+        stale_s=PROFILE_CACHE_STALE_S,
+        max_entries=PROFILE_CACHE_MAX_ENTRIES,
+        redis=get_redis() if REDIS_URL else None,
+        metrics=metrics,
+    )
+    return CompanyHandler(
+        llm, extractor=extractor, profile_cache=profile_cache, metrics=metrics
+    )
+
+
+def _opportunity_handler(llm: Any):  # type: ignore[no-untyped-def]
+    from handlers.opportunity import OpportunityHandler
+
+    return OpportunityHandler(llm)
+
+
+def _proposal_handler(llm: Any):  # type: ignore[no-untyped-def]
+    from handlers.proposal import ProposalHandler
+
+    return ProposalHandler(llm)
+
+
+def build_runtime(llm: Any, *, metrics: Optional[MetricsHook] = None) -> Runtime:
+    """The production registry, hook pipeline and metrics for `llm`."""
+    metrics = metrics or MetricsHook(window_s=METRICS_WINDOW_S)
+    # Audit + metrics post-hooks run off the tool-call path; cached tool
+    # results are shared through Redis when it's configured.
+    hook_manager = build_hook_manager(
+        metrics,
+        dispatcher=BackgroundDispatcher(
+            max_queue=POST_HOOK_QUEUE_SIZE, policy=POST_HOOK_QUEUE_POLICY, metrics=metrics
+        ),
+        redis=get_redis() if REDIS_URL else None,
+    )
+    registry = build_registry(
+        opportunity_handler=Deferred(lambda: _opportunity_handler(llm)),
+        company_handler=Deferred(lambda: build_company_handler(llm, metrics)),
+        proposal_handler=Deferred(lambda: _proposal_handler(llm)),
+        hook_manager=hook_manager,
+    )
+    return Runtime(metrics=metrics, hook_manager=hook_manager, registry=registry)
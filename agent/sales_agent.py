@@ -6,15 +6,28 @@
   * a LangChain `AgentExecutor` that lets the LLM dynamically select and
     call any registered skill.
 
-The agent is created once at boot and re-used per request. Per-request
-concerns (session id, correlation id) live in `SkillContext`, produced by
-`ctx_factory` on every tool call.
+The agent is created once at boot and re-used per request. The prompt,
+the agent runnable and the LangChain tool set are compiled once per
+registry version and shared by every turn. Per-request concerns (session
+id, correlation id, chat history, turn deadline) are injected at invocation
+time: history is passed as executor input and the `ctx_factory` that
+produces a `SkillContext` on every tool call is bound with
+`invocation_scope`.
+
+A turn given a `deadline` stops shortly before it and answers with whatever
+its tool calls produced so far, rather than overrunning the channel's reply
+window. Loading memory may use up to half of that budget (a slower load
+means answering without history), and saving the turn gets what is left of it
+before it finishes in the background.
 """
 
 from __future__ import annotations
 
+import asyncio
+import time
 import uuid
-from typing import Any, Optional
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Set, Tuple
 
 # Import path differs across LangChain versions:
 #   * langchain < 1.2 exposes these at langchain.agents
@@ -27,38 +40,61 @@ except ImportError:  # pragma: no cover - only runs on langchain >= 1.2
         create_openai_tools_agent,
     )
 
-try:
-    from langchain.memory import ConversationBufferMemory  # type: ignore
-except ImportError:  # pragma: no cover
-    from langchain_classic.memory import ConversationBufferMemory  # type: ignore
-
-from langchain_community.chat_message_histories import RedisChatMessageHistory
-from langchain_core.chat_history import InMemoryChatMessageHistory
+from langchain_core.agents import AgentAction, AgentFinish
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 
-from config.settings import REDIS_URL
+from agent.fast_path import FastPathRouter
+from agent.memory import SummarizingMemory, llm_summarizer
+from config.settings import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT_S,
+    MEMORY_KEEP_TURNS,
+    MEMORY_TOKEN_BUDGET,
+    PROPOSAL_MAX_CONCURRENCY,
+    PROPOSAL_MAX_QUEUE,
+    RESULT_CACHE_MAX_ENTRIES,
+    SKILL_CATALOG_PATH,
+    SKILL_ENTRY_POINTS,
+    TOOL_MAX_RETRIES,
+    TOOL_TIMEOUT_S,
+    TOOL_RETRY_BUDGET_RATIO,
+)
+from data.chat_history import get_chat_history
 from hooks import (
     AuditLogHook,
+    BackgroundDispatcher,
+    CircuitBreakerHook,
     HookManager,
     JSONSchemaValidationHook,
     MetricsHook,
+    ResultCacheHook,
     RetryAndFallbackHook,
     SessionEnrichmentHook,
 )
-from mcp.registry import ToolRegistry
+from mcp.registry import (
+    DirectToolOutput,
+    InvocationScope,
+    ToolRegistry,
+    invocation_scope,
+)
 from observability.logging import get_logger
 from skills.base import SkillContext
-from skills.company_info import CompanyInfoSkill
-from skills.create_opportunity import CreateOpportunitySkill
-from skills.draft_proposal import DraftProposalSkill
-from skills.farewell import FarewellSkill
-from skills.fallback import FallbackSkill
-from skills.greeting import GreetingSkill
-from skills.past_projects import PastProjectsSkill
-from skills.thanks import ThanksSkill
+from skills.catalog import (
+    SkillEntry,
+    discover_entry_points,
+    load_catalog,
+    register_catalog,
+)
 
 _LOG = get_logger("essales.agent")
 
+_DEADLINE_REPLY = (
+    "Sorry, this is taking longer than expected. Please try again in a moment."
+)
+_PARTIAL_REPLY_PREFIX = (
+    "I ran out of time before finishing, but here is what I found so far:\n\n"
+)
+
 
 SYSTEM_PROMPT = (
     "You are Jordan, an agentic AI sales assistant. You orchestrate "
@@ -71,18 +107,45 @@ SYSTEM_PROMPT = (
     "`create_opportunity` - it handles field extraction and multi-turn "
     "collection itself.\n"
     "  * When looking up company info, use `get_company_info` for profiles "
-    "and `get_past_projects` for prior engagement history.\n"
+    "and `get_past_projects` for prior engagement history; use "
+    "`search_past_projects` to find clients by the kind of work done.\n"
     "  * Summarize tool outputs for the user in plain language; do not "
     "echo raw JSON unless asked."
 )
 
 
-def build_hook_manager(metrics: Optional[MetricsHook] = None) -> HookManager:
-    """Standard hook pipeline used in production."""
+def build_hook_manager(
+    metrics: Optional[MetricsHook] = None,
+    *,
+    dispatcher: Optional[BackgroundDispatcher] = None,
+    redis: Optional[Any] = None,
+) -> HookManager:
+    """Standard hook pipeline used in production.
+
+    With a `dispatcher`, the audit and metrics post-hooks (both
+    non-blocking) run off the tool-call path. With `redis` (an async
+    client), cached tool results are shared across workers.
+
+    Retries live in the circuit breaker, which sits inside the cache (a
+    cached answer is served even while a tool's circuit is open); the
+    error hook only converts what's left into a graceful failure.
+    """
+    metrics = metrics or MetricsHook()
     return HookManager(
         pre=[JSONSchemaValidationHook(), SessionEnrichmentHook()],
-        post=[AuditLogHook(), metrics or MetricsHook()],
-        error=[RetryAndFallbackHook(max_retries=1)],
+        post=[AuditLogHook(), metrics],
+        error=[RetryAndFallbackHook(max_retries=0)],
+        around=[
+            ResultCacheHook(RESULT_CACHE_MAX_ENTRIES, redis=redis, metrics=metrics),
+            CircuitBreakerHook(
+                failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+                reset_timeout_s=CIRCUIT_RESET_TIMEOUT_S,
+                max_retries=TOOL_MAX_RETRIES,
+                retry_ratio=TOOL_RETRY_BUDGET_RATIO,
+                metrics=metrics,
+            ),
+        ],
+        dispatcher=dispatcher,
     )
 
 
@@ -92,25 +155,41 @@ def build_registry(
     company_handler: Any,
     proposal_handler: Any,
     hook_manager: Optional[HookManager] = None,
+    catalog: Optional[Sequence[SkillEntry]] = None,
 ) -> ToolRegistry:
-    """Build and populate the registry with all production skills."""
-    registry = ToolRegistry(hook_manager=hook_manager or build_hook_manager())
-
-    registry.register(GreetingSkill(), tags=["conversation"])
-    registry.register(FarewellSkill(), tags=["conversation"])
-    registry.register(ThanksSkill(), tags=["conversation"])
-    registry.register(FallbackSkill(), tags=["conversation"])
-    registry.register(
-        CompanyInfoSkill(company_handler=company_handler), tags=["research"]
-    )
-    registry.register(PastProjectsSkill(), tags=["research"])
-    registry.register(
-        CreateOpportunitySkill(opportunity_handler=opportunity_handler),
-        tags=["crm"],
+    """Build and populate the registry with all production skills.
+
+    Skills are registered from catalog metadata and imported on their
+    first call. Handlers may be passed as `skills.catalog.Deferred` so they
+    are built (and their SDKs imported) only when a tool first needs them.
+    `catalog` defaults to the built-in catalog (or `SKILL_CATALOG_PATH`),
+    plus entry point skills when `SKILL_ENTRY_POINTS` is on.
+    """
+    registry = ToolRegistry(
+        hook_manager=hook_manager or build_hook_manager(),
+        default_timeout_s=TOOL_TIMEOUT_S,
     )
-    registry.register(
-        DraftProposalSkill(proposal_handler=proposal_handler),
-        tags=["content"],
+    if catalog is None:
+        catalog = load_catalog(SKILL_CATALOG_PATH)
+        if SKILL_ENTRY_POINTS:
+            catalog += discover_entry_points()
+
+    register_catalog(
+        registry,
+        catalog,
+        deps={
+            "company_handler": company_handler,
+            "opportunity_handler": opportunity_handler,
+            "proposal_handler": proposal_handler,
+        },
+        # Bulkhead: a burst of proposal requests (LLM + PPTX + Blob) is capped
+        # and shed early instead of crowding out interactive lookups.
+        limits={
+            "draft_proposal": {
+                "max_concurrency": PROPOSAL_MAX_CONCURRENCY,
+                "max_queue": PROPOSAL_MAX_QUEUE,
+            }
+        },
     )
 
     _LOG.info(
@@ -120,67 +199,420 @@ def build_registry(
     return registry
 
 
-def _get_chat_memory(session_id: str) -> ConversationBufferMemory:
-    """Redis-backed memory when configured, else in-process."""
-    if REDIS_URL:
-        history = RedisChatMessageHistory(session_id=session_id, url=REDIS_URL)
-    else:
-        history = InMemoryChatMessageHistory()
-    return ConversationBufferMemory(
-        memory_key="chat_history",
-        chat_memory=history,
-        return_messages=True,
+#: Tag attached to the agent's own LLM runs so streamed tokens can be told
+#: apart from nested LLM calls made inside skills (extraction, profiles...).
+_AGENT_LLM_TAG = "essales_agent_llm"
+
+
+@dataclass
+class AgentEvent:
+    """One item of `SalesAgent.astream` output.
+
+    `type` is one of:
+      * ``token``      — `text` holds a delta of the user-facing reply.
+      * ``tool_start`` — `tool` is about to run with `data["arguments"]`.
+      * ``tool_end``   — `tool` finished; `data["output"]` is what the agent saw.
+      * ``final``      — `text` holds the complete reply; always last.
+    """
+
+    type: str
+    text: Optional[str] = None
+    tool: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"type": self.type}
+        if self.text is not None:
+            out["text"] = self.text
+        if self.tool is not None:
+            out["tool"] = self.tool
+        if self.data:
+            out["data"] = self.data
+        return out
+
+
+class _DirectReturnExecutor(AgentExecutor):
+    """`AgentExecutor` that ends the turn on `DirectToolOutput` observations.
+
+    LangChain's own `return_direct` is a static per-tool flag that
+    multi-action (OpenAI tools) agents reject outright; here the decision is
+    made per result by the registry's adapter. Only single-action steps can
+    finish early — when the model fans out to several tools it still needs
+    a synthesis step to combine them.
+    """
+
+    metrics: Optional[Any] = None
+
+    def _get_tool_return(
+        self, next_step_output: Tuple[AgentAction, str]
+    ) -> Optional[AgentFinish]:
+        agent_action, observation = next_step_output
+        if isinstance(observation, DirectToolOutput):
+            if self.metrics is not None:
+                self.metrics.incr("return_direct_turns")
+                self.metrics.incr("llm_calls_saved")
+            _LOG.info(
+                '{"event":"return_direct","tool":"%s"}', agent_action.tool
+            )
+            return AgentFinish({"output": str(observation)}, "")
+        return super()._get_tool_return(next_step_output)
+
+
+def _build_prompt() -> ChatPromptTemplate:
+    return ChatPromptTemplate.from_messages(
+        [
+            ("system", SYSTEM_PROMPT),
+            MessagesPlaceholder("chat_history", optional=True),
+            ("human", "{input}"),
+            MessagesPlaceholder("agent_scratchpad"),
+        ]
     )
 
 
 class SalesAgent:
     """High-level facade: `await agent.run(user_input, session_id)`."""
 
-    def __init__(self, llm: Any, registry: ToolRegistry):
+    def __init__(
+        self,
+        llm: Any,
+        registry: ToolRegistry,
+        *,
+        fast_path: Optional[FastPathRouter] = None,
+        metrics: Optional[MetricsHook] = None,
+        max_parallel_tools: int = 4,
+        memory: Optional[SummarizingMemory] = None,
+        deadline_reserve_s: float = 1.0,
+    ):
         self._llm = llm
         self._registry = registry
+        self._fast_path = fast_path
+        self._metrics = metrics
+        # Cap on tool calls from one turn running at once (the model may emit
+        # several in a single step; the executor dispatches them concurrently).
+        self._max_parallel_tools = max_parallel_tools
+        # Stop this long before a turn's deadline, leaving time to send the
+        # partial answer.
+        self._deadline_reserve_s = deadline_reserve_s
+        self._memory = memory or SummarizingMemory(
+            get_chat_history,
+            llm_summarizer(llm),
+            keep_turns=MEMORY_KEEP_TURNS,
+            token_budget=MEMORY_TOKEN_BUDGET,
+        )
+        self._prompt = _build_prompt()
+        self._executor: Optional[AgentExecutor] = None
+        self._executor_version = -1
+        self._saving: Set[asyncio.Task] = set()
 
-    def _make_ctx_factory(self, session_id: str, user_message: str):
+    def _make_ctx_factory(
+        self, session_id: str, user_message: str, deadline: Optional[float] = None
+    ):
         def _factory() -> SkillContext:
             return SkillContext(
                 session_id=session_id,
                 correlation_id=str(uuid.uuid4()),
                 metadata={"original_user_message": user_message},
+                deadline=deadline,
             )
 
         return _factory
 
-    def _build_executor(
-        self, session_id: str, user_message: str
-    ) -> AgentExecutor:
-        tools = self._registry.to_langchain_tools(
-            self._make_ctx_factory(session_id, user_message)
-        )
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", SYSTEM_PROMPT),
-                MessagesPlaceholder("chat_history", optional=True),
-                ("human", "{input}"),
-                MessagesPlaceholder("agent_scratchpad"),
-            ]
+    def _turn_scope(
+        self, session_id: str, user_message: str, deadline: Optional[float] = None
+    ):
+        """Per-turn tool scope: context factory plus the parallel-call cap."""
+        return invocation_scope(
+            self._make_ctx_factory(session_id, user_message, deadline),
+            max_concurrency=self._max_parallel_tools,
         )
-        agent = create_openai_tools_agent(self._llm, tools, prompt)
-        return AgentExecutor(
-            agent=agent,
-            tools=tools,
-            memory=_get_chat_memory(session_id),
-            handle_parsing_errors=True,
-            verbose=False,
+
+    def _stop_at(self, deadline: Optional[float]) -> Optional[float]:
+        """When the agent loop must give up, leaving room for the reply."""
+        return None if deadline is None else deadline - self._deadline_reserve_s
+
+    def _partial_answer(self, scope: InvocationScope, session_id: str) -> str:
+        """Reply for a turn cut short by its deadline, from finished tool calls."""
+        found: List[str] = [
+            result.metadata.get("display_text") or _readable(result.output)
+            for _, result in scope.results
+            if result.success
+        ]
+        if self._metrics is not None:
+            self._metrics.incr("deadline_partial_answers")
+        _LOG.warning(
+            '{"event":"turn_deadline","session_id":"%s","finished_tools":%s}',
+            session_id,
+            len(found),
         )
+        if not found:
+            return _DEADLINE_REPLY
+        return _PARTIAL_REPLY_PREFIX + "\n\n".join(found)
+
+    def _get_executor(self) -> AgentExecutor:
+        """Return the shared executor, recompiling only if the registry changed.
+
+        The executor carries no per-turn state: memory is loaded and saved by
+        `run`, and tools resolve their context from the active scope.
+        """
+        version = self._registry.version
+        if self._executor is None or self._executor_version != version:
+            tools = self._registry.to_langchain_tools()
+            llm = self._llm.with_config(tags=[_AGENT_LLM_TAG])
+            agent = create_openai_tools_agent(llm, tools, self._prompt)
+            self._executor = _DirectReturnExecutor(
+                agent=agent,
+                tools=tools,
+                handle_parsing_errors=True,
+                verbose=False,
+                metrics=self._metrics,
+            )
+            self._executor_version = version
+            _LOG.info(
+                '{"event":"executor_compiled","registry_version":%s,"tools":%s}',
+                version,
+                len(tools),
+            )
+        return self._executor
 
-    async def run(self, user_input: str, session_id: str) -> str:
+    def _log_turn(self, user_input: str, session_id: str) -> None:
         _LOG.info(
             '{"event":"user_turn","session_id":"%s","input_len":%s}',
             session_id,
             len(user_input or ""),
         )
-        executor = self._build_executor(session_id, user_input)
-        raw = await executor.ainvoke({"input": user_input})
-        if isinstance(raw, dict) and "output" in raw:
-            return raw["output"]
-        return str(raw)
+
+    async def _start_turn(
+        self, user_input: str, session_id: str, deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """The agent's inputs: the message plus the history, deadline-bounded."""
+        budget = _remaining(self._stop_at(deadline))
+        try:
+            # At most half the budget, so a slow store leaves time to answer.
+            history = await asyncio.wait_for(
+                self._memory.load(session_id), None if budget is None else budget / 2
+            )
+        except asyncio.TimeoutError:
+            # Answer without context rather than spend the turn on memory.
+            history = []
+            if self._metrics is not None:
+                self._metrics.incr("memory_load_timeouts")
+            _LOG.warning(
+                '{"event":"memory_load_timeout","session_id":"%s"}', session_id
+            )
+        return {"input": user_input, "chat_history": history}
+
+    async def _save_turn(
+        self, session_id: str, user_input: str, output: str, deadline: Optional[float]
+    ) -> None:
+        """Save the exchange within the turn's budget; past it, finish in the background."""
+        save = asyncio.ensure_future(self._memory.save_turn(session_id, user_input, output))
+        self._saving.add(save)
+        save.add_done_callback(self._saved)
+        try:
+            await asyncio.wait_for(asyncio.shield(save), _remaining(deadline))
+        except asyncio.TimeoutError:
+            if self._metrics is not None:
+                self._metrics.incr("memory_saves_deferred")
+            _LOG.warning(
+                '{"event":"memory_save_deferred","session_id":"%s"}', session_id
+            )
+
+    def _saved(self, task: asyncio.Task) -> None:
+        self._saving.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            _LOG.error("memory save failed", exc_info=task.exception())
+
+    async def _try_fast_path(
+        self, user_input: str, session_id: str, deadline: Optional[float] = None
+    ) -> Optional[Tuple[str, str]]:
+        """Answer purely conversational turns without the LLM.
+
+        Returns `(tool_name, reply)` on a hit. The skill still runs through
+        `ToolRegistry.invoke`, so the hook pipeline (audit, metrics) applies.
+        """
+        if self._fast_path is None:
+            return None
+        tool = self._fast_path.match(user_input)
+        if tool is not None:
+            try:
+                self._registry.get(tool)
+            except KeyError:
+                tool = None
+        result = None
+        if tool is not None:
+            ctx = self._make_ctx_factory(session_id, user_input, deadline)()
+            result = await self._registry.invoke(
+                tool, {"user_message": user_input}, ctx
+            )
+        hit = result is not None and result.success
+        self._fast_path.record(hit)
+        if self._metrics is not None:
+            self._metrics.incr("fast_path_hits" if hit else "fast_path_misses")
+            if hit:
+                # Tool selection + synthesis round trips that never happened.
+                self._metrics.incr("llm_calls_saved", 2)
+            self._metrics.set_gauge(
+                "fast_path_hit_rate", self._fast_path.stats()["hit_rate"]
+            )
+        if not hit:
+            return None
+        _LOG.info(
+            '{"event":"fast_path_hit","session_id":"%s","tool":"%s"}',
+            session_id,
+            tool,
+        )
+        return tool, result.as_text()
+
+    async def run(
+        self, user_input: str, session_id: str, *, deadline: Optional[float] = None
+    ) -> str:
+        """Answer one turn. `deadline` is a `time.monotonic()` timestamp."""
+        self._log_turn(user_input, session_id)
+        # Conversational turns need neither the executor nor the history.
+        fast = await self._try_fast_path(user_input, session_id, deadline)
+        if fast is not None:
+            output = fast[1]
+        else:
+            executor = self._get_executor()
+            inputs = await self._start_turn(user_input, session_id, deadline)
+            stop_at = self._stop_at(deadline)
+            with self._turn_scope(session_id, user_input, deadline) as scope:
+                try:
+                    raw = await asyncio.wait_for(
+                        executor.ainvoke(inputs), _remaining(stop_at)
+                    )
+                except asyncio.TimeoutError:
+                    raw = self._partial_answer(scope, session_id)
+            if isinstance(raw, dict) and "output" in raw:
+                output = raw["output"]
+            else:
+                output = str(raw)
+        await self._save_turn(session_id, user_input, output, deadline)
+        return output
+
+    async def astream(
+        self, user_input: str, session_id: str, *, deadline: Optional[float] = None
+    ) -> AsyncIterator[AgentEvent]:
+        """Stream a turn as it happens: reply tokens plus tool start/end events.
+
+        Only tokens from the agent's own LLM are forwarded; LLM calls made
+        inside skills are internal and stay invisible. Tokens streamed during
+        a tool-selection step are usually empty (the model emits tool calls,
+        not content), so in practice clients see tool events first and the
+        reply tokens last. The final event carries the full reply, which is
+        also what gets saved to memory. Past the `deadline` the stream ends
+        with a partial answer as its final event.
+        """
+        self._log_turn(user_input, session_id)
+        fast = await self._try_fast_path(user_input, session_id, deadline)
+        if fast is not None:
+            tool, output = fast
+            yield AgentEvent(type="tool_start", tool=tool, data={"arguments": {}})
+            yield AgentEvent(type="tool_end", tool=tool, data={"output": output})
+            await self._save_turn(session_id, user_input, output, deadline)
+            yield AgentEvent(type="final", text=output)
+            return
+
+        executor = self._get_executor()
+        inputs = await self._start_turn(user_input, session_id, deadline)
+
+        tool_names = {spec.name for spec in self._registry.list_tools()}
+        output: Optional[str] = None
+
+        with self._turn_scope(session_id, user_input, deadline) as scope:
+            events = _iter_until(
+                executor.astream_events(inputs, version="v2"), self._stop_at(deadline)
+            )
+            try:
+                async for event in events:
+                    kind = event["event"]
+                    if kind == "on_chat_model_stream":
+                        if _AGENT_LLM_TAG not in (event.get("tags") or []):
+                            continue
+                        text = _chunk_text(event["data"].get("chunk"))
+                        if text:
+                            yield AgentEvent(type="token", text=text)
+                    elif kind == "on_tool_start" and event["name"] in tool_names:
+                        yield AgentEvent(
+                            type="tool_start",
+                            tool=event["name"],
+                            data={"arguments": event["data"].get("input") or {}},
+                        )
+                    elif kind == "on_tool_end" and event["name"] in tool_names:
+                        yield AgentEvent(
+                            type="tool_end",
+                            tool=event["name"],
+                            data={"output": str(event["data"].get("output", ""))},
+                        )
+                    elif kind == "on_chain_end" and not event.get("parent_ids"):
+                        raw = event["data"].get("output")
+                        if isinstance(raw, dict) and "output" in raw:
+                            output = raw["output"]
+                        else:
+                            output = str(raw)
+            except asyncio.TimeoutError:
+                output = self._partial_answer(scope, session_id)
+
+        output = output or ""
+        await self._save_turn(session_id, user_input, output, deadline)
+        yield AgentEvent(type="final", text=output)
+
+
+def _remaining(stop_at: Optional[float]) -> Optional[float]:
+    """Seconds until `stop_at` (a `time.monotonic()` timestamp), or `None`."""
+    return None if stop_at is None else max(0.0, stop_at - time.monotonic())
+
+
+def _readable(output: Any) -> str:
+    """A tool output as plain text for a partial answer (dicts as field lines)."""
+    if isinstance(output, dict):
+        return "\n".join(
+            f"{_label(key)}: {_inline(value)}"
+            for key, value in output.items()
+            if value not in (None, "", [], {})
+        )
+    if isinstance(output, (list, tuple)):
+        return "\n".join(f"- {_inline(item)}" for item in output)
+    return "" if output is None else str(output)
+
+
+def _inline(value: Any) -> str:
+    if isinstance(value, dict):
+        return ", ".join(
+            f"{_label(key)}: {_inline(item)}"
+            for key, item in value.items()
+            if item not in (None, "", [], {})
+        )
+    if isinstance(value, (list, tuple)):
+        return ", ".join(_inline(item) for item in value)
+    return str(value)
+
+
+def _label(key: Any) -> str:
+    return str(key).replace("_", " ").capitalize()
+
+
+async def _iter_until(stream: Any, stop_at: Optional[float]) -> AsyncIterator[Any]:
+    """Yield from `stream`; raise `asyncio.TimeoutError` once `stop_at` passes."""
+    try:
+        while True:
+            timeout = _remaining(stop_at)
+            try:
+                yield await asyncio.wait_for(stream.__anext__(), timeout)
+            except StopAsyncIteration:
+                return
+    finally:
+        await stream.aclose()
+
+
+def _chunk_text(chunk: Any) -> str:
+    """Extract plain text from a streamed message chunk (str or content parts)."""
+    content = getattr(chunk, "content", None)
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(
+            part.get("text", "") if isinstance(part, dict) else str(part)
+            for part in content
+        )
+    return ""
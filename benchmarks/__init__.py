@@ -0,0 +1,9 @@
+"""Micro-benchmarks for hot paths.
+
+Each module is runnable from the repo root, e.g.::
+
+    python -m benchmarks.bench_agent_setup
+
+They never call the real LLM, Redis, or Azure; anything external is
+replaced with an in-process fake so numbers reflect our own overhead.
+"""
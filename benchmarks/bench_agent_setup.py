@@ -0,0 +1,81 @@
+"""Per-turn agent setup cost: rebuild-every-turn vs. compiled-once executor.
+
+Before: every turn built a fresh prompt, LangChain tool set (one
+`StructuredTool` + Pydantic args model per skill), agent runnable and
+`AgentExecutor`. After: `SalesAgent._get_executor()` returns the executor
+compiled for the current registry version, and per-turn state is bound
+with `invocation_scope`.
+
+    python -m benchmarks.bench_agent_setup [--turns 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import uuid
+
+from langchain_core.language_models.fake_chat_models import (
+    FakeMessagesListChatModel,
+)
+from langchain_core.messages import AIMessage
+
+from agent.sales_agent import (
+    AgentExecutor,
+    SalesAgent,
+    _build_prompt,
+    build_registry,
+    create_openai_tools_agent,
+)
+from mcp.registry import invocation_scope
+from skills.base import SkillContext
+
+
+def _rebuild_every_turn(agent: SalesAgent, session_id: str) -> AgentExecutor:
+    """The pre-caching `_build_executor` path, kept here for comparison."""
+
+    def _factory() -> SkillContext:
+        return SkillContext(session_id=session_id, correlation_id=str(uuid.uuid4()))
+
+    tools = agent._registry.to_langchain_tools(_factory)
+    agent_runnable = create_openai_tools_agent(agent._llm, tools, _build_prompt())
+    return AgentExecutor(agent=agent_runnable, tools=tools, handle_parsing_errors=True)
+
+
+def _cached(agent: SalesAgent, session_id: str) -> AgentExecutor:
+    def _factory() -> SkillContext:
+        return SkillContext(session_id=session_id, correlation_id=str(uuid.uuid4()))
+
+    with invocation_scope(_factory):
+        return agent._get_executor()
+
+
+def _time_per_turn(fn, agent: SalesAgent, turns: int) -> float:
+    fn(agent, "warmup")
+    start = time.perf_counter()
+    for i in range(turns):
+        fn(agent, f"session-{i}")
+    return (time.perf_counter() - start) * 1000 / turns
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=200)
+    args = parser.parse_args()
+
+    llm = FakeMessagesListChatModel(responses=[AIMessage(content="ok")])
+    registry = build_registry(
+        opportunity_handler=None, company_handler=None, proposal_handler=None
+    )
+    agent = SalesAgent(llm=llm, registry=registry)
+
+    before = _time_per_turn(_rebuild_every_turn, agent, args.turns)
+    after = _time_per_turn(_cached, agent, args.turns)
+    print(f"tools registered        : {len(registry.list_tools())}")
+    print(f"rebuild every turn      : {before:8.3f} ms/turn")
+    print(f"compiled once (cached)  : {after:8.3f} ms/turn")
+    print(f"speedup                 : {before / after if after else float('inf'):8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
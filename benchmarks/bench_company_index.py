@@ -0,0 +1,121 @@
+"""Company lookup cost: linear scan vs. `CompanyIndex`, on synthetic data.
+
+Before: `CompanyHandler` and `PastProjectsSkill` scanned the whole list
+for an exact lowercase name. After: `CompanyIndex` resolves normalized
+names and aliases through a dict, and typos through a trigram index.
+
+    python -m benchmarks.bench_company_index [--companies 100000] [--queries 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import string
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from data.company_index import CompanyIndex
+
+#: Letters weighted roughly by English frequency, so trigram statistics
+#: look like real names rather than uniform noise.
+_LETTERS = "e" * 12 + "t" * 9 + "a" * 8 + "o" * 7 + "i" * 7 + "n" * 7 + "s" * 6 + (
+    "hhhhhhrrrrrrddddllllcccuuummwwffggyyppbbvkjxqz"
+)
+_WORDS = [
+    "", "", "", " Systems", " Labs", " Health", " Energy", " Logistics",
+    " Capital", " Foods", " Motors", " Analytics", " Networks", " Partners",
+]  # fmt: skip
+_SUFFIXES = ["", " Inc", " Corp", " Ltd", " LLC", " Group"]
+
+
+def _stem(rng: random.Random) -> str:
+    return "".join(rng.choice(_LETTERS) for _ in range(rng.randint(4, 9)))
+
+
+def _companies(n: int, rng: random.Random) -> List[Dict[str, Any]]:
+    """Made-up names with the usual industry words and legal suffixes."""
+    seen = set()
+    records = []
+    while len(records) < n:
+        stem = _stem(rng)
+        name = stem.title() + rng.choice(_WORDS) + rng.choice(_SUFFIXES)
+        if name.lower() in seen:
+            continue
+        seen.add(name.lower())
+        record: Dict[str, Any] = {"company_name": name, "project_details": "..."}
+        if rng.random() < 0.1:
+            record["aliases"] = [_stem(rng).upper()]
+        records.append(record)
+    return records
+
+
+def _typo(name: str, rng: random.Random) -> str:
+    i = rng.randrange(1, len(name.split()[0]))
+    return name[:i] + rng.choice(string.ascii_lowercase) + name[i + 1 :]
+
+
+def _linear(records: List[Dict[str, Any]]) -> Callable[[str], Optional[Dict]]:
+    """The pre-index lookup, kept here for comparison."""
+
+    def _find(name: str) -> Optional[Dict[str, Any]]:
+        target = name.strip().lower()
+        return next(
+            (c for c in records if c.get("company_name", "").lower() == target), None
+        )
+
+    return _find
+
+
+def _timings_us(fn: Callable[[str], Any], queries: List[str]) -> List[float]:
+    out = []
+    for q in queries:
+        start = time.perf_counter()
+        fn(q)
+        out.append((time.perf_counter() - start) * 1e6)
+    return out
+
+
+def _row(label: str, samples: List[float]) -> None:
+    samples = sorted(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(f"  {label:<28} p50 {statistics.median(samples):9.1f} us   p99 {p99:9.1f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--companies", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    records = _companies(args.companies, rng)
+    start = time.perf_counter()
+    index = CompanyIndex(records)
+    build_s = time.perf_counter() - start
+
+    picks = [rng.choice(records) for _ in range(args.queries)]
+    exact = [r["company_name"].lower() for r in picks]
+    variant = [r["company_name"].upper() + " Corporation" for r in picks]
+    aliases = [r["aliases"][0] for r in records if "aliases" in r][: args.queries]
+    typos = [_typo(r["company_name"], rng) for r in picks]
+    misses = ["Nonexistent Widget Holdings %d" % i for i in range(args.queries)]
+
+    hits = sum(1 for q, r in zip(typos, picks) if (m := index.lookup(q)) and m.record is r)
+    print(f"{len(records)} companies, index built in {build_s:.2f}s")
+    print(f"fuzzy recall on single-character typos: {hits / len(typos):.1%}\n")
+
+    linear = _linear(records)
+    linear_queries = exact[: max(1, args.queries // 20)]  # it's slow
+    _row("linear scan, exact", _timings_us(linear, linear_queries))
+    _row("index.get, exact", _timings_us(index.get, exact))
+    _row("index.lookup, name variant", _timings_us(index.lookup, variant))
+    _row("index.lookup, alias", _timings_us(index.lookup, aliases))
+    _row("index.lookup, typo (fuzzy)", _timings_us(index.lookup, typos))
+    _row("index.lookup, miss", _timings_us(index.lookup, misses))
+
+
+if __name__ == "__main__":
+    main()
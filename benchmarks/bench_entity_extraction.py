@@ -0,0 +1,75 @@
+"""Local company extraction: hit rate, local cost and LLM latency saved.
+
+Before: every `CompanyHandler` turn spent one LLM round trip on
+`extraction_prompt` before doing anything else. After: `EntityExtractor`
+answers confident cases locally against the knowledge base. This runs a
+templated mix of company questions against synthetic companies and
+reports how many turns skip the LLM and what the local pass costs.
+
+    python -m benchmarks.bench_entity_extraction [--companies 100000] [--llm-ms 900]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import tempfile
+
+from benchmarks.bench_company_index import _companies, _row, _timings_us
+from data.knowledge_base import JSONKnowledgeBase
+from handlers.entity_extractor import EntityExtractor
+
+#: (template, whether the extractor should answer locally).
+_TEMPLATES = [
+    ("Tell me about {name}", True),
+    ("what do we know about {name}?", True),
+    ("Can you look up {name} for me", True),
+    ("switch to {name}", True),
+    ("who is our contact at {name}?", True),
+    ("{name}?", True),
+    ("Tell me about Unlisted Prospect Co", True),
+    ("what about their revenue?", False),
+    ("how big is the company?", False),
+    ("draft a proposal for {name}", False),
+    ("compare {name} and {other}", False),
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--companies", type=int, default=100_000)
+    parser.add_argument("--messages", type=int, default=2_000)
+    parser.add_argument("--llm-ms", type=float, default=900.0,
+                        help="latency of one extraction LLM call")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    records = _companies(args.companies, rng)
+    messages = []
+    for _ in range(args.messages):
+        template, _ = rng.choice(_TEMPLATES)
+        a, b = rng.sample(records, 2)
+        messages.append(template.format(name=a["company_name"], other=b["company_name"]))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "known.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(records, f)
+        extractor = EntityExtractor(JSONKnowledgeBase(path))
+        timings = _timings_us(extractor.match, messages)
+
+    stats = extractor.stats()
+    expected = sum(local for _, local in _TEMPLATES) / len(_TEMPLATES)
+    print(f"{len(records)} companies, {len(messages)} messages")
+    print(f"local hit rate {stats['hit_rate']:.1%} (template mix expects ~{expected:.0%})")
+    _row("EntityExtractor.match", timings)
+    saved = stats["hits"] * args.llm_ms - sum(timings) / 1000
+    print(f"LLM time saved: {saved / 1000:.0f}s over {len(messages)} turns "
+          f"({saved / len(messages):.0f} ms per turn at {args.llm_ms:.0f} ms per call)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Hook-pipeline overhead per invocation: loop-everything vs. compiled.
+
+Before: `HookManager.run` called every registered hook in every phase,
+including inherited no-op `pre` / `post` / `on_error` methods and hooks with
+nothing to do for the tool at hand. After: a per-tool pipeline keeps only
+hooks that override the phase and `applies_to` the spec.
+
+The synthetic hooks each implement one phase; half of them only apply to
+tools tagged ``"crm"``, which the benchmarked tool is not.
+
+    python -m benchmarks.bench_hook_pipeline [--calls 20000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import List
+
+from hooks.base import Hook, HookManager, _Pipeline
+from mcp.registry import ToolRegistry, ToolSpec
+from skills.base import Skill, SkillContext, SkillResult
+
+
+class _NoopSkill(Skill):
+    name = "noop"
+    description = "Does nothing."
+
+    async def invoke(self, arguments, ctx):
+        return SkillResult(success=True, output="ok")
+
+
+class _PreHook(Hook):
+    def __init__(self, crm_only: bool) -> None:
+        self.crm_only = crm_only
+
+    def applies_to(self, spec: ToolSpec) -> bool:
+        return not self.crm_only or "crm" in spec.tags
+
+    async def pre(self, spec, arguments, ctx):
+        if self.applies_to(spec):
+            arguments = dict(arguments)
+        return arguments
+
+
+class _PostHook(_PreHook):
+    pre = Hook.pre  # type: ignore[assignment]
+
+    async def post(self, spec, arguments, ctx, result, duration_ms):
+        if self.applies_to(spec):
+            self.last = result.success
+
+
+class _UncompiledManager(HookManager):
+    """The pre-compilation behaviour: every hook, every phase, every call."""
+
+    def pipeline(self, spec: ToolSpec) -> _Pipeline:
+        return _Pipeline(pre=self._pre, post=self._post, error=self._error)
+
+
+def _hooks(n: int) -> List[Hook]:
+    return [
+        (_PreHook if i % 2 == 0 else _PostHook)(crm_only=(i // 2) % 2 == 1)
+        for i in range(n)
+    ]
+
+
+async def _per_call_us(manager_cls, n_hooks: int, calls: int) -> float:
+    hooks = _hooks(n_hooks)
+    reg = ToolRegistry(hook_manager=manager_cls(pre=hooks, post=hooks, error=hooks))
+    reg.register(_NoopSkill(), tags=["research"])
+    ctx = SkillContext()
+    start = time.perf_counter()
+    for _ in range(calls):
+        await reg.invoke("noop", {}, ctx)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+async def _main(calls: int) -> None:
+    print(f"{'hooks':>6} {'uncompiled us':>14} {'compiled us':>12}")
+    for n in (0, 5, 20):
+        before = await _per_call_us(_UncompiledManager, n, calls)
+        after = await _per_call_us(HookManager, n, calls)
+        print(f"{n:>6} {before:>14.2f} {after:>12.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(_main(args.calls))
+
+
+if __name__ == "__main__":
+    main()
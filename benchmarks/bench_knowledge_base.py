@@ -0,0 +1,93 @@
+"""Knowledge-base backends: memory and lookup latency as the data grows.
+
+`JSONKnowledgeBase` holds every record and trigram posting in memory;
+`SQLiteKnowledgeBase` holds only a per-thread page cache. This builds
+both from the same synthetic companies and reports Python heap use
+(tracemalloc; SQLite's page cache, at most `sqlite_kb.CACHE_KIB` per
+thread, is not included) and lookup / project-search latency.
+
+    python -m benchmarks.bench_knowledge_base [--companies 200000] [--queries 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from benchmarks.bench_company_index import _companies, _row, _timings_us, _typo
+from data import sqlite_kb
+from data.knowledge_base import JSONKnowledgeBase, KnowledgeBase
+
+_TOPICS = [
+    "forecasting", "chatbot", "computer vision", "fraud detection",
+    "recommendation", "data platform", "migration", "analytics dashboard",
+]  # fmt: skip
+
+
+def _with_projects(records: List[Dict[str, Any]], rng: random.Random) -> None:
+    for record in records:
+        record["project_details"] = f"{rng.choice(_TOPICS).title()} project"
+        record["skills_required"] = rng.sample(["Python", "SQL", "NLP", "Azure"], 2)
+
+
+def _open_measured(factory: Callable[[], KnowledgeBase]) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    kb = factory()
+    kb.lookup("warm up")
+    load_s = time.perf_counter() - start
+    memory_mb = tracemalloc.get_traced_memory()[0] / 2**20
+    tracemalloc.stop()
+    return kb, load_s, memory_mb
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--companies", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    records = _companies(args.companies, rng)
+    _with_projects(records, rng)
+    picks = [rng.choice(records) for _ in range(args.queries)]
+    exact = [r["company_name"] for r in picks]
+    typos = [_typo(r["company_name"], rng) for r in picks]
+    searches = [rng.choice(_TOPICS) for _ in range(args.queries)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "known.json")
+        db_path = os.path.join(tmp, "known.db")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(records, f)
+        start = time.perf_counter()
+        sqlite_kb.build(records, db_path)
+        print(f"{len(records)} companies; SQLite build {time.perf_counter() - start:.1f}s, "
+              f"{os.path.getsize(db_path) / 2**20:.0f} MiB on disk\n")
+        del records, picks
+
+        for label, factory in [
+            ("json", lambda: JSONKnowledgeBase(json_path)),
+            ("sqlite", lambda: sqlite_kb.SQLiteKnowledgeBase(db_path)),
+        ]:
+            kb, load_s, memory_mb = _open_measured(factory)
+            print(f"{label}: open {load_s:.2f}s, {memory_mb:.1f} MiB Python heap")
+            _row("lookup, exact", _timings_us(kb.lookup, exact))
+            _row("lookup, typo (fuzzy)", _timings_us(kb.lookup, typos))
+            _row("search_projects", _timings_us(kb.search_projects, searches[:50]))
+            print()
+            kb.close()
+            del kb
+
+
+if __name__ == "__main__":
+    main()
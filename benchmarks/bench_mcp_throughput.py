@@ -0,0 +1,126 @@
+"""MCP `tools/call` throughput on a trivial skill, per transport.
+
+Measures requests/second for an echo tool through the JSON-RPC server:
+
+  * in-process — `MCPServer.handle` with no framing (upper bound);
+  * stream, window 1 — newline-delimited JSON over a local socket (the
+    stdio framing), one request in flight at a time;
+  * stream, window N — the same connection with N requests pipelined;
+  * http — `POST /mcp` through the ASGI app (in-process, no network).
+
+For scale, a turn through `/bot` costs at least one LLM round trip.
+
+    python -m benchmarks.bench_mcp_throughput [--calls 5000] [--window 32]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from mcp.jsonrpc import MCPServer, MCPSession
+from mcp.registry import ToolRegistry
+from mcp.transport import http_router, serve_stream
+from skills.base import Skill, SkillResult
+
+
+class _EchoSkill(Skill):
+    name = "echo"
+    description = "Echo the message back."
+    input_schema = {
+        "type": "object",
+        "properties": {"message": {"type": "string"}},
+        "required": ["message"],
+        "additionalProperties": False,
+    }
+
+    async def invoke(self, arguments, ctx):
+        return SkillResult(success=True, output=arguments["message"])
+
+
+def _request(i: int) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": i,
+        "method": "tools/call",
+        "params": {"name": "echo", "arguments": {"message": f"m{i}"}},
+    }
+
+
+async def _in_process(server: MCPServer, calls: int) -> float:
+    session = MCPSession()
+    start = time.perf_counter()
+    for i in range(calls):
+        await server.handle(_request(i), session)
+    return calls / (time.perf_counter() - start)
+
+
+async def _stream(server: MCPServer, calls: int, window: int) -> float:
+    served = asyncio.get_running_loop().create_future()
+
+    async def _handle(reader, writer):
+        await serve_stream(server, reader, writer, max_inflight=max(window, 1))
+        writer.close()
+        served.set_result(None)
+
+    listener = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    sent = received = 0
+    start = time.perf_counter()
+    while received < calls:
+        while sent < calls and sent - received < window:
+            writer.write(json.dumps(_request(sent)).encode() + b"\n")
+            sent += 1
+        await writer.drain()
+        json.loads(await reader.readline())
+        received += 1
+    elapsed = time.perf_counter() - start
+    writer.close()
+    await served
+    listener.close()
+    await listener.wait_closed()
+    return calls / elapsed
+
+
+async def _http(server: MCPServer, calls: int) -> float:
+    app = FastAPI()
+    app.include_router(http_router(server))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        start = time.perf_counter()
+        for i in range(calls):
+            (await client.post("/mcp", json=_request(i))).raise_for_status()
+        return calls / (time.perf_counter() - start)
+
+
+async def _main(calls: int, window: int) -> None:
+    reg = ToolRegistry()
+    reg.register(_EchoSkill())
+    server = MCPServer(reg)
+    rows = [
+        ("in-process", await _in_process(server, calls)),
+        ("stream, window 1", await _stream(server, calls, 1)),
+        (f"stream, window {window}", await _stream(server, calls, window)),
+        ("http (ASGI)", await _http(server, calls)),
+    ]
+    print(f"{'transport':<20} {'req/s':>10}")
+    for label, rate in rows:
+        print(f"{label:<20} {rate:>10.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=5_000)
+    parser.add_argument("--window", type=int, default=32)
+    args = parser.parse_args()
+    asyncio.run(_main(args.calls, args.window))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Prompt size vs. conversation length: full buffer vs. SummarizingMemory.
+
+The old `ConversationBufferMemory` replayed every message into the prompt;
+`SummarizingMemory` keeps `keep_turns` exchanges verbatim plus a rolling
+summary. The summarizer here is a fake that returns a fixed-size summary,
+so the numbers show the shape of the curve, not a model's exact output.
+
+    python -m benchmarks.bench_memory_prompt_size [--keep-turns 6]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from typing import Dict, Sequence
+
+from langchain_core.chat_history import InMemoryChatMessageHistory
+from langchain_core.messages import BaseMessage
+
+from agent.memory import SummarizingMemory, approx_tokens
+
+_USER = "What do we know about Acme's renewal and who owns the relationship there?"
+_ASSISTANT = (
+    "Acme renewed in 2023 for $120k; Jane Doe owns the account and the next "
+    "review is scheduled for Q3. They asked for a proposal on the data platform."
+)
+
+
+async def _fixed_summary(summary: str, new: Sequence[BaseMessage]) -> str:
+    return "Acme renewal discussed; Jane Doe owns account; proposal requested. " * 3
+
+
+async def _measure(turns: int, keep_turns: int, budget: int) -> Dict[str, int]:
+    store: Dict[str, InMemoryChatMessageHistory] = {}
+    memory = SummarizingMemory(
+        lambda sid: store.setdefault(sid, InMemoryChatMessageHistory()),
+        _fixed_summary,
+        keep_turns=keep_turns,
+        token_budget=budget,
+    )
+    for _ in range(turns):
+        await memory.save_turn("bench", _USER, _ASSISTANT)
+    await memory.wait_for_summaries()
+    bounded = sum(approx_tokens(str(m.content)) for m in await memory.load("bench"))
+    full = sum(approx_tokens(str(m.content)) for m in store["bench"].messages)
+    return {"full": full, "bounded": bounded}
+
+
+async def _main(keep_turns: int, budget: int) -> None:
+    print(f"{'turns':>6} {'full buffer':>12} {'summarizing':>12}   (approx tokens)")
+    for turns in (1, 5, 10, 25, 50, 100, 200):
+        row = await _measure(turns, keep_turns, budget)
+        print(f"{turns:>6} {row['full']:>12} {row['bounded']:>12}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keep-turns", type=int, default=6)
+    parser.add_argument("--token-budget", type=int, default=1500)
+    args = parser.parse_args()
+    asyncio.run(_main(args.keep_turns, args.token_budget))
+
+
+if __name__ == "__main__":
+    main()
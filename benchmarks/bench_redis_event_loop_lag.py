@@ -0,0 +1,119 @@
+"""Event-loop lag under concurrent sessions: sync vs. async chat history.
+
+Simulates `--sessions` concurrent conversations, each appending and reading
+back `--turns` exchanges, while a ticker coroutine measures how late the
+event loop wakes it up. With the old per-call `RedisChatMessageHistory`
+every Redis round trip blocks the loop, so the ticker (i.e. every other
+request on the worker) stalls; `AsyncRedisChatMessageHistory` over the
+shared pool keeps lag near zero.
+
+The sync baseline replays what `RedisChatMessageHistory` does per call (a
+fresh blocking client, LPUSH, LRANGE) with redis-py directly, leaving out
+its extra `INFO cluster` probe, which the fake server does not support, so
+the baseline is, if anything, flattering. Runs against an in-process fake
+Redis served over TCP unless `--redis-url` points at a real server
+(recommended: real network latency makes the gap much larger).
+
+    python -m benchmarks.bench_redis_event_loop_lag [--sessions 200] [--redis-url URL]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from typing import Awaitable, Callable, Dict, List
+
+from langchain_core.messages import AIMessage, HumanMessage, message_to_dict
+
+_TICK_S = 0.005
+
+
+async def _ticker(stop: asyncio.Event, lags: List[float]) -> None:
+    while not stop.is_set():
+        expected = time.perf_counter() + _TICK_S
+        await asyncio.sleep(_TICK_S)
+        lags.append(max(0.0, time.perf_counter() - expected) * 1000)
+
+
+async def _run(session: Callable[[str], Awaitable[None]], sessions: int) -> Dict[str, float]:
+    lags: List[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(stop, lags))
+    start = time.perf_counter()
+    await asyncio.gather(*(session(f"bench-{i}") for i in range(sessions)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+    lags.sort()
+    return {
+        "wall_s": elapsed,
+        "lag_p50_ms": statistics.median(lags) if lags else 0.0,
+        "lag_max_ms": lags[-1] if lags else 0.0,
+    }
+
+
+def _start_fake_server() -> str:
+    from fakeredis import TcpFakeServer
+
+    server = TcpFakeServer(("127.0.0.1", 0))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return f"redis://{host}:{port}/0"
+
+
+async def _main(url: str, sessions: int, turns: int) -> None:
+    import json
+
+    import redis
+
+    import data.chat_history as chat_history
+
+    async def sync_session(session_id: str) -> None:
+        key = f"message_store:sync-{session_id}"
+        for i in range(turns):
+            client = redis.Redis.from_url(url)
+            for message in (HumanMessage(content=f"q{i}"), AIMessage(content=f"a{i}")):
+                client.lpush(key, json.dumps(message_to_dict(message)))
+            client.lrange(key, 0, -1)
+            client.close()
+            await asyncio.sleep(0)
+
+    chat_history.REDIS_URL = url
+
+    async def async_session(session_id: str) -> None:
+        for i in range(turns):
+            history = chat_history.AsyncRedisChatMessageHistory(f"async-{session_id}")
+            await history.aadd_messages(
+                [HumanMessage(content=f"q{i}"), AIMessage(content=f"a{i}")]
+            )
+            await history.aget_messages()
+
+    print(f"{'history':>28} {'wall s':>8} {'lag p50 ms':>11} {'lag max ms':>11}")
+    for label, session in (
+        ("sync client per call", sync_session),
+        ("AsyncRedisChatMessageHistory", async_session),
+    ):
+        row = await _run(session, sessions)
+        print(
+            f"{label:>28} {row['wall_s']:>8.2f} "
+            f"{row['lag_p50_ms']:>11.2f} {row['lag_max_ms']:>11.2f}"
+        )
+    await chat_history.close_redis()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=5)
+    parser.add_argument("--redis-url", default="")
+    args = parser.parse_args()
+    url = args.redis_url or _start_fake_server()
+    asyncio.run(_main(url, args.sessions, args.turns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Worker boot cost: what importing the app pulls in, and how long it takes.
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter,
+so nothing is already in ``sys.modules``. It reports the median wall time
+over `--runs`, the import time per top-level package, and any module
+imported at boot that should only load on first use: the skill
+implementations, the handlers, pptx, azure-storage-blob and botbuilder.
+
+    python -m benchmarks.bench_startup [--module main] [--runs 3] [--top 12]
+                                       [--budget-ms N]
+
+Exits 1 if a deferred module was imported at boot, or if the median wall
+time exceeds `--budget-ms`, so CI can catch startup regressions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from skills.catalog import BUILTIN_SKILLS
+
+#: Modules that must not be imported while the app boots.
+DEFERRED = (
+    "pptx",
+    "azure.storage.blob",
+    "botbuilder",
+    "bot.bot",
+    "handlers",
+    *(target.partition(":")[0] for target, _ in BUILTIN_SKILLS),
+)
+
+
+def _import_once(module: str) -> Tuple[float, str]:
+    env = dict(os.environ)
+    env.setdefault("OPENAI_API_KEY", "bench")  # ChatOpenAI insists on a key
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stderr)
+        raise SystemExit(f"importing {module} failed")
+    return wall_ms, proc.stderr
+
+
+def _parse(report: str) -> List[Tuple[str, int, int]]:
+    """``(module, self_us, cumulative_us)`` rows of an importtime report."""
+    rows = []
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def _is_deferred(module: str) -> bool:
+    return any(module == d or module.startswith(d + ".") for d in DEFERRED)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=12)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    walls = []
+    for _ in range(args.runs):
+        wall_ms, report = _import_once(args.module)
+        walls.append(wall_ms)
+    rows = _parse(report)  # the last run's report; earlier runs warm the disk cache
+
+    per_package: Dict[str, int] = defaultdict(int)
+    for name, self_us, _ in rows:
+        per_package[name.split(".")[0]] += self_us
+    total_ms = sum(per_package.values()) / 1000
+    median_ms = statistics.median(walls)
+
+    print(f"import {args.module}: {len(rows)} modules")
+    print(f"  wall (median of {args.runs}) : {median_ms:8.1f} ms")
+    print(f"  import time (sum of self)  : {total_ms:8.1f} ms")
+    print("\nslowest packages (self time, summed):")
+    ranked = sorted(per_package.items(), key=lambda item: -item[1])
+    for package, us in ranked[: args.top]:
+        print(f"  {package:<28} {us / 1000:8.1f} ms")
+
+    failed = False
+    eager = sorted({name for name, _, _ in rows if _is_deferred(name)})
+    if eager:
+        failed = True
+        print("\nimported at boot but should be deferred:")
+        for name in eager:
+            print(f"  {name}")
+    if args.budget_ms is not None and median_ms > args.budget_ms:
+        failed = True
+        print(f"\nboot took {median_ms:.1f} ms, over the {args.budget_ms:.0f} ms budget")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,24 +4,47 @@ The bot is now a thin transport-layer shell: it extracts the session id
 and user text from the incoming activity and delegates everything else
 to the `SalesAgent`. Intent routing, tool selection, and response
 generation happen inside the agent + registry + hooks stack.
+
+Replies are streamed: the bot shows a typing indicator immediately (and
+refreshes it whenever a tool starts), and on channels that support
+editing sent messages it posts the reply as soon as tokens arrive and
+updates it in place at most once per `_UPDATE_INTERVAL_S`.
+
+Every turn gets a deadline `turn_deadline_s` from arrival, inside the Bot
+Framework's reply window; past it the agent answers with what it has.
 """
 
 from __future__ import annotations
 
+import time
+from typing import Optional
+
 from botbuilder.core import ActivityHandler, MessageFactory, TurnContext
+from botbuilder.schema import Activity, ActivityTypes
 
 from agent import SalesAgent
+from config.settings import TURN_DEADLINE_S
 from observability.logging import get_logger
 
 _LOG = get_logger("essales.bot")
 
+#: Channels that support `update_activity`, i.e. editing a sent message.
+_PROGRESSIVE_CHANNELS = {"msteams", "emulator", "webchat", "directline"}
+
+#: Minimum spacing between in-place updates (Teams rate-limits edits).
+_UPDATE_INTERVAL_S = 1.0
+
+_ERROR_REPLY = "Sorry, something went wrong while processing your message."
+
 
 class MyBot(ActivityHandler):
-    def __init__(self, sales_agent: SalesAgent):
+    def __init__(self, sales_agent: SalesAgent, *, turn_deadline_s: float = TURN_DEADLINE_S):
         super().__init__()
         self._agent = sales_agent
+        self._turn_deadline_s = turn_deadline_s
 
     async def on_message_activity(self, turn_context: TurnContext):
+        deadline = time.monotonic() + self._turn_deadline_s
         user_input = turn_context.activity.text or ""
 
         try:
@@ -29,10 +52,70 @@ class MyBot(ActivityHandler):
         except Exception:
             session_id = turn_context.activity.get("chat_id", "0") or "0"
 
+        await self._send_typing(turn_context)
+        progressive = turn_context.activity.channel_id in _PROGRESSIVE_CHANNELS
+        sent_id: Optional[str] = None
+        reply = ""
         try:
-            reply = await self._agent.run(user_input, session_id)
-        except Exception as exc:  # noqa: BLE001 — log and degrade gracefully
+            buffer = ""
+            last_flush = 0.0  # show the first token immediately
+            async for event in self._agent.astream(
+                user_input, session_id, deadline=deadline
+            ):
+                if event.type == "tool_start":
+                    await self._send_typing(turn_context)
+                elif event.type == "token" and progressive:
+                    buffer += event.text or ""
+                    now = time.monotonic()
+                    if now - last_flush >= _UPDATE_INTERVAL_S:
+                        last_flush = now
+                        try:
+                            sent_id = await self._show(turn_context, sent_id, buffer)
+                        except Exception:  # noqa: BLE001 — channel refused the edit
+                            # Stop updating, but keep `sent_id`: the final
+                            # reply still replaces the partial message.
+                            _LOG.warning("progressive update failed; sending final only")
+                            progressive = False
+                elif event.type == "final":
+                    reply = event.text or ""
+        except Exception:  # noqa: BLE001 — log and degrade gracefully
             _LOG.exception("agent run failed")
-            reply = "Sorry, something went wrong while processing your message."
+            reply = _ERROR_REPLY
+
+        await self._finish(turn_context, sent_id, reply)
+
+    async def _finish(
+        self, turn_context: TurnContext, sent_id: Optional[str], reply: str
+    ) -> None:
+        """Show the final reply in the partial message if there is one.
+
+        The edit is retried once, so a transient failure doesn't leave the
+        partial text on screen next to a second copy of the reply. Only if
+        both attempts fail is the reply sent as a new message; a failed
+        send is not retried, since it may have been delivered.
+        """
+        if sent_id is not None:
+            for attempt in (1, 2):
+                try:
+                    await self._show(turn_context, sent_id, reply)
+                    return
+                except Exception:  # noqa: BLE001 — channel refused the edit
+                    _LOG.warning("final edit failed (attempt %s)", attempt)
+        await self._show(turn_context, None, reply)
+
+    @staticmethod
+    async def _send_typing(turn_context: TurnContext) -> None:
+        await turn_context.send_activity(Activity(type=ActivityTypes.typing))
 
-        await turn_context.send_activity(MessageFactory.text(reply))
+    @staticmethod
+    async def _show(
+        turn_context: TurnContext, activity_id: Optional[str], text: str
+    ) -> Optional[str]:
+        """Send `text` as a new message, or edit the one we already sent."""
+        message = MessageFactory.text(text)
+        if activity_id is None:
+            response = await turn_context.send_activity(message)
+            return getattr(response, "id", None)
+        message.id = activity_id
+        await turn_context.update_activity(message)
+        return activity_id
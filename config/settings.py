@@ -4,5 +4,35 @@ MICROSOFT_APP_ID = os.getenv("MICROSOFT_APP_ID", "")
 MICROSOFT_APP_PASSWORD = os.getenv("MICROSOFT_APP_PASSWORD", "")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 REDIS_URL = os.getenv("REDIS_URL", "")
+AGENT_API_KEYS = os.getenv("AGENT_API_KEYS", "")
+MCP_HTTP_ENABLED = os.getenv("MCP_HTTP_ENABLED", "false").lower() in ("1", "true", "yes")
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+SESSION_STORE_MAX_SESSIONS = int(os.getenv("SESSION_STORE_MAX_SESSIONS", "10000"))
+SESSION_STORE_IDLE_TTL_S = float(os.getenv("SESSION_STORE_IDLE_TTL_S", "3600"))
+SESSION_STORE_MAX_BYTES = int(os.getenv("SESSION_STORE_MAX_BYTES", str(64 * 1024 * 1024)))
+SESSION_STATE_TTL_S = float(os.getenv("SESSION_STATE_TTL_S", "86400"))
+MEMORY_KEEP_TURNS = int(os.getenv("MEMORY_KEEP_TURNS", "6"))
+MEMORY_TOKEN_BUDGET = int(os.getenv("MEMORY_TOKEN_BUDGET", "1500"))
+METRICS_WINDOW_S = float(os.getenv("METRICS_WINDOW_S", "0")) or None
+POST_HOOK_QUEUE_SIZE = int(os.getenv("POST_HOOK_QUEUE_SIZE", "1000"))
+POST_HOOK_QUEUE_POLICY = os.getenv("POST_HOOK_QUEUE_POLICY", "drop")
+RESULT_CACHE_MAX_ENTRIES = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "1024"))
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+CIRCUIT_RESET_TIMEOUT_S = float(os.getenv("CIRCUIT_RESET_TIMEOUT_S", "30"))
+TOOL_MAX_RETRIES = int(os.getenv("TOOL_MAX_RETRIES", "2"))
+TOOL_RETRY_BUDGET_RATIO = float(os.getenv("TOOL_RETRY_BUDGET_RATIO", "0.2"))
+TOOL_TIMEOUT_S = float(os.getenv("TOOL_TIMEOUT_S", "8"))
+TURN_DEADLINE_S = float(os.getenv("TURN_DEADLINE_S", "12"))
+PROPOSAL_MAX_CONCURRENCY = int(os.getenv("PROPOSAL_MAX_CONCURRENCY", "2"))
+PROPOSAL_MAX_QUEUE = int(os.getenv("PROPOSAL_MAX_QUEUE", "4"))
+SKILL_CATALOG_PATH = os.getenv("SKILL_CATALOG_PATH", "") or None
+SKILL_ENTRY_POINTS = os.getenv("SKILL_ENTRY_POINTS", "false").lower() in ("1", "true", "yes")
+KNOWLEDGE_BASE_PATH = os.getenv("KNOWLEDGE_BASE_PATH", "data/known_companies.json")
+LOCAL_EXTRACTION_ENABLED = os.getenv("LOCAL_EXTRACTION_ENABLED", "true").lower() in ("1", "true", "yes")
+LOCAL_EXTRACTION_MIN_CONFIDENCE = float(os.getenv("LOCAL_EXTRACTION_MIN_CONFIDENCE", "0.8"))
+PROFILE_CACHE_TTL_S = float(os.getenv("PROFILE_CACHE_TTL_S", "21600"))
+PROFILE_CACHE_STALE_S = float(os.getenv("PROFILE_CACHE_STALE_S", "3600"))
+PROFILE_CACHE_MAX_ENTRIES = int(os.getenv("PROFILE_CACHE_MAX_ENTRIES", "512"))
+FAST_PATH_ENABLED = os.getenv("FAST_PATH_ENABLED", "true").lower() in ("1", "true", "yes")
 BLOB_CONNECTION_STR = os.getenv("BLOB_CONNECTION_STR", "")
 CONTAINER_NAME="salesbotdrafts"
\ No newline at end of file
@@ -0,0 +1,150 @@
+"""Chat-history storage shared by the agent and the handlers.
+
+Every caller used to construct its own `RedisChatMessageHistory(url=...)`,
+which opens a fresh *synchronous* Redis client per call and blocks the
+event loop on every read and write. Instead:
+
+  * `get_redis()` hands out one process-wide `redis.asyncio.Redis` client
+    backed by a single bounded connection pool. The pool is a blocking one:
+    past `REDIS_MAX_CONNECTIONS`, callers wait for a free connection rather
+    than failing with "Too many connections" under a burst of sessions.
+  * `AsyncRedisChatMessageHistory` implements LangChain's
+    `BaseChatMessageHistory` on top of it, natively async. It uses the same
+    key layout and encoding as `RedisChatMessageHistory`, so existing
+    sessions keep working across the switch.
+  * `get_chat_history(session_id)` is the one factory callers use; it picks
+    Redis when `REDIS_URL` is configured, else the bounded in-process
+    `SessionStore` (see `data/session_store.py`), so history still survives
+    between turns on a single node.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import List, Optional, Sequence, Tuple
+
+from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+
+from config.settings import (
+    REDIS_MAX_CONNECTIONS,
+    REDIS_URL,
+    SESSION_STORE_IDLE_TTL_S,
+    SESSION_STORE_MAX_BYTES,
+    SESSION_STORE_MAX_SESSIONS,
+)
+from data.session_store import SessionStore
+
+_redis = None
+
+#: Process-wide fallback store used when Redis is not configured.
+session_store = SessionStore(
+    max_sessions=SESSION_STORE_MAX_SESSIONS,
+    idle_ttl_s=SESSION_STORE_IDLE_TTL_S,
+    max_bytes=SESSION_STORE_MAX_BYTES,
+)
+
+
+def get_redis():  # type: ignore[no-untyped-def]
+    """Process-wide async Redis client over a shared connection pool.
+
+    Created lazily on first use so importing this module never touches the
+    network (and works without the `redis` package when Redis is disabled).
+    """
+    global _redis
+    if _redis is None:
+        import redis.asyncio as aioredis
+
+        pool = aioredis.BlockingConnectionPool.from_url(
+            REDIS_URL, max_connections=REDIS_MAX_CONNECTIONS
+        )
+        _redis = aioredis.Redis(connection_pool=pool)
+    return _redis
+
+
+async def close_redis() -> None:
+    """Release the shared pool (call on application shutdown)."""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+class AsyncRedisChatMessageHistory(BaseChatMessageHistory):
+    """Non-blocking Redis chat history.
+
+    Only the async half of `BaseChatMessageHistory` is supported: the sync
+    accessors would have to block the event loop, which is exactly what
+    this class exists to avoid, so they raise instead of silently doing it.
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        *,
+        client=None,  # type: ignore[no-untyped-def]
+        key_prefix: str = "message_store:",
+        ttl: Optional[int] = None,
+    ):
+        self.session_id = session_id
+        self.key = key_prefix + session_id
+        self.ttl = ttl
+        self._client = client
+
+    @property
+    def client(self):  # type: ignore[no-untyped-def]
+        return self._client if self._client is not None else get_redis()
+
+    async def aget_messages(self) -> List[BaseMessage]:
+        # Stored newest-first (LPUSH), matching RedisChatMessageHistory.
+        raw = await self.client.lrange(self.key, 0, -1)
+        return messages_from_dict([json.loads(item) for item in reversed(raw)])
+
+    async def aget_messages_from(self, start: int) -> Tuple[int, List[BaseMessage]]:
+        """``(length, messages[start:])`` without reading the older messages."""
+        pipe = self.client.pipeline(transaction=True)
+        pipe.llen(self.key)
+        # Newest-first, so the newest ``length - start`` items are indices
+        # 0 .. -(start + 1).
+        pipe.lrange(self.key, 0, -(start + 1))
+        length, raw = await pipe.execute()
+        return length, messages_from_dict([json.loads(item) for item in reversed(raw)])
+
+    async def aadd_messages(self, messages: Sequence[BaseMessage]) -> None:
+        if not messages:
+            return
+        pipe = self.client.pipeline(transaction=False)
+        for message in messages:
+            pipe.lpush(self.key, json.dumps(message_to_dict(message)))
+        if self.ttl:
+            pipe.expire(self.key, self.ttl)
+        await pipe.execute()
+
+    async def aclear(self) -> None:
+        await self.client.delete(self.key)
+
+    # -- sync API: intentionally unsupported ------------------------------------
+
+    @property
+    def messages(self) -> List[BaseMessage]:  # type: ignore[override]
+        raise TypeError(
+            "AsyncRedisChatMessageHistory is async-only; use aget_messages()."
+        )
+
+    def add_message(self, message: BaseMessage) -> None:
+        raise TypeError(
+            "AsyncRedisChatMessageHistory is async-only; use aadd_messages()."
+        )
+
+    def clear(self) -> None:
+        raise TypeError(
+            "AsyncRedisChatMessageHistory is async-only; use aclear()."
+        )
+
+
+def get_chat_history(session_id: str) -> BaseChatMessageHistory:
+    """Chat history for `session_id`: shared async Redis pool when configured,
+    else the in-process `session_store`."""
+    if REDIS_URL:
+        return AsyncRedisChatMessageHistory(session_id)
+    return session_store.history(session_id)
@@ -0,0 +1,251 @@
+"""In-memory index over the known-companies knowledge base.
+
+`CompanyHandler` and `PastProjectsSkill` used to find a company by scanning
+the whole list for an exact lowercase match. That costs O(n) per lookup,
+and "Acme Corp" missed "Acme Corporation". `CompanyIndex` answers in three
+tiers:
+
+  * **exact**: a dict keyed by the normalized name. Normalization folds
+    case, accents, punctuation and ``&``, and drops legal suffixes
+    ("Inc", "Corp", "Ltd", ...), so "ACME Corp." and "Acme Corporation"
+    share a key. The lookup is O(1).
+  * **alias**: the same dict also holds each record's ``aliases`` and any
+    extra aliases passed in ("Alphabet" -> Google).
+  * **fuzzy**: a trigram inverted index scored by Jaccard similarity, for
+    typos and partial names ("Gogle"). Candidates come only from the
+    query's rarer trigrams. Very common ones ("ems" from every
+    "... Systems") are skipped, so a lookup in a 100k-name index doesn't
+    turn back into a scan.
+
+The index is immutable once built. `data/knowledge_base.py` serves it
+(and a SQLite alternative for large datasets) to the handlers and skills.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from observability.logging import get_logger
+from utils.loader import load_json
+
+_LOG = get_logger("essales.company_index")
+
+#: Trailing words that don't distinguish one company from another.
+LEGAL_SUFFIXES = frozenset(
+    "ag bv co company corp corporation gmbh inc incorporated limited llc llp "
+    "lp ltd nv plc pty sa sarl srl".split()
+)
+
+#: Trigrams in more than this share of the keys (but at least `MIN_STOP_DF`
+#: keys) are too common to generate fuzzy candidates from.
+STOP_GRAM_RATIO = 0.005
+MIN_STOP_DF = 50
+
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_company(name: str) -> str:
+    """Canonical lookup key: "Acme Corp." and "acme  corporation" -> "acme"."""
+    text = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode()
+    words = _NON_WORD.sub(" ", text.lower().replace("&", " and ")).split()
+    while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def trigrams(key: str) -> FrozenSet[str]:
+    """Padded character trigrams of a normalized key."""
+    padded = f"  {key} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+@dataclass(frozen=True)
+class CompanyMatch:
+    """A lookup hit. `how` is ``"exact"``, ``"alias"`` or ``"fuzzy"``."""
+
+    record: Dict[str, Any]
+    matched: str
+    how: str
+    score: float = 1.0
+
+
+class CompanyIndex:
+    """Exact, alias and trigram lookup over company records.
+
+    Args:
+        records: dicts with at least ``company_name``; an optional
+            ``aliases`` list adds alternative names.
+        aliases: extra ``alias -> company_name`` pairs.
+        min_similarity: lowest trigram Jaccard score a fuzzy hit may have.
+    """
+
+    def __init__(
+        self,
+        records: Iterable[Dict[str, Any]],
+        *,
+        aliases: Optional[Mapping[str, str]] = None,
+        min_similarity: float = 0.5,
+    ):
+        self.min_similarity = min_similarity
+        self._records: List[Dict[str, Any]] = []
+        # One entry per distinct key (name or alias) -> record position.
+        self._keys: Dict[str, int] = {}
+        self._key_names: List[str] = []
+        self._key_records: List[int] = []
+        self._key_is_alias: List[bool] = []
+        self._key_grams: List[FrozenSet[str]] = []
+        self._postings: Dict[str, List[int]] = {}
+
+        by_name: Dict[str, int] = {}
+        pending_aliases: List[Tuple[str, int]] = []
+        for record in records:
+            name = record.get("company_name")
+            if not name:
+                continue
+            pos = len(self._records)
+            self._records.append(record)
+            by_name.setdefault(normalize_company(name), pos)
+            self._add_key(name, pos, alias=False)
+            pending_aliases.extend((alias, pos) for alias in record.get("aliases", ()))
+        for alias, target in (aliases or {}).items():
+            pos = by_name.get(normalize_company(target))
+            if pos is None:
+                _LOG.warning("alias %r points at unknown company %r", alias, target)
+                continue
+            pending_aliases.append((alias, pos))
+        # Aliases after every name, so an alias never shadows a real company.
+        for alias, pos in pending_aliases:
+            self._add_key(alias, pos, alias=True)
+        self._stop_df = max(
+            MIN_STOP_DF, int(len(self._key_names) * STOP_GRAM_RATIO)
+        )
+
+    def _add_key(self, name: str, pos: int, *, alias: bool) -> None:
+        key = normalize_company(name)
+        if not key or key in self._keys:
+            return
+        key_id = len(self._key_names)
+        self._keys[key] = key_id
+        self._key_names.append(name)
+        self._key_records.append(pos)
+        self._key_is_alias.append(alias)
+        grams = trigrams(key)
+        self._key_grams.append(grams)
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(key_id)
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs: Any) -> "CompanyIndex":
+        return cls(load_json(path), **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def records(self) -> Sequence[Dict[str, Any]]:
+        return self._records
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """The record whose name or alias normalizes like `name`, else `None`."""
+        key_id = self._keys.get(normalize_company(name))
+        return None if key_id is None else self._records[self._key_records[key_id]]
+
+    def lookup(self, name: str, *, fuzzy: bool = True) -> Optional[CompanyMatch]:
+        """Exact or alias match if there is one, else the best fuzzy match."""
+        key = normalize_company(name)
+        key_id = self._keys.get(key)
+        if key_id is not None:
+            return self._match(key_id, 1.0)
+        if not fuzzy:
+            return None
+        matches = self._fuzzy(key, limit=1)
+        return matches[0] if matches else None
+
+    def search(self, name: str, limit: int = 5) -> List[CompanyMatch]:
+        """Up to `limit` matches, best first (an exact match scores 1.0)."""
+        key = normalize_company(name)
+        return self._fuzzy(key, limit)
+
+    def _match(self, key_id: int, score: float) -> CompanyMatch:
+        if score < 1.0:
+            how = "fuzzy"
+        else:
+            how = "alias" if self._key_is_alias[key_id] else "exact"
+        return CompanyMatch(
+            record=self._records[self._key_records[key_id]],
+            matched=self._key_names[key_id],
+            how=how,
+            score=round(score, 4),
+        )
+
+    def _fuzzy(self, key: str, limit: int) -> List[CompanyMatch]:
+        if not key:
+            return []
+        query = trigrams(key)
+        threshold = self.min_similarity
+        # Jaccard >= t needs at least ceil(t * |q|) shared trigrams. Postings
+        # of stop grams (in over `_stop_df` keys: "  s", "ems", ...) are too
+        # long to walk; assume a candidate shares all of them, and require
+        # the rest of the shared trigrams from the rarer grams.
+        need = max(1, math.ceil(threshold * len(query)))
+        rare: List[List[int]] = []
+        stop = 0
+        for gram in query:
+            postings = self._postings.get(gram)
+            if postings is None:
+                continue
+            if len(postings) > self._stop_df:
+                stop += 1
+            else:
+                rare.append(postings)
+        min_rare = max(1, need - stop)
+        if len(rare) < min_rare:
+            return []
+        counts: Counter = Counter()
+        for postings in rare:
+            counts.update(postings)
+
+        q = len(query)
+        scored: Dict[int, float] = {}
+        best_per_record: Dict[int, int] = {}
+        floor = threshold
+        # Best first by rare-gram count. A candidate shares at most
+        # `count + stop` trigrams, so it scores at most (count + stop) / |q|;
+        # once that can't reach the current top `limit`, nothing later can.
+        for key_id, count in counts.most_common():
+            if count < min_rare or (count + stop) / q < floor:
+                break
+            grams = self._key_grams[key_id]
+            if len(grams) * threshold > q:  # too long to reach the threshold
+                continue
+            shared = len(query & grams)
+            score = shared / (q + len(grams) - shared)
+            if score < threshold:
+                continue
+            scored[key_id] = score
+            # One match per record: its best-scoring name or alias.
+            pos = self._key_records[key_id]
+            current = best_per_record.get(pos)
+            if current is None or score > scored[current]:
+                best_per_record[pos] = key_id
+                if len(best_per_record) >= limit:
+                    top = sorted((scored[k] for k in best_per_record.values()))
+                    floor = max(threshold, top[-limit])
+
+        ranked = sorted(best_per_record.values(), key=lambda k: -scored[k])
+        return [self._match(k, scored[k]) for k in ranked[:limit]]
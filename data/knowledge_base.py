@@ -0,0 +1,209 @@
+"""Known-companies knowledge base: one interface, pluggable storage.
+
+`CompanyHandler`, `PastProjectsSkill` and `SearchProjectsSkill` read
+company data through a `KnowledgeBase`. `get_knowledge_base(path)` picks
+the backend from the file extension and shares one instance per path:
+
+  * ``.json``: `JSONKnowledgeBase` keeps the file in memory as a
+    `CompanyIndex`. It is fine for the small curated list, and its memory
+    grows with the data.
+  * ``.db`` / ``.sqlite``: `SQLiteKnowledgeBase` (`data/sqlite_kb.py`)
+    queries an indexed SQLite file with FTS5. Memory stays flat however
+    many rows it holds. Build one from the JSON with
+    ``python -m data.sqlite_kb build``.
+
+Both backends pick up edits without a restart. They check the file's
+mtime at most every `check_interval_s`, and a changed file is reloaded
+off the request path. Requests keep using the previous data until the
+new data is ready.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config.settings import KNOWLEDGE_BASE_PATH
+from data.company_index import CompanyIndex, CompanyMatch
+from observability.logging import get_logger
+
+_LOG = get_logger("essales.knowledge_base")
+
+_WORD = re.compile(r"\w+")
+
+#: Identity of a file version: (mtime_ns, size, inode).
+FileStamp = Tuple[int, int, int]
+
+
+def file_stamp(path: str) -> Optional[FileStamp]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+class KnowledgeBase(ABC):
+    """Read-only company lookups shared by the handlers and skills."""
+
+    @abstractmethod
+    def lookup(self, name: str, *, fuzzy: bool = True) -> Optional[CompanyMatch]:
+        """Exact, alias or (with `fuzzy`) close-spelling match for a name."""
+
+    @abstractmethod
+    def search_projects(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """Companies whose past projects best match `query`, best first.
+
+        Each result is the company record plus a ``score``.
+        """
+
+    @abstractmethod
+    def count(self) -> int:
+        """Number of companies."""
+
+    def close(self) -> None:
+        """Release files and connections."""
+
+
+class FileWatcher:
+    """Throttled change detection for a file, with a single reload in flight.
+
+    `poll()` is cheap enough to call on every request: it stats the file at
+    most every `interval_s`. When the file has changed, it starts `reload`
+    on a daemon thread, unless a reload is already running. A failed
+    reload is logged and its stamp recorded, so it is retried only once
+    the file changes again, not on every poll.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        reload: Callable[[], None],
+        *,
+        interval_s: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.path = path
+        self.interval_s = interval_s
+        self._reload = reload
+        self._clock = clock
+        self._stamp = file_stamp(path)
+        self._next_check = clock() + interval_s
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def poll(self) -> None:
+        now = self._clock()
+        if now < self._next_check:
+            return
+        self._next_check = now + self.interval_s
+        stamp = file_stamp(self.path)
+        if stamp is None or stamp == self._stamp:
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, args=(stamp,), name="kb-reload", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self, stamp: FileStamp) -> None:
+        start = time.perf_counter()
+        # Recorded either way: a broken file stays broken until it changes.
+        self._stamp = stamp
+        try:
+            self._reload()
+        except Exception:  # noqa: BLE001 — keep serving the old data
+            _LOG.exception("knowledge base reload failed: %s", self.path)
+            return
+        _LOG.info(
+            '{"event":"knowledge_base_reloaded","path":"%s","ms":%.1f}',
+            self.path,
+            (time.perf_counter() - start) * 1000,
+        )
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait for an in-flight reload (tests, shutdown)."""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+
+class JSONKnowledgeBase(KnowledgeBase):
+    """The whole JSON file as an in-memory `CompanyIndex`."""
+
+    def __init__(self, path: str, *, check_interval_s: float = 2.0):
+        self.path = path
+        self._index = CompanyIndex.from_file(path)
+        self.watcher = FileWatcher(path, self._rebuild, interval_s=check_interval_s)
+
+    def _rebuild(self) -> None:
+        self._index = CompanyIndex.from_file(self.path)  # one atomic swap
+
+    def lookup(self, name: str, *, fuzzy: bool = True) -> Optional[CompanyMatch]:
+        self.watcher.poll()
+        return self._index.lookup(name, fuzzy=fuzzy)
+
+    def search_projects(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        self.watcher.poll()
+        terms = {t.lower() for t in _WORD.findall(query)}
+        if not terms:
+            return []
+        scored = []
+        for record in self._index.records:
+            text = " ".join(
+                [
+                    record.get("project_details", ""),
+                    " ".join(record.get("skills_required", [])),
+                    " ".join(record.get("resources_used", [])),
+                ]
+            ).lower()
+            words = set(_WORD.findall(text))
+            score = len(terms & words)
+            if score:
+                scored.append((score, record))
+        scored.sort(key=lambda item: -item[0])
+        return [{**record, "score": float(score)} for score, record in scored[:limit]]
+
+    def count(self) -> int:
+        return len(self._index)
+
+
+def open_knowledge_base(path: str, **kwargs: Any) -> KnowledgeBase:
+    """A backend for `path`, chosen by its extension."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".json":
+        return JSONKnowledgeBase(path, **kwargs)
+    if ext in (".db", ".sqlite", ".sqlite3"):
+        from data.sqlite_kb import SQLiteKnowledgeBase
+
+        return SQLiteKnowledgeBase(path, **kwargs)
+    raise ValueError(f"No knowledge base backend for {path!r}")
+
+
+_SHARED: Dict[str, KnowledgeBase] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def get_knowledge_base(path: Optional[str] = None) -> KnowledgeBase:
+    """The shared knowledge base for `path` (default `KNOWLEDGE_BASE_PATH`)."""
+    path = path or KNOWLEDGE_BASE_PATH
+    kb = _SHARED.get(path)
+    if kb is None:
+        with _SHARED_LOCK:
+            kb = _SHARED.get(path)
+            if kb is None:
+                kb = _SHARED[path] = open_knowledge_base(path)
+                _LOG.info(
+                    '{"event":"knowledge_base_opened","path":"%s","backend":"%s",'
+                    '"companies":%d}',
+                    path,
+                    type(kb).__name__,
+                    kb.count(),
+                )
+    return kb
@@ -0,0 +1,270 @@
+"""Company profiles generated by the LLM, cached across sessions and workers.
+
+`CompanyHandler` asks `profile_chain` for a profile whenever someone asks
+about a company that isn't in the knowledge base. The answer doesn't
+depend on who asked, so `ProfileCache` keeps it, keyed by
+`normalize_company(name)`. "Initech", "initech inc." and "INITECH" then
+share one entry.
+
+Tiers, checked in order:
+
+  1. an in-process LRU (`utils.cache.TTLCache`);
+  2. optionally Redis, shared by every worker. A Redis hit also warms the
+     local tier. As with `ResultCacheHook`, Redis is best-effort: an
+     error is logged and treated as a miss.
+
+An entry is fresh for `ttl_s`. For `stale_s` after that it is still
+served, and a background task regenerates it (stale-while-revalidate),
+so a user never waits on the LLM for an expired profile. After
+``ttl_s + stale_s`` it is gone.
+
+Concurrent misses for one company share a single LLM call. Within a
+worker they await the same future. Across workers, a short Redis lock
+lets one worker generate while the others poll for its result, up to
+`lock_wait_s`. Background refreshes take the same lock, so one worker
+refreshes and the rest keep serving the stale copy.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from data.company_index import normalize_company
+from utils.cache import MISSING, TTLCache
+
+_LOG = logging.getLogger("essales.profile_cache")
+
+Fetch = Callable[[str], Awaitable[str]]
+
+
+@dataclass(frozen=True)
+class _Entry:
+    profile: str
+    fresh_until: float  # wall-clock, so every worker agrees
+
+
+class ProfileCache:
+    """Two-tier, single-flight, stale-while-revalidate cache of profiles.
+
+    Args:
+        ttl_s: how long a profile is served without regenerating it.
+        stale_s: how long after that it is still served while a
+            background refresh runs.
+        max_entries: size of the in-process LRU tier.
+        redis: optional async Redis client for the shared tier.
+        key_prefix: namespace for Redis keys.
+        lock_wait_s: how long a worker waits for another worker's
+            in-flight generation before making its own call.
+        metrics: optional `MetricsHook`-like sink for counters.
+        clock: wall-clock time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_s: float = 6 * 3600,
+        stale_s: float = 3600,
+        max_entries: int = 512,
+        redis: Optional[Any] = None,
+        key_prefix: str = "essales:profile:",
+        lock_wait_s: float = 20.0,
+        metrics: Optional[Any] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.ttl_s = ttl_s
+        self.stale_s = stale_s
+        self._local: TTLCache[_Entry] = TTLCache(max_entries, clock=clock)
+        self._redis = redis
+        self._prefix = key_prefix
+        self._lock_wait_s = lock_wait_s
+        self._metrics = metrics
+        self._clock = clock
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._refreshing: Set[asyncio.Task] = set()
+        self._stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "collapsed": 0,
+            "refreshes": 0,
+            "llm_calls": 0,
+        }
+
+    async def get_or_fetch(self, company_name: str, fetch: Fetch) -> str:
+        """The cached profile for `company_name`, generating it with `fetch` if needed.
+
+        `fetch` receives `company_name` and returns the profile text. Its
+        exceptions reach every caller waiting on that generation; nothing
+        is cached for them.
+        """
+        key = normalize_company(company_name) or company_name.strip().lower()
+        entry = await self._lookup(key)
+        if entry is not None:
+            if entry.fresh_until > self._clock():
+                self._count("hits")
+            else:
+                self._count("stale_hits")
+                self._refresh_in_background(key, company_name, fetch)
+            return entry.profile
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self._count("collapsed")
+            return (await asyncio.shield(pending)).profile
+        self._count("misses")
+        # Shielded: a cancelled request mustn't cancel the call others share.
+        return (await asyncio.shield(self._single_flight(key, company_name, fetch))).profile
+
+    async def invalidate(self, company_name: str) -> None:
+        """Drop a profile from both tiers (e.g. after a bad generation)."""
+        key = normalize_company(company_name) or company_name.strip().lower()
+        self._local.delete(key)
+        if self._redis is not None:
+            try:
+                await self._redis.delete(self._prefix + key)
+            except Exception:  # noqa: BLE001
+                _LOG.warning("profile cache: redis delete failed", exc_info=True)
+
+    def stats(self) -> Dict[str, Any]:
+        served = self._stats["hits"] + self._stats["stale_hits"] + self._stats["collapsed"]
+        total = served + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": round(served / total, 4) if total else 0.0,
+            "entries": len(self._local),
+        }
+
+    async def wait_for_refreshes(self) -> None:
+        """Wait for background refreshes to finish (tests, shutdown)."""
+        if self._refreshing:
+            await asyncio.gather(*self._refreshing, return_exceptions=True)
+
+    # -- internals -----------------------------------------------------
+
+    async def _lookup(self, key: str) -> Optional[_Entry]:
+        entry = self._local.get(key)
+        if entry is not MISSING:
+            return entry
+        if self._redis is None:
+            return None
+        entry = await self._redis_get(key)
+        if entry is not None:
+            self._local.set(key, entry, self._remaining(entry))
+        return entry
+
+    def _single_flight(self, key: str, company_name: str, fetch: Fetch) -> asyncio.Future:
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._generate(key, company_name, fetch))
+            self._inflight[key] = future
+            future.add_done_callback(lambda f: self._settled(key, f))
+        return future
+
+    def _settled(self, key: str, future: asyncio.Future) -> None:
+        self._inflight.pop(key, None)
+        if not future.cancelled():
+            future.exception()  # retrieved here in case every waiter went away
+
+    async def _generate(self, key: str, company_name: str, fetch: Fetch) -> _Entry:
+        locked = await self._acquire(key)
+        if not locked:
+            # Another worker is generating this profile; take its result.
+            entry = await self._wait_for_peer(key)
+            if entry is not None:
+                return entry
+        try:
+            self._count("llm_calls")
+            profile = await fetch(company_name)
+        finally:
+            if locked:
+                await self._release(key)
+        entry = _Entry(profile, self._clock() + self.ttl_s)
+        self._local.set(key, entry, self.ttl_s + self.stale_s)
+        if self._redis is not None:
+            await self._redis_set(key, entry)
+        return entry
+
+    def _refresh_in_background(self, key: str, company_name: str, fetch: Fetch) -> None:
+        if key in self._inflight:
+            return
+        self._count("refreshes")
+        task = asyncio.ensure_future(self._refresh(key, company_name, fetch))
+        self._refreshing.add(task)
+        task.add_done_callback(self._refreshing.discard)
+
+    async def _refresh(self, key: str, company_name: str, fetch: Fetch) -> None:
+        try:
+            await self._single_flight(key, company_name, fetch)
+        except Exception:  # noqa: BLE001 — keep serving the stale profile
+            _LOG.warning("profile cache: refresh failed for %s", key, exc_info=True)
+
+    def _remaining(self, entry: _Entry) -> float:
+        return max(0.0, entry.fresh_until + self.stale_s - self._clock())
+
+    def _count(self, outcome: str) -> None:
+        self._stats[outcome] += 1
+        if self._metrics is not None:
+            self._metrics.incr(f"profile_cache_{outcome}")
+
+    # -- redis ---------------------------------------------------------
+
+    async def _acquire(self, key: str) -> bool:
+        if self._redis is None:
+            return True
+        try:
+            return bool(
+                await self._redis.set(
+                    f"{self._prefix}lock:{key}",
+                    "1",
+                    nx=True,
+                    ex=max(1, int(self._lock_wait_s)),
+                )
+            )
+        except Exception:  # noqa: BLE001
+            _LOG.warning("profile cache: redis lock failed", exc_info=True)
+            return True
+
+    async def _release(self, key: str) -> None:
+        try:
+            await self._redis.delete(f"{self._prefix}lock:{key}")  # type: ignore[union-attr]
+        except Exception:  # noqa: BLE001
+            _LOG.warning("profile cache: redis unlock failed", exc_info=True)
+
+    async def _wait_for_peer(self, key: str) -> Optional[_Entry]:
+        deadline = time.monotonic() + self._lock_wait_s
+        delay = 0.05
+        while time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            entry = await self._redis_get(key)
+            if entry is not None and entry.fresh_until > self._clock():
+                self._local.set(key, entry, self._remaining(entry))
+                return entry
+            delay = min(delay * 2, 1.0)
+        return None
+
+    async def _redis_get(self, key: str) -> Optional[_Entry]:
+        try:
+            raw = await self._redis.get(self._prefix + key)  # type: ignore[union-attr]
+        except Exception:  # noqa: BLE001 — the cache must never fail a call
+            _LOG.warning("profile cache: redis get failed", exc_info=True)
+            return None
+        if raw is None:
+            return None
+        try:
+            data = json.loads(raw)
+            return _Entry(data["profile"], float(data["fresh_until"]))
+        except (TypeError, ValueError, KeyError):
+            return None
+
+    async def _redis_set(self, key: str, entry: _Entry) -> None:
+        payload = json.dumps({"profile": entry.profile, "fresh_until": entry.fresh_until})
+        ttl = max(1, int(self._remaining(entry)))
+        try:
+            await self._redis.set(self._prefix + key, payload, ex=ttl)
+        except Exception:  # noqa: BLE001
+            _LOG.warning("profile cache: redis set failed", exc_info=True)
@@ -0,0 +1,154 @@
+"""Structured per-session state: named slots such as the current company.
+
+`CompanyHandler` used to keep the current company as a message in the
+chat history, and on a context switch it cleared the whole history.
+Follow-up questions then had to rebuild the context from that history.
+Slots keep such facts as plain values, read and written in O(1) and
+independent of the transcript:
+
+  * `InMemorySessionState`: a process-wide map of session id -> slots.
+    It is bounded by LRU and an idle TTL (`utils.cache.TTLCache`), like
+    `SessionStore`.
+  * `RedisSessionState`: one Redis hash per session (``session_state:<id>``),
+    shared by every worker, and expired after `ttl_s` without writes.
+
+`get_session_state()` picks Redis when `REDIS_URL` is configured, as
+`get_chat_history` does.
+"""
+
+from __future__ import annotations
+
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from config.settings import REDIS_URL, SESSION_STATE_TTL_S, SESSION_STORE_MAX_SESSIONS
+from utils.cache import MISSING, TTLCache
+
+#: Slot names shared by the handlers and prompts.
+CURRENT_COMPANY = "current_company"
+COMPANY_PROFILE = "company_profile"
+
+Slots = Dict[str, str]
+
+
+class SessionState(ABC):
+    """Async slot store keyed by session id. Values are strings."""
+
+    @abstractmethod
+    async def get(self, session_id: str) -> Slots:
+        """Every slot of a session ({} if it has none)."""
+
+    async def get_slot(self, session_id: str, name: str) -> Optional[str]:
+        return (await self.get(session_id)).get(name)
+
+    @abstractmethod
+    async def update(self, session_id: str, **slots: Optional[str]) -> None:
+        """Set the given slots; a value of `None` removes that slot."""
+
+    @abstractmethod
+    async def clear(self, session_id: str) -> None:
+        """Remove every slot of a session."""
+
+
+class InMemorySessionState(SessionState):
+    """Slots kept in process, for single-node deployments without Redis.
+
+    Args:
+        max_sessions: most sessions kept at once (least recently used out).
+        ttl_s: seconds without a write before a session's slots expire.
+        clock: monotonic time source (injectable for tests).
+    """
+
+    def __init__(self, *, max_sessions: int = 10_000, ttl_s: float = 86_400, **kwargs: Any):
+        self._sessions: TTLCache[Slots] = TTLCache(max_sessions, ttl_s, **kwargs)
+        # TTLCache reorders on read; handlers may also run in worker threads.
+        self._lock = threading.Lock()
+
+    async def get(self, session_id: str) -> Slots:
+        with self._lock:
+            slots = self._sessions.get(session_id)
+        return {} if slots is MISSING else dict(slots)
+
+    async def update(self, session_id: str, **slots: Optional[str]) -> None:
+        with self._lock:
+            current = self._sessions.get(session_id)
+            merged = {} if current is MISSING else dict(current)
+            for name, value in slots.items():
+                if value is None:
+                    merged.pop(name, None)
+                else:
+                    merged[name] = value
+            self._sessions.set(session_id, merged)
+
+    async def clear(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.delete(session_id)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+class RedisSessionState(SessionState):
+    """Slots as a Redis hash per session, shared by every worker.
+
+    Args:
+        client: async Redis client (default: `data.chat_history.get_redis()`).
+        key_prefix: namespace for the hashes.
+        ttl_s: seconds without a write before a session's hash expires.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: Optional[Any] = None,
+        key_prefix: str = "session_state:",
+        ttl_s: float = 86_400,
+    ):
+        self._client = client
+        self._prefix = key_prefix
+        self.ttl_s = ttl_s
+
+    @property
+    def client(self):  # type: ignore[no-untyped-def]
+        if self._client is None:
+            from data.chat_history import get_redis
+
+            return get_redis()
+        return self._client
+
+    async def get(self, session_id: str) -> Slots:
+        raw = await self.client.hgetall(self._prefix + session_id)
+        return {_text(k): _text(v) for k, v in raw.items()}
+
+    async def update(self, session_id: str, **slots: Optional[str]) -> None:
+        key = self._prefix + session_id
+        values = {k: v for k, v in slots.items() if v is not None}
+        removed = [k for k, v in slots.items() if v is None]
+        pipe = self.client.pipeline(transaction=True)
+        if values:
+            pipe.hset(key, mapping=values)
+        if removed:
+            pipe.hdel(key, *removed)
+        pipe.expire(key, max(1, int(self.ttl_s)))
+        await pipe.execute()
+
+    async def clear(self, session_id: str) -> None:
+        await self.client.delete(self._prefix + session_id)
+
+
+def _text(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+#: Process-wide store used when Redis is not configured.
+session_state = InMemorySessionState(
+    max_sessions=SESSION_STORE_MAX_SESSIONS, ttl_s=SESSION_STATE_TTL_S
+)
+
+
+def get_session_state() -> SessionState:
+    """Redis-backed slots when `REDIS_URL` is set, else the in-process map."""
+    if REDIS_URL:
+        return RedisSessionState(ttl_s=SESSION_STATE_TTL_S)
+    return session_state
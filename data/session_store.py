@@ -0,0 +1,230 @@
+"""Bounded in-process chat-history store for deployments without Redis.
+
+Without Redis, every turn used to get a brand-new empty
+`InMemoryChatMessageHistory`, so nothing survived from one message to the
+next. `SessionStore` keeps one message list per session id, and bounds them
+three ways so a long-running worker cannot grow without limit:
+
+  * **idle TTL** — sessions untouched for `idle_ttl_s` are dropped;
+  * **LRU** — at most `max_sessions` sessions, least recently used first out;
+  * **bytes** — the approximate size of all stored messages stays under
+    `max_bytes`, again evicting least recently used sessions first. If the
+    session just written is the only one left and still over the cap, its
+    oldest messages are trimmed (the latest one is always kept).
+
+A session counts the messages trimmed from its front, and `get_from`
+takes and reports absolute positions, so `SummarizingMemory`'s "covered"
+offsets stay valid after a trim.
+
+Every operation is a short synchronous critical section under one
+`threading.Lock`, which makes it safe both for coroutines on the event loop
+and for the thread-pool fallbacks LangChain uses for sync callers.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.messages import BaseMessage
+
+from observability.logging import get_logger
+
+_LOG = get_logger("essales.session_store")
+
+#: Flat per-message overhead added to the content size (type, ids, list slot).
+_MESSAGE_OVERHEAD_BYTES = 64
+
+
+def message_size(message: BaseMessage) -> int:
+    """Approximate in-memory footprint of one message, in bytes."""
+    return len(str(message.content).encode("utf-8")) + _MESSAGE_OVERHEAD_BYTES
+
+
+@dataclass
+class _Session:
+    messages: List[BaseMessage] = field(default_factory=list)
+    size: int = 0
+    last_access: float = 0.0
+    trimmed: int = 0  # messages dropped from the front by the byte cap
+
+
+class SessionStore:
+    """LRU + idle-TTL + byte-capped map of session id -> messages.
+
+    Args:
+        max_sessions: most sessions kept at once.
+        idle_ttl_s: seconds a session may go untouched before it expires.
+        max_bytes: cap on the summed `message_size` of all sessions.
+        clock: monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_sessions: int = 10_000,
+        idle_ttl_s: float = 3600.0,
+        max_bytes: int = 64 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_sessions = max_sessions
+        self.idle_ttl_s = idle_ttl_s
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._sessions: "OrderedDict[str, _Session]" = OrderedDict()
+        self._bytes = 0
+        self._evictions: Dict[str, int] = {"idle": 0, "lru": 0, "bytes": 0}
+        self._trimmed_messages = 0
+        self._lock = threading.Lock()
+
+    def history(self, session_id: str) -> "SessionChatMessageHistory":
+        """A `BaseChatMessageHistory` view of one session."""
+        return SessionChatMessageHistory(self, session_id)
+
+    def get(self, session_id: str) -> List[BaseMessage]:
+        with self._lock:
+            self._expire_idle()
+            session = self._touch(session_id, create=False)
+            return list(session.messages) if session else []
+
+    def get_from(self, session_id: str, start: int) -> Tuple[int, List[BaseMessage]]:
+        """``(length, messages[start:])``, copying only the tail.
+
+        Positions count every message ever appended, including any the byte
+        cap trimmed, so they don't shift when old messages are dropped.
+        """
+        with self._lock:
+            self._expire_idle()
+            session = self._touch(session_id, create=False)
+            if session is None:
+                return 0, []
+            offset = max(0, start - session.trimmed)
+            return session.trimmed + len(session.messages), session.messages[offset:]
+
+    def append(self, session_id: str, messages: Sequence[BaseMessage]) -> None:
+        if not messages:
+            return
+        with self._lock:
+            self._expire_idle()
+            session = self._touch(session_id, create=True)
+            added = sum(message_size(m) for m in messages)
+            session.messages.extend(messages)
+            session.size += added
+            self._bytes += added
+            self._enforce_caps()
+
+    def clear(self, session_id: str) -> None:
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+            if session is not None:
+                self._bytes -= session.size
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "bytes": self._bytes,
+                **{f"evicted_{reason}": n for reason, n in self._evictions.items()},
+                "trimmed_messages": self._trimmed_messages,
+            }
+
+    # -- internals (caller holds the lock) ---------------------------------------
+
+    def _touch(self, session_id: str, *, create: bool):  # type: ignore[no-untyped-def]
+        session = self._sessions.get(session_id)
+        if session is None:
+            if not create:
+                return None
+            session = self._sessions[session_id] = _Session()
+        session.last_access = self._clock()
+        self._sessions.move_to_end(session_id)
+        return session
+
+    def _expire_idle(self) -> None:
+        # Oldest access first, so stop at the first session still fresh.
+        cutoff = self._clock() - self.idle_ttl_s
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if session.last_access > cutoff:
+                break
+            self._evict(session_id, "idle")
+
+    def _enforce_caps(self) -> None:
+        # The session just written is the most recent one, and is never
+        # evicted for its own write: at least one session always survives.
+        while len(self._sessions) > max(1, self.max_sessions):
+            self._evict(next(iter(self._sessions)), "lru")
+        while self._bytes > self.max_bytes and len(self._sessions) > 1:
+            self._evict(next(iter(self._sessions)), "bytes")
+        if self._bytes > self.max_bytes and self._sessions:
+            self._trim(next(reversed(self._sessions)))
+
+    def _trim(self, session_id: str) -> None:
+        session = self._sessions[session_id]
+        dropped = freed = 0
+        while self._bytes - freed > self.max_bytes and dropped < len(session.messages) - 1:
+            freed += message_size(session.messages[dropped])
+            dropped += 1
+        if not dropped:
+            return
+        del session.messages[:dropped]
+        session.size -= freed
+        session.trimmed += dropped
+        self._bytes -= freed
+        self._trimmed_messages += dropped
+        _LOG.info(
+            '{"event":"session_trimmed","session_id":"%s","messages":%s,"bytes":%s}',
+            session_id,
+            dropped,
+            freed,
+        )
+
+    def _evict(self, session_id: str, reason: str) -> None:
+        session = self._sessions.pop(session_id)
+        self._bytes -= session.size
+        self._evictions[reason] += 1
+        _LOG.info(
+            '{"event":"session_evicted","session_id":"%s","reason":"%s","bytes":%s}',
+            session_id,
+            reason,
+            session.size,
+        )
+
+
+class SessionChatMessageHistory(BaseChatMessageHistory):
+    """Chat history backed by a `SessionStore` entry.
+
+    Cheap to construct per call: the messages live in the store, not here.
+    The async methods are overridden to skip LangChain's default
+    thread-pool hop — there is no I/O to offload.
+    """
+
+    def __init__(self, store: SessionStore, session_id: str):
+        self._store = store
+        self.session_id = session_id
+
+    @property
+    def messages(self) -> List[BaseMessage]:  # type: ignore[override]
+        return self._store.get(self.session_id)
+
+    def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        self._store.append(self.session_id, list(messages))
+
+    def clear(self) -> None:
+        self._store.clear(self.session_id)
+
+    async def aget_messages(self) -> List[BaseMessage]:
+        return self.messages
+
+    async def aget_messages_from(self, start: int) -> Tuple[int, List[BaseMessage]]:
+        return self._store.get_from(self.session_id, start)
+
+    async def aadd_messages(self, messages: Sequence[BaseMessage]) -> None:
+        self.add_messages(messages)
+
+    async def aclear(self) -> None:
+        self.clear()
@@ -0,0 +1,321 @@
+"""SQLite knowledge-base backend, and the build step that creates it.
+
+The database is built offline from the curated JSON:
+
+    python -m data.sqlite_kb build [--json data/known_companies.json]
+                                   [--db data/known_companies.db]
+
+The build writes to a temporary file and then `os.replace`s it into
+place. Running workers keep reading the file they have open, and they
+switch to the new one when `FileWatcher` notices the change.
+
+Schema:
+
+  * ``companies``: one row per company, with the original record as JSON.
+  * ``names``: normalized name and alias keys (`normalize_company`),
+    indexed, which makes exact and alias lookups a B-tree probe.
+  * ``grams`` / ``gram_df``: the trigram postings of those keys and each
+    trigram's document frequency. Fuzzy lookups draw candidates from the
+    query's rare trigrams only, and score them with the same trigram
+    Jaccard as `CompanyIndex`, so both backends agree on typos.
+  * ``projects_fts``: FTS5 (porter stemming) over project details, skills
+    and resources, for `search_projects`, ranked by bm25.
+
+Nothing is cached in Python, so memory stays flat as the table grows.
+Each thread gets its own read-only connection with a small page cache.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from data.company_index import (
+    MIN_STOP_DF,
+    STOP_GRAM_RATIO,
+    CompanyMatch,
+    normalize_company,
+    trigrams,
+)
+from data.knowledge_base import FileWatcher, KnowledgeBase
+from observability.logging import get_logger
+from utils.loader import load_json
+
+_LOG = get_logger("essales.knowledge_base")
+
+SCHEMA_VERSION = 1
+
+_WORD = re.compile(r"\w+")
+
+#: Per-connection page cache, in KiB.
+CACHE_KIB = 4096
+
+#: Fuzzy candidates fetched from ``grams`` before Jaccard scoring.
+FUZZY_CANDIDATES = 64
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE companies (
+    id INTEGER PRIMARY KEY,
+    company_name TEXT NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE TABLE names (
+    key TEXT PRIMARY KEY,
+    company_id INTEGER NOT NULL REFERENCES companies(id),
+    name TEXT NOT NULL,
+    is_alias INTEGER NOT NULL
+);
+CREATE TABLE grams (
+    gram TEXT NOT NULL,
+    name_id INTEGER NOT NULL,
+    PRIMARY KEY (gram, name_id)
+) WITHOUT ROWID;
+CREATE TABLE gram_df (gram TEXT PRIMARY KEY, df INTEGER NOT NULL) WITHOUT ROWID;
+CREATE VIRTUAL TABLE projects_fts USING fts5(
+    project_details, skills, resources, tokenize = 'porter unicode61'
+);
+"""
+
+
+def build(records: Iterable[Dict[str, Any]], db_path: str) -> int:
+    """Write `records` to a fresh database at `db_path`; returns the count.
+
+    Names and aliases follow `CompanyIndex`'s rules: names first, first
+    one wins, and an alias never shadows a company name.
+    """
+    directory = os.path.dirname(os.path.abspath(db_path))
+    fd, tmp_path = tempfile.mkstemp(suffix=".db.tmp", dir=directory)
+    os.close(fd)
+    try:
+        conn = sqlite3.connect(tmp_path)
+        conn.executescript(_SCHEMA)
+
+        count = 0
+        aliases = []
+        for company_id, record in enumerate(records, start=1):
+            name = record.get("company_name")
+            if not name:
+                continue
+            count += 1
+            conn.execute(
+                "INSERT INTO companies (id, company_name, record) VALUES (?, ?, ?)",
+                (company_id, name, json.dumps(record, ensure_ascii=False)),
+            )
+            _add_name(conn, name, company_id, alias=False)
+            aliases.extend((alias, company_id) for alias in record.get("aliases", ()))
+            conn.execute(
+                "INSERT INTO projects_fts (rowid, project_details, skills, resources)"
+                " VALUES (?, ?, ?, ?)",
+                (
+                    company_id,
+                    record.get("project_details", ""),
+                    " ".join(record.get("skills_required", [])),
+                    " ".join(record.get("resources_used", [])),
+                ),
+            )
+        for alias, company_id in aliases:
+            _add_name(conn, alias, company_id, alias=True)
+        conn.executemany(
+            "INSERT INTO grams (gram, name_id) VALUES (?, ?)",
+            (
+                (gram, name_id)
+                for name_id, key in conn.execute("SELECT rowid, key FROM names").fetchall()
+                for gram in trigrams(key)
+            ),
+        )
+        conn.execute(
+            "INSERT INTO gram_df (gram, df) SELECT gram, COUNT(*) FROM grams GROUP BY gram"
+        )
+        conn.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?)",
+            [
+                ("schema_version", str(SCHEMA_VERSION)),
+                ("built_at", str(int(time.time()))),
+                ("names", str(conn.execute("SELECT COUNT(*) FROM names").fetchone()[0])),
+            ],
+        )
+        conn.commit()
+        conn.execute("VACUUM")
+        conn.close()
+        os.replace(tmp_path, db_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return count
+
+
+def _add_name(conn: sqlite3.Connection, name: str, company_id: int, *, alias: bool) -> None:
+    key = normalize_company(name)
+    if key:
+        conn.execute(
+            "INSERT OR IGNORE INTO names (key, company_id, name, is_alias)"
+            " VALUES (?, ?, ?, ?)",
+            (key, company_id, name, int(alias)),
+        )
+
+
+class SQLiteKnowledgeBase(KnowledgeBase):
+    """Queries a database built by `build`; nothing is held in memory.
+
+    Args:
+        path: the database file.
+        min_similarity: lowest trigram Jaccard score a fuzzy hit may have.
+        check_interval_s: how often to look for a rebuilt file.
+    """
+
+    def __init__(
+        self, path: str, *, min_similarity: float = 0.5, check_interval_s: float = 2.0
+    ):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"{path} (build it with python -m data.sqlite_kb)")
+        self.path = path
+        self.min_similarity = min_similarity
+        self._generation = 0
+        self._local = threading.local()
+        self.watcher = FileWatcher(path, self._bump, interval_s=check_interval_s)
+        self._stop_df = self._read_stop_df()
+
+    def _bump(self) -> None:
+        # Each thread reopens on its next query; open statements keep
+        # reading the old file until then.
+        self._stop_df = self._read_stop_df()
+        self._generation += 1
+
+    def _read_stop_df(self) -> int:
+        names = int(self._read_meta("names") or 0)
+        return max(MIN_STOP_DF, int(names * STOP_GRAM_RATIO))
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(
+            f"file:{self.path}?mode=ro", uri=True, check_same_thread=False
+        )
+
+    def _read_meta(self, key: str) -> Optional[str]:
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        finally:
+            conn.close()
+        return row[0] if row else None
+
+    def _conn(self) -> sqlite3.Connection:
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is None or local.generation != self._generation:
+            if conn is not None:
+                conn.close()
+            conn = self._connect()
+            conn.execute(f"PRAGMA cache_size = -{CACHE_KIB}")
+            local.conn, local.generation = conn, self._generation
+        return conn
+
+    def lookup(self, name: str, *, fuzzy: bool = True) -> Optional[CompanyMatch]:
+        self.watcher.poll()
+        key = normalize_company(name)
+        if not key:
+            return None
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT n.name, n.is_alias, c.record FROM names n"
+            " JOIN companies c ON c.id = n.company_id WHERE n.key = ?",
+            (key,),
+        ).fetchone()
+        if row is not None:
+            return CompanyMatch(
+                record=json.loads(row[2]),
+                matched=row[0],
+                how="alias" if row[1] else "exact",
+            )
+        return self._fuzzy(conn, key) if fuzzy else None
+
+    def _fuzzy(self, conn: sqlite3.Connection, key: str) -> Optional[CompanyMatch]:
+        query = trigrams(key)
+        # As in `CompanyIndex._fuzzy`: only the rare trigrams generate
+        # candidates, and a candidate is assumed to share every stop gram.
+        marks = ",".join("?" * len(query))
+        dfs = conn.execute(
+            f"SELECT gram, df FROM gram_df WHERE gram IN ({marks})", tuple(query)
+        ).fetchall()
+        rare = [gram for gram, df in dfs if df <= self._stop_df]
+        need = max(1, math.ceil(self.min_similarity * len(query)))
+        min_rare = max(1, need - (len(dfs) - len(rare)))
+        if len(rare) < min_rare:
+            return None
+        marks = ",".join("?" * len(rare))
+        rows = conn.execute(
+            "SELECT n.key, n.name, c.record FROM ("
+            f"  SELECT name_id, COUNT(*) AS shared FROM grams WHERE gram IN ({marks})"
+            "   GROUP BY name_id HAVING shared >= ? ORDER BY shared DESC LIMIT ?"
+            ") g JOIN names n ON n.rowid = g.name_id"
+            " JOIN companies c ON c.id = n.company_id",
+            (*rare, min_rare, FUZZY_CANDIDATES),
+        ).fetchall()
+        best = None
+        best_score = self.min_similarity
+        for cand_key, cand_name, record in rows:
+            grams = trigrams(cand_key)
+            shared = len(query & grams)
+            score = shared / (len(query) + len(grams) - shared)
+            if score >= best_score and (best is None or score > best[0]):
+                best, best_score = (score, cand_name, record), score
+        if best is None:
+            return None
+        score, cand_name, record = best
+        return CompanyMatch(
+            record=json.loads(record),
+            matched=cand_name,
+            how="fuzzy" if score < 1.0 else "exact",
+            score=round(score, 4),
+        )
+
+    def search_projects(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        self.watcher.poll()
+        words = _WORD.findall(query)
+        if not words:
+            return []
+        match = " OR ".join('"' + w.replace('"', '""') + '"' for w in words)
+        rows = self._conn().execute(
+            "SELECT c.record, -bm25(projects_fts) FROM projects_fts f"
+            " JOIN companies c ON c.id = f.rowid"
+            " WHERE projects_fts MATCH ? ORDER BY rank LIMIT ?",
+            (match, limit),
+        ).fetchall()
+        return [{**json.loads(record), "score": round(score, 4)} for record, score in rows]
+
+    def count(self) -> int:
+        self.watcher.poll()
+        return self._conn().execute("SELECT COUNT(*) FROM companies").fetchone()[0]
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build the SQLite knowledge base.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    cmd = sub.add_parser("build", help="import the JSON knowledge base")
+    cmd.add_argument("--json", default="data/known_companies.json")
+    cmd.add_argument("--db", default="data/known_companies.db")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    count = build(load_json(args.json), args.db)
+    print(f"wrote {count} companies to {args.db} in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,21 +1,21 @@
 # handlers/company_handler.py
 
+import asyncio
 import logging
 import json
 import re
-from langchain.chains import LLMChain
-from langchain.prompts import PromptTemplate, ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
-from langchain.memory import ConversationBufferMemory
-from langchain_community.chat_message_histories import RedisChatMessageHistory
+import time
+from typing import Any, Optional
+from langchain_core.prompts import PromptTemplate, ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
 from langchain_core.runnables import Runnable
-from utils.loader import load_json, parse_response
-from config.settings import REDIS_URL
+from utils.loader import parse_response
+from data.knowledge_base import get_knowledge_base
+from data.profile_cache import ProfileCache
+from data.session_state import COMPANY_PROFILE, CURRENT_COMPANY, SessionState, get_session_state
+from handlers.entity_extractor import EntityExtractor, Extraction
 
 logging.basicConfig(level=logging.WARNING)
 
-known_companies = load_json("data/known_companies.json")
-logging.info(f"Loaded known companies: {known_companies}")
-
 extraction_prompt = PromptTemplate(
     input_variables=["user_input"],
     template="""
@@ -46,10 +46,11 @@ Output the profile in a structured format.
 
 conversation_prompt = ChatPromptTemplate.from_messages([
     SystemMessagePromptTemplate.from_template(
-        "You are a helpful sales assistant providing detailed information about companies."
-        "Use the conversation history provided below to answer follow-up questions without requiring the company name again. "
+        "You are a helpful sales assistant providing detailed information about companies. "
+        "The user is currently discussing the company below; answer follow-up questions about it without requiring the company name again. "
         "If the question isn't company-related, respond: 'Sorry, I'm just a sales assistant and not trained to answer that.'\n\n"
-        "Conversation History:\n{chat_history}"
+        "Current company: {current_company}\n"
+        "What we know about it:\n{company_profile}"
     ),
     HumanMessagePromptTemplate.from_template("{user_input}")
 ])
@@ -57,25 +58,47 @@ conversation_prompt = ChatPromptTemplate.from_messages([
 def format_text(text: str) -> str:
     return re.sub(r"[_\[\]()~`>#+-=|{}!]", "", text)
 
-def get_memory(session_id: str):
-    chat_history = RedisChatMessageHistory(url=REDIS_URL, session_id=session_id)
-    return ConversationBufferMemory(
-        memory_key="chat_history",
-        chat_memory=chat_history,
-        return_messages=True
-    )
+#: Longest profile kept in the session's `company_profile` slot.
+PROFILE_SLOT_MAX_CHARS = 4000
 
 class CompanyHandler:
-    def __init__(self, llm):
+    def __init__(
+        self,
+        llm,
+        *,
+        extractor: Optional[EntityExtractor] = None,
+        profile_cache: Optional[ProfileCache] = None,
+        session_state: Optional[SessionState] = None,
+        metrics: Optional[Any] = None,
+    ):
         self.llm = llm
         self.extraction_chain = extraction_prompt | llm
         self.profile_chain = profile_prompt | llm
-
-    async def handle(self, user_input: str, session_id: str) -> str:
-        memory = get_memory(session_id)
-        conversation_chain: Runnable = conversation_prompt | self.llm.with_config(memory=memory)
-
+        # Tried before `extraction_chain`; the LLM only runs when it isn't sure.
+        self.extractor = extractor
+        # Generated profiles are the same for every rep; reuse them.
+        self.profile_cache = profile_cache
+        # Current company per session; `get_session_state()` when unset.
+        self._session_state = session_state
+        self.metrics = metrics
+
+    @property
+    def session_state(self) -> SessionState:
+        return self._session_state or get_session_state()
+
+    async def extract(self, user_input: str) -> Optional[Extraction]:
+        """Company and intent for `user_input`: locally if confident, else via the LLM."""
+        if self.extractor is not None:
+            local = await asyncio.to_thread(self.extractor.match, user_input)
+            self._report(local is not None)
+            if local is not None:
+                logging.info(f"Local extraction: {local.company_name!r} ({local.confidence})")
+                return local
+
+        start = time.perf_counter()
         extraction_result = await self.extraction_chain.ainvoke({"user_input":user_input})
+        if self.extractor is not None:
+            self.extractor.record_llm_extraction(time.perf_counter() - start)
         extraction_result = parse_response(extraction_result)
         logging.info(f"Raw extraction result: {extraction_result}")
 
@@ -83,22 +106,54 @@ class CompanyHandler:
             result_json = json.loads(extraction_result)
         except json.JSONDecodeError as e:
             logging.error(f"JSON decode error: {e}")
+            return None
+        return Extraction(
+            company_name=result_json.get("company_name", "none").strip().lower(),
+            is_company_query=result_json.get("is_company_query", False),
+            change_company=result_json.get("change_company", False),
+        )
+
+    def _report(self, hit: bool) -> None:
+        if self.metrics is None:
+            return
+        self.metrics.incr("company_extraction_local_hits" if hit else "company_extraction_llm_fallbacks")
+        if hit:
+            self.metrics.incr("llm_calls_saved")
+            self.metrics.incr("company_extraction_ms_saved", self.extractor.mean_llm_ms)
+        self.metrics.set_gauge("company_extraction_hit_rate", self.extractor.stats()["hit_rate"])
+
+    async def _generate_profile(self, company_name: str) -> str:
+        profile = await self.profile_chain.ainvoke({"company_name":company_name})
+        return format_text(parse_response(profile))
+
+    async def profile(self, company_name: str) -> str:
+        """LLM-generated profile of `company_name`, cached when a cache is set."""
+        if self.profile_cache is None:
+            return await self._generate_profile(company_name)
+        return await self.profile_cache.get_or_fetch(company_name, self._generate_profile)
+
+    async def handle(self, user_input: str, session_id: str) -> str:
+        state = self.session_state
+        conversation_chain: Runnable = conversation_prompt | self.llm
+
+        extraction = await self.extract(user_input)
+        if extraction is None:
             return "I'm sorry, I couldn't extract the company name properly. Please rephrase."
 
-        candidate = result_json.get("company_name", "none").strip().lower()
-        is_query = result_json.get("is_company_query", False)
-        change_company = result_json.get("change_company", False)
+        candidate = extraction.company_name
+        is_query = extraction.is_company_query
+        change_company = extraction.change_company
 
         logging.info(f"Extracted candidate: '{candidate}', is_company_query: {is_query}, change_company: {change_company}")
 
         if change_company and candidate != "none":
-            memory.clear()
-            memory.save_context({"user_message": user_input}, {"current_company": candidate})
+            # Only the company slots change; the conversation history stays.
+            await state.update(session_id, **{CURRENT_COMPANY: candidate, COMPANY_PROFILE: None})
             return f"Company context changed to {candidate.title()}."
 
         if candidate != "none" and is_query:
-            memory.save_context({"user_message": user_input}, {"current_company": candidate})
-            known_company = next((c for c in known_companies if c["company_name"].lower() == candidate), None)
+            match = extraction.match or await asyncio.to_thread(get_knowledge_base().lookup, candidate)
+            known_company = match.record if match else None
 
             if known_company:
                 response = (
@@ -106,12 +161,19 @@ class CompanyHandler:
                     f"Project Details: {known_company['project_details']} (Worked with: {known_company['worked_with']}). "
                     f"Contacts: {', '.join(known_company['contacts'])}."
                 )
-                return response
             else:
-                profile = await self.profile_chain.ainvoke({"company_name":candidate})
-                profile = parse_response(profile)
-                return format_text(profile)
-
-        response = await conversation_chain.ainvoke({"user_input": user_input})
+                response = await self.profile(candidate)
+            await state.update(
+                session_id,
+                **{CURRENT_COMPANY: candidate, COMPANY_PROFILE: response[:PROFILE_SLOT_MAX_CHARS]},
+            )
+            return response
+
+        slots = await state.get(session_id)
+        response = await conversation_chain.ainvoke({
+            "user_input": user_input,
+            "current_company": slots.get(CURRENT_COMPANY, "none yet"),
+            "company_profile": slots.get(COMPANY_PROFILE, "nothing yet"),
+        })
         response = parse_response(response)
-        return format_text(response)
\ No newline at end of file
+        return format_text(response)
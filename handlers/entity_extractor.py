@@ -0,0 +1,214 @@
+"""Local company extraction, tried before the extraction LLM call.
+
+`CompanyHandler` needs three things from a message before it can act: the
+company, whether the message asks about it, and whether the user is
+switching company context. Asking the LLM for them costs a full round
+trip, and the profile call can only start after it. Most company
+questions name a company we already know, next to a familiar phrase
+("tell me about Acme", "switch to Globex"). `EntityExtractor` answers
+those locally:
+
+  * **company**: word spans of the message (longest first) looked up in
+    the knowledge base, by exact name or alias only. Fuzzy matching on
+    arbitrary spans would turn ordinary words into companies. Failing
+    that, a capitalized name right after a cue ("tell me about Initech")
+    is taken as an unknown company.
+  * **intent**: cue phrases for a profile question or a context switch.
+
+Each rule carries a confidence. Below `min_confidence` (two companies,
+mixed cues, no cue at all) `match` returns `None` and the handler asks
+the LLM as before. As with `FastPathRouter`, a miss costs only the usual
+LLM call, while a wrong hit answers the wrong question.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Pattern, Sequence
+
+from data.company_index import CompanyMatch
+from data.knowledge_base import KnowledgeBase, get_knowledge_base
+
+#: Phrases that switch the conversation to another company.
+CHANGE_CUES: Sequence[str] = (
+    r"\b(?:switch|switching|change|changing|move|moving|jump|go)(?: back| over)? to\b",
+    r"\b(?:switch|change) (?:the )?(?:company|context|account|client)(?: to)?\b",
+)
+
+#: Phrases that ask for information about a company.
+QUERY_CUES: Sequence[str] = (
+    r"\btell me (?:more |a bit |something )?about\b",
+    r"\b(?:what|anything) (?:do|can|did) (?:you|we) (?:know|tell me|find|have) (?:about|on)\b",
+    r"\b(?:info|information|details|background|overview|profile|summary|rundown|intel)"
+    r" (?:on|about|of|for)\b",
+    r"\b(?:look ?up|research|profile)\b",
+    r"\b(?:what|how) about\b",
+    r"\bwho (?:is|are)\b",
+    r"\bhave we (?:ever )?worked with\b",
+)
+
+#: How many of `QUERY_CUES` (from the start) are followed by a company
+#: name often enough to trust an unknown one; "who is ..." is usually a
+#: person, "what about ..." a follow-up.
+NAME_QUERY_CUES = 4
+
+#: Lowercase words that never start or end a company name, so spans
+#: edged by them aren't looked up. Capitalized ("The Home Depot") still are.
+EDGE_STOPWORDS = frozenset(
+    "a about an and any are at back can could do does for from give have how i "
+    "in info is it its know let lets look me more my now of on or our over "
+    "please s show switch change tell that the their them to up us we what who "
+    "with you".split()
+)
+
+_TOKEN = re.compile(r"\w[\w&.'’-]*")
+_POSSESSIVE = re.compile(r"['’]s?$")
+_NAME_TAIL = re.compile(r"\s*((?:[A-Z0-9][\w&.'’-]*\s*){1,4})[?.!\s]*$")
+
+#: Confidence of each rule.
+KNOWN_WITH_CUE = 0.95
+UNKNOWN_AFTER_CUE = 0.85
+KNOWN_WITHOUT_CUE = 0.6
+
+
+@dataclass(frozen=True)
+class Extraction:
+    """The fields `extraction_prompt` asks the LLM for, plus provenance."""
+
+    company_name: str
+    is_company_query: bool
+    change_company: bool
+    confidence: float = 1.0
+    #: The knowledge-base hit, when the company is a known one.
+    match: Optional[CompanyMatch] = None
+
+
+class EntityExtractor:
+    """Extract the company and intent from a message without the LLM.
+
+    Args:
+        knowledge_base: where known companies are looked up (default: the
+            shared `get_knowledge_base()`, read on each call so it follows
+            reloads).
+        min_confidence: lowest confidence `match` returns.
+        max_span_words: longest company name tried, in words.
+        max_length: longer messages go straight to the LLM.
+    """
+
+    def __init__(
+        self,
+        knowledge_base: Optional[KnowledgeBase] = None,
+        *,
+        min_confidence: float = 0.8,
+        max_span_words: int = 5,
+        max_length: int = 300,
+    ):
+        self._kb = knowledge_base
+        self.min_confidence = min_confidence
+        self._max_span_words = max_span_words
+        self._max_length = max_length
+        self._change: List[Pattern[str]] = [re.compile(p, re.I) for p in CHANGE_CUES]
+        self._query: List[Pattern[str]] = [re.compile(p, re.I) for p in QUERY_CUES]
+        self._name_cues = {
+            *self._change,
+            *self._query[:NAME_QUERY_CUES],
+        }
+        self._hits = 0
+        self._misses = 0
+        self._local_s = 0.0
+        self._llm_calls = 0
+        self._llm_s = 0.0
+
+    def extract(self, text: str) -> Extraction:
+        """Best local reading of `text`, whatever its confidence."""
+        if not text or len(text) > self._max_length:
+            return Extraction("none", False, False, confidence=0.0)
+        change = self._first_cue(self._change, text)
+        query = None if change else self._first_cue(self._query, text)
+        cue = change or query
+
+        matches = self._known_companies(text)
+        if len(matches) == 1:
+            (match,) = matches
+            if cue is None:
+                # "Acme?" alone is still about Acme; anything else is unclear.
+                alone = len(_TOKEN.findall(text)) <= len(_TOKEN.findall(match.matched))
+                confidence = KNOWN_WITH_CUE if alone else KNOWN_WITHOUT_CUE
+            else:
+                confidence = KNOWN_WITH_CUE
+            return Extraction(
+                match.record["company_name"].lower(),
+                is_company_query=change is None,
+                change_company=change is not None,
+                confidence=confidence,
+                match=match,
+            )
+        if not matches and cue is not None and cue.re in self._name_cues:
+            tail = _NAME_TAIL.fullmatch(text, cue.end())
+            if tail:
+                return Extraction(
+                    tail.group(1).strip().rstrip(".").lower(),
+                    is_company_query=change is None,
+                    change_company=change is not None,
+                    confidence=UNKNOWN_AFTER_CUE,
+                )
+        return Extraction("none", False, False, confidence=0.0)
+
+    def match(self, text: str) -> Optional[Extraction]:
+        """`extract`, or `None` when the LLM should decide."""
+        start = time.perf_counter()
+        result = self.extract(text)
+        self._local_s += time.perf_counter() - start
+        if result.confidence < self.min_confidence:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return result
+
+    def record_llm_extraction(self, elapsed_s: float) -> None:
+        """Report how long a fallback LLM extraction took."""
+        self._llm_calls += 1
+        self._llm_s += elapsed_s
+
+    @property
+    def mean_llm_ms(self) -> float:
+        """Average LLM extraction latency seen so far (0 before the first)."""
+        return self._llm_s / self._llm_calls * 1000 if self._llm_calls else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        total = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / total, 4) if total else 0.0,
+            "local_ms_mean": round(self._local_s / total * 1000, 3) if total else 0.0,
+            "llm_ms_mean": round(self.mean_llm_ms, 1),
+            # Each hit skipped one LLM extraction of about average length.
+            "ms_saved": round(self._hits * self.mean_llm_ms, 1),
+        }
+
+    @staticmethod
+    def _first_cue(patterns: List[Pattern[str]], text: str) -> Optional[re.Match]:
+        found = [m for m in (p.search(text) for p in patterns) if m]
+        return min(found, key=lambda m: m.start()) if found else None
+
+    def _known_companies(self, text: str) -> List[CompanyMatch]:
+        """Distinct known companies named in `text`, longest spans first."""
+        kb = self._kb or get_knowledge_base()
+        tokens = [_POSSESSIVE.sub("", t) for t in _TOKEN.findall(text)]
+        taken = [False] * len(tokens)
+        found: Dict[str, CompanyMatch] = {}
+        for width in range(min(self._max_span_words, len(tokens)), 0, -1):
+            for i in range(len(tokens) - width + 1):
+                if any(taken[i : i + width]):
+                    continue
+                first, last = tokens[i], tokens[i + width - 1]
+                if first in EDGE_STOPWORDS or last in EDGE_STOPWORDS:
+                    continue
+                match = kb.lookup(" ".join(tokens[i : i + width]), fuzzy=False)
+                if match is not None:
+                    taken[i : i + width] = [True] * width
+                    found.setdefault(match.record["company_name"], match)
+        return list(found.values())
@@ -1,13 +1,11 @@
-from langchain.prompts import PromptTemplate
-from langchain.chains import LLMChain
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.prompts import PromptTemplate
 import json
 from utils.loader import parse_response
-from langchain.memory import ConversationBufferMemory
-from langchain_community.chat_message_histories import RedisChatMessageHistory
-from config.settings import REDIS_URL
+from data.chat_history import get_chat_history
 
 def get_opportunity_field_memory(session_id: str):
-    return RedisChatMessageHistory(url=REDIS_URL, session_id=f"{session_id}_opportunity")
+    return get_chat_history(f"{session_id}_opportunity")
 
 # Prompt for opportunity creation
 opportunity_prompt = PromptTemplate(
@@ -49,7 +47,7 @@ class OpportunityHandler:
         history = get_opportunity_field_memory(session_id)
 
         # Load previous field state from memory
-        prior_state = self._get_prior_fields(history)
+        prior_state = self._get_prior_fields(await history.aget_messages())
 
         # Extract from current input only
         result = await self.chain.ainvoke({"user_input": user_input})
@@ -65,8 +63,10 @@ class OpportunityHandler:
                 prior_state[k] = v
 
         # Save back into Redis (as stringified JSON)
-        history.add_user_message(user_input)
-        history.add_ai_message(json.dumps(prior_state))  # save current state
+        await history.aadd_messages([
+            HumanMessage(content=user_input),
+            AIMessage(content=json.dumps(prior_state)),  # save current state
+        ])
 
         # Determine missing fields
         required = ["contact_name", "company_name", "deal_stage", "amount", "close_date"]
@@ -77,7 +77,7 @@ class OpportunityHandler:
 
         # ✅ All fields ready
         # Optionally clear memory
-        history.clear()
+        await history.aclear()
 
         return (
             f"✅ Opportunity created:\n"
@@ -88,9 +88,8 @@ class OpportunityHandler:
             f"- Close Date: {prior_state['close_date']}"
         )
 
-    def _get_prior_fields(self, history) -> dict:
+    def _get_prior_fields(self, messages) -> dict:
         """Reads the last stored AI message and tries to extract the field state."""
-        messages = history.messages
         for msg in reversed(messages):
             if hasattr(msg, 'content') and isinstance(msg.content, str):
                 try:
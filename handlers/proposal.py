@@ -1,13 +1,14 @@
-from langchain.chains import LLMChain
-from langchain.prompts import PromptTemplate
+from langchain_core.prompts import PromptTemplate
 from config.settings import OPENAI_API_KEY, BLOB_CONNECTION_STR, CONTAINER_NAME
 from utils.loader import parse_response
-from pptx import Presentation
-from pptx.util import Inches
 from io import BytesIO
 import base64
-from botbuilder.schema import Attachment, ActivityTypes, Activity
-from azure.storage.blob import BlobServiceClient, ContentSettings
+import asyncio
+from utils.deadline import remaining_s
+
+# python-pptx, azure-storage-blob and botbuilder are imported where they are
+# used: each costs tens of milliseconds at import, and a worker shouldn't pay
+# that on boot for a tool it may never call.
 
 proposal_prompt = PromptTemplate(
     input_variables=["user_message"],
@@ -47,6 +48,9 @@ Please provide the full draft outline.
 )
 
 def generate_ppt_from_outline(outline: str) -> bytes:
+    from pptx import Presentation
+    from pptx.util import Inches
+
     prs = Presentation()
     slides_text = outline.strip().split("\n\n")
     for slide_text in slides_text:
@@ -67,14 +71,19 @@ class ProposalHandler:
     def __init__(self, llm):
         self.chain = proposal_prompt | llm
 
-    def upload_file_to_blob(self, blob_name: str, file_bytes: bytes) -> str:
+    def upload_file_to_blob(self, blob_name: str, file_bytes: bytes, timeout=None) -> str:
+        from azure.storage.blob import BlobServiceClient, ContentSettings
+
         blob_service_client = BlobServiceClient.from_connection_string(BLOB_CONNECTION_STR)
         container_client = blob_service_client.get_container_client(CONTAINER_NAME)
 
+        # `timeout` is the server-side limit, in whole seconds.
+        extra = {"timeout": max(1, int(timeout))} if timeout is not None else {}
         container_client.upload_blob(
             name=blob_name,
             data=file_bytes,
             overwrite=True,
+            **extra,
             content_settings=ContentSettings(
                 content_type="application/vnd.openxmlformats-officedocument.presentationml.presentation"
             )
@@ -84,13 +93,19 @@ class ProposalHandler:
         return f"{account_url}/{CONTAINER_NAME}/{blob_name}"
 
     async def handle(self, user_input: str) -> dict:
+        from botbuilder.schema import Activity, ActivityTypes, Attachment
+
         proposal_text = await self.chain.ainvoke({"user_message":user_input})
         proposal_text = parse_response(proposal_text)
         ppt_data = generate_ppt_from_outline(proposal_text)
         base64_data = base64.b64encode(ppt_data).decode("utf-8")
 
         blob_name = "proposal.pptx"
-        content_url = self.upload_file_to_blob(blob_name, ppt_data)
+        # Off the event loop, so the registry's timeout can fire during the
+        # upload; the remaining turn budget bounds it on the server side too.
+        content_url = await asyncio.to_thread(
+            self.upload_file_to_blob, blob_name, ppt_data, remaining_s()
+        )
 
         attachment = Attachment(
             content_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
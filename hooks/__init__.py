@@ -1,19 +1,24 @@
 """Hooks layer: pre/post/error interceptors around every tool invocation.
 
 Hooks let cross-cutting concerns (validation, enrichment, logging, metrics,
-retry, fallback) live outside the skills themselves. The `HookManager`
-composes them into a single middleware chain that the `ToolRegistry`
-executes on every invocation.
+retry, fallback, caching, circuit breaking) live outside the skills
+themselves. The `HookManager` composes them into a single middleware chain
+that the `ToolRegistry` executes on every invocation.
 """
 
 from hooks.base import Hook, HookManager, HookPhase
+from hooks.dispatch import BackgroundDispatcher, QueuePolicy
 from hooks.validation import JSONSchemaValidationHook
 from hooks.enrichment import SessionEnrichmentHook
 from hooks.logging_hook import AuditLogHook
 from hooks.metrics import MetricsHook
 from hooks.error_hook import RetryAndFallbackHook
+from hooks.cache_hook import ResultCacheHook
+from hooks.circuit_breaker import CircuitBreakerHook, CircuitState, RetryBudget
 
 __all__ = [
+    "BackgroundDispatcher",
+    "QueuePolicy",
     "Hook",
     "HookManager",
     "HookPhase",
@@ -22,4 +27,8 @@ __all__ = [
     "AuditLogHook",
     "MetricsHook",
     "RetryAndFallbackHook",
+    "ResultCacheHook",
+    "CircuitBreakerHook",
+    "CircuitState",
+    "RetryBudget",
 ]
@@ -8,16 +8,40 @@ Design:
     `SkillResult` fallback (retry, graceful error message). The first
     error-hook to return a non-`None` result wins; otherwise the exception
     propagates.
+  * Around-hooks wrap the skill call itself: they receive `call_next` and
+    may answer without calling it (caching, circuit breaking) or call it
+    and post-process. The first registered is the outermost. They run
+    after pre-hooks, and their result — short-circuited or not — goes
+    through post- and error-hooks like any other.
+
+A failing post- or error-hook is logged and skipped: observers must never
+turn a successful call into a failed one, and with concurrent tool calls
+a broken hook must stay confined to the call it was observing.
+
+Post-hooks that set `blocking = False` are handed to the manager's
+`BackgroundDispatcher` (see `hooks/dispatch.py`) when one is configured,
+so they run after the result is returned instead of before. Without a
+dispatcher every post-hook runs inline, as before.
+
+`duration_ms` handed to post-hooks is execution time: time spent waiting
+for a bulkhead slot (``ctx.metadata["queue_wait_ms"]``) is left out.
+
+The manager compiles a pipeline per tool on first use, keeping only hooks
+that override a phase and whose `applies_to(spec)` is true, and rebuilds
+it when hooks are added; a tool with nothing to validate or observe pays
+for nothing.
 
 All hooks are async to stay uniform with the skill API.
 """
 
 from __future__ import annotations
 
+import logging
 import time
 from abc import ABC
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from skills.base import SkillContext, SkillResult
 
@@ -25,16 +49,29 @@ from skills.base import SkillContext, SkillResult
 # small runtime cost of importing for clarity.
 from mcp.registry import ToolSpec
 
+if TYPE_CHECKING:  # pragma: no cover
+    from hooks.dispatch import BackgroundDispatcher
+
+_LOG = logging.getLogger("essales.hooks")
+
 
 class HookPhase(str, Enum):
     PRE = "pre"
     POST = "post"
     ERROR = "error"
+    AROUND = "around"
 
 
 class Hook(ABC):
     """Marker base class; concrete hooks implement one or more phase methods."""
 
+    #: False for pure observers whose `post` may run after the call returns.
+    blocking: bool = True
+
+    def applies_to(self, spec: ToolSpec) -> bool:
+        """Whether this hook has anything to do for `spec` (checked once per tool)."""
+        return True
+
     async def pre(
         self, spec: ToolSpec, arguments: Dict[str, Any], ctx: SkillContext
     ) -> Dict[str, Any]:
@@ -59,6 +96,47 @@ class Hook(ABC):
     ) -> Optional[SkillResult]:
         return None
 
+    async def around(
+        self,
+        spec: ToolSpec,
+        arguments: Dict[str, Any],
+        ctx: SkillContext,
+        call_next: Callable[[Dict[str, Any]], Awaitable[SkillResult]],
+    ) -> SkillResult:
+        return await call_next(arguments)
+
+
+@dataclass
+class _Pipeline:
+    """Hooks that actually act on one tool, per phase, in registration order."""
+
+    pre: List[Hook]
+    post: List[Hook]
+    error: List[Hook]
+    around: List[Hook] = field(default_factory=list)
+
+
+def _overrides(hook: Hook, method: str) -> bool:
+    return getattr(type(hook), method) is not getattr(Hook, method)
+
+
+def _wrap(
+    hook: Hook,
+    spec: ToolSpec,
+    ctx: SkillContext,
+    call_next: Callable[[Dict[str, Any]], Awaitable[SkillResult]],
+) -> Callable[[Dict[str, Any]], Awaitable[SkillResult]]:
+    async def _call(arguments: Dict[str, Any]) -> SkillResult:
+        return await hook.around(spec, arguments, ctx, call_next)
+
+    return _call
+
+
+def _execution_ms(start: float, ctx: SkillContext) -> float:
+    """Time since `start`, minus any bulkhead queue wait the registry reported."""
+    elapsed = (time.perf_counter() - start) * 1000
+    return max(0.0, elapsed - ctx.metadata.get("queue_wait_ms", 0.0))
+
 
 class HookManager:
     def __init__(
@@ -66,19 +144,69 @@ class HookManager:
         pre: Optional[List[Hook]] = None,
         post: Optional[List[Hook]] = None,
         error: Optional[List[Hook]] = None,
+        around: Optional[List[Hook]] = None,
+        *,
+        dispatcher: Optional["BackgroundDispatcher"] = None,
     ):
         self._pre = list(pre or [])
         self._post = list(post or [])
         self._error = list(error or [])
+        self._around = list(around or [])
+        self._dispatcher = dispatcher
+        # tool name -> (spec it was compiled for, pipeline)
+        self._compiled: Dict[str, Tuple[ToolSpec, _Pipeline]] = {}
 
     def add_pre(self, hook: Hook) -> None:
         self._pre.append(hook)
+        self._compiled.clear()
 
     def add_post(self, hook: Hook) -> None:
         self._post.append(hook)
+        self._compiled.clear()
 
     def add_error(self, hook: Hook) -> None:
         self._error.append(hook)
+        self._compiled.clear()
+
+    def add_around(self, hook: Hook) -> None:
+        self._around.append(hook)
+        self._compiled.clear()
+
+    @property
+    def dispatcher(self) -> Optional["BackgroundDispatcher"]:
+        return self._dispatcher
+
+    async def flush(self) -> None:
+        """Wait for queued non-blocking post-hooks to finish."""
+        if self._dispatcher is not None:
+            await self._dispatcher.flush()
+
+    async def aclose(self) -> None:
+        """Flush and stop background post-hook dispatch (app shutdown)."""
+        if self._dispatcher is not None:
+            await self._dispatcher.aclose()
+
+    def pipeline(self, spec: ToolSpec) -> _Pipeline:
+        """The hooks that act on `spec`, compiled on first use.
+
+        A hook is kept for a phase only if it overrides that phase's method
+        and `applies_to(spec)`, so tools don't pay for inherited no-ops.
+        """
+        entry = self._compiled.get(spec.name)
+        if entry is not None and entry[0] is spec:
+            return entry[1]
+        pipeline = _Pipeline(
+            pre=[h for h in self._pre if _overrides(h, "pre") and h.applies_to(spec)],
+            post=[h for h in self._post if _overrides(h, "post") and h.applies_to(spec)],
+            error=[
+                h for h in self._error if _overrides(h, "on_error") and h.applies_to(spec)
+            ],
+            around=[
+                h for h in self._around if _overrides(h, "around") and h.applies_to(spec)
+            ],
+        )
+        self._compiled[spec.name] = (spec, pipeline)
+        return pipeline
 
     async def run(
         self,
@@ -88,25 +216,62 @@ class HookManager:
         handler: Callable[[Dict[str, Any]], Awaitable[SkillResult]],
     ) -> SkillResult:
         """Execute the full pipeline around `handler`."""
+        pipeline = self.pipeline(spec)
         # Pre-hooks may mutate or validate arguments.
-        for hook in self._pre:
+        for hook in pipeline.pre:
             arguments = await hook.pre(spec, arguments, ctx)
 
+        call = handler
+        for hook in reversed(pipeline.around):
+            call = _wrap(hook, spec, ctx, call)
+
         start = time.perf_counter()
         try:
-            result = await handler(arguments)
+            result = await call(arguments)
         except BaseException as exc:  # noqa: BLE001
-            for hook in self._error:
-                fallback = await hook.on_error(spec, arguments, ctx, exc)
+            for hook in pipeline.error:
+                try:
+                    fallback = await hook.on_error(spec, arguments, ctx, exc)
+                except Exception:  # noqa: BLE001
+                    _LOG.exception(
+                        "error-hook %s failed for tool=%s", type(hook).__name__, spec.name
+                    )
+                    continue
                 if fallback is not None:
-                    duration_ms = (time.perf_counter() - start) * 1000
-                    for post in self._post:
-                        await post.post(spec, arguments, ctx, fallback, duration_ms)
+                    duration_ms = _execution_ms(start, ctx)
+                    await self._run_post(
+                        pipeline, spec, arguments, ctx, fallback, duration_ms
+                    )
                     return fallback
             # No fallback produced — re-raise to let the agent surface the error.
             raise
 
-        duration_ms = (time.perf_counter() - start) * 1000
-        for hook in self._post:
-            await hook.post(spec, arguments, ctx, result, duration_ms)
+        duration_ms = _execution_ms(start, ctx)
+        await self._run_post(pipeline, spec, arguments, ctx, result, duration_ms)
         return result
+
+    async def _run_post(
+        self,
+        pipeline: _Pipeline,
+        spec: ToolSpec,
+        arguments: Dict[str, Any],
+        ctx: SkillContext,
+        result: SkillResult,
+        duration_ms: float,
+    ) -> None:
+        if not pipeline.post:
+            return
+        # Deferred observers read the completion time from here, not the clock.
+        ctx.metadata["finished_at"] = time.time()
+        for hook in pipeline.post:
+            if not hook.blocking and self._dispatcher is not None:
+                await self._dispatcher.submit(
+                    hook, spec, arguments, ctx, result, duration_ms
+                )
+                continue
+            try:
+                await hook.post(spec, arguments, ctx, result, duration_ms)
+            except Exception:  # noqa: BLE001
+                _LOG.exception(
+                    "post-hook %s failed for tool=%s", type(hook).__name__, spec.name
+                )
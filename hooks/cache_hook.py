@@ -0,0 +1,144 @@
+"""Around-hook: reuse successful results of skills that declare a `CachePolicy`.
+
+Tiers, checked in order:
+
+  1. an in-process LRU with per-entry TTL (`utils.cache.TTLCache`);
+  2. optionally Redis (an async client, e.g. `data.chat_history.get_redis()`),
+     shared across workers. A Redis hit also warms the local tier.
+
+Only successful results are stored, and only for tools whose spec carries
+a `CachePolicy`: `applies_to` keeps the hook out of every other tool's
+pipeline. Redis is best-effort — a Redis error is logged and the call
+proceeds as a miss. Cached answers carry ``metadata["cache_hit"] = True``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections import defaultdict
+from dataclasses import asdict, replace
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from hooks.base import Hook
+from mcp.registry import ToolSpec
+from skills.base import SkillContext, SkillResult
+from utils.cache import MISSING, TTLCache
+
+_LOG = logging.getLogger("essales.cache")
+
+
+class ResultCacheHook(Hook):
+    """Serve repeated calls of cacheable tools without running the skill.
+
+    Args:
+        max_entries: size of the in-process LRU tier.
+        redis: optional async Redis client for the shared tier.
+        key_prefix: namespace for Redis keys.
+        metrics: optional `MetricsHook`-like sink for hit/miss counters.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        *,
+        redis: Optional[Any] = None,
+        key_prefix: str = "essales:toolcache:",
+        metrics: Optional[Any] = None,
+    ):
+        self._local: TTLCache[SkillResult] = TTLCache(max_entries)
+        self._redis = redis
+        self._prefix = key_prefix
+        self._metrics = metrics
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0}
+        )
+
+    def applies_to(self, spec: ToolSpec) -> bool:
+        return spec.cache is not None
+
+    async def around(
+        self,
+        spec: ToolSpec,
+        arguments: Dict[str, Any],
+        ctx: SkillContext,
+        call_next: Callable[[Dict[str, Any]], Awaitable[SkillResult]],
+    ) -> SkillResult:
+        policy = spec.cache
+        if policy is None:
+            return await call_next(arguments)
+        key = self.cache_key(spec, arguments)
+
+        cached = self._local.get(key)
+        if cached is MISSING and self._redis is not None:
+            cached = await self._redis_get(key)
+            if cached is not MISSING:
+                self._local.set(key, cached, policy.ttl_s)
+        if cached is not MISSING:
+            self._count(spec.name, "hits")
+            return replace(cached, metadata={**cached.metadata, "cache_hit": True})
+
+        self._count(spec.name, "misses")
+        result = await call_next(arguments)
+        if result.success:
+            self._local.set(key, result, policy.ttl_s)
+            if self._redis is not None:
+                await self._redis_set(key, result, policy.ttl_s)
+        return result
+
+    def cache_key(self, spec: ToolSpec, arguments: Dict[str, Any]) -> str:
+        policy = spec.cache
+        assert policy is not None
+        fields = policy.key_fields or sorted(arguments)
+        values = {}
+        for name in fields:
+            value = arguments.get(name)
+            if policy.normalize and isinstance(value, str):
+                value = " ".join(value.split()).lower()
+            values[name] = value
+        return f"{spec.name}:{json.dumps(values, sort_keys=True, default=str)}"
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-tool hits, misses and hit rate."""
+        out: Dict[str, Dict[str, Any]] = {}
+        for tool, counts in self._stats.items():
+            total = counts["hits"] + counts["misses"]
+            out[tool] = {
+                **counts,
+                "hit_rate": round(counts["hits"] / total, 3) if total else 0.0,
+            }
+        return out
+
+    def invalidate(self, spec: ToolSpec, arguments: Dict[str, Any]) -> None:
+        """Drop the local entry for one call (Redis entries age out by TTL)."""
+        self._local.delete(self.cache_key(spec, arguments))
+
+    def _count(self, tool: str, outcome: str) -> None:
+        self._stats[tool][outcome] += 1
+        if self._metrics is not None:
+            self._metrics.incr(f"result_cache_{outcome}", labels={"tool": tool})
+
+    async def _redis_get(self, key: str) -> Any:
+        try:
+            raw = await self._redis.get(self._prefix + key)  # type: ignore[union-attr]
+        except Exception:  # noqa: BLE001 — the cache must never fail a call
+            _LOG.warning("result cache: redis get failed", exc_info=True)
+            return MISSING
+        if raw is None:
+            return MISSING
+        try:
+            return SkillResult(**json.loads(raw))
+        except (TypeError, ValueError):
+            return MISSING
+
+    async def _redis_set(self, key: str, result: SkillResult, ttl_s: float) -> None:
+        try:
+            payload = json.dumps(asdict(result))
+        except (TypeError, ValueError):
+            return  # output isn't JSON-serializable; keep it local-only
+        try:
+            await self._redis.set(  # type: ignore[union-attr]
+                self._prefix + key, payload, ex=max(1, int(ttl_s))
+            )
+        except Exception:  # noqa: BLE001
+            _LOG.warning("result cache: redis set failed", exc_info=True)
@@ -0,0 +1,259 @@
+"""Around-hook: per-tool circuit breaker with budgeted, jittered retries.
+
+When a dependency (OpenAI, Blob storage, ...) degrades, retrying every call
+makes each turn wait on doomed attempts and adds load to the struggling
+service. `CircuitBreakerHook` keeps state per tool:
+
+  * **closed** — calls go through. `failure_threshold` consecutive failures
+    open the circuit.
+  * **open** — calls fail fast with a structured `SkillResult` error,
+    without running the skill, for `reset_timeout_s`.
+  * **half-open** — after the timeout, up to `half_open_max_calls` trial
+    calls go through; a success closes the circuit, a failure re-opens it.
+
+A failure is an exception or an unsuccessful `SkillResult` (the skills in
+this repo convert dependency errors into the latter). A cancelled call is
+not: the caller gave up, the tool didn't fail. Retryable failures —
+`retry_on` exceptions, or results flagged ``metadata["retryable"]`` — are
+retried with exponential backoff and full jitter, but only while the
+tool's `RetryBudget` allows it, so retries stay a bounded fraction of
+traffic even when everything is failing. No retry is attempted once the
+backoff would run past the turn deadline (`SkillContext.deadline`).
+
+Breaker state is reported to the metrics hook: a ``circuit_state`` entry in
+`MetricsHook.snapshot()` and a ``circuit_open_<tool>`` gauge.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type
+
+from hooks.base import Hook
+from mcp.registry import ToolSpec
+from skills.base import SkillContext, SkillResult
+
+_LOG = logging.getLogger("essales.circuit")
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+def backoff_delay(
+    attempt: int,
+    *,
+    base_s: float = 0.1,
+    cap_s: float = 2.0,
+    rng: Callable[[], float] = random.random,
+) -> float:
+    """Exponential backoff with full jitter for retry number `attempt` (1-based)."""
+    return rng() * min(cap_s, base_s * (2 ** (attempt - 1)))
+
+
+class RetryBudget:
+    """Caps retries at a fraction of calls (token bucket).
+
+    Every call deposits `ratio` tokens (up to `max_tokens`); every retry
+    spends one. `min_tokens` lets a quiet tool still retry occasionally.
+    """
+
+    def __init__(self, ratio: float = 0.2, *, min_tokens: float = 3.0, max_tokens: float = 10.0):
+        self._ratio = ratio
+        self._max = max_tokens
+        self._tokens = min_tokens
+
+    def record_call(self) -> None:
+        self._tokens = min(self._max, self._tokens + self._ratio)
+
+    def try_spend(self) -> bool:
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+
+@dataclass
+class _Breaker:
+    budget: RetryBudget
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    trials: int = 0
+
+
+class CircuitBreakerHook(Hook):
+    """Fail fast on tools that keep failing; retry the rest within budget.
+
+    Args:
+        failure_threshold: consecutive failures that open a circuit.
+        reset_timeout_s: how long a circuit stays open before a trial call.
+        half_open_max_calls: concurrent trial calls allowed while half-open.
+        max_retries: retries per call, budget permitting.
+        retry_on: exception types considered transient.
+        retry_ratio: retry budget as a fraction of calls, per tool.
+        backoff_base_s / backoff_cap_s: exponential backoff parameters.
+        metrics: optional `MetricsHook` to report breaker state to.
+        clock / sleep / rng: injectable for tests.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout_s: float = 30.0,
+        half_open_max_calls: int = 1,
+        max_retries: int = 2,
+        retry_on: Tuple[Type[BaseException], ...] = (TimeoutError, ConnectionError),
+        retry_ratio: float = 0.2,
+        backoff_base_s: float = 0.1,
+        backoff_cap_s: float = 2.0,
+        metrics: Optional[Any] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        rng: Callable[[], float] = random.random,
+    ):
+        self._threshold = failure_threshold
+        self._reset_timeout_s = reset_timeout_s
+        self._half_open_max = half_open_max_calls
+        self._max_retries = max_retries
+        self._retry_on = retry_on
+        self._retry_ratio = retry_ratio
+        self._backoff = (backoff_base_s, backoff_cap_s)
+        self._metrics = metrics
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = rng
+        self._breakers: Dict[str, _Breaker] = {}
+
+    def state(self, tool: str) -> CircuitState:
+        breaker = self._breakers.get(tool)
+        return breaker.state if breaker else CircuitState.CLOSED
+
+    async def around(
+        self,
+        spec: ToolSpec,
+        arguments: Dict[str, Any],
+        ctx: SkillContext,
+        call_next: Callable[[Dict[str, Any]], Awaitable[SkillResult]],
+    ) -> SkillResult:
+        breaker = self._breaker(spec.name)
+        if not self._admit(spec.name, breaker):
+            retry_in = max(0.0, breaker.opened_at + self._reset_timeout_s - self._clock())
+            return SkillResult(
+                success=False,
+                error=(
+                    f"{spec.name} is temporarily unavailable after repeated "
+                    f"failures; try again in {retry_in:.0f}s."
+                ),
+                metadata={"circuit": CircuitState.OPEN.value, "retry_in_s": retry_in},
+            )
+        breaker.budget.record_call()
+
+        attempt = 0
+        while True:
+            try:
+                result = await call_next(arguments)
+                if "rejected_by" in result.metadata:
+                    # Shed by a bulkhead: says nothing about the tool's health.
+                    self._release_trial(breaker)
+                    return result
+                retryable = not result.success and bool(result.metadata.get("retryable"))
+                failed, error = not result.success, None
+            except self._retry_on as exc:
+                failed, retryable, error = True, True, exc
+            except asyncio.CancelledError:
+                # The caller gave up (turn deadline, disconnect): says nothing
+                # about the tool's health, but frees a half-open trial slot.
+                self._release_trial(breaker)
+                raise
+            except BaseException:
+                self._on_failure(spec.name, breaker)
+                raise
+
+            if not failed:
+                self._on_success(spec.name, breaker)
+                return result
+            delay = backoff_delay(
+                attempt + 1, base_s=self._backoff[0], cap_s=self._backoff[1], rng=self._rng
+            )
+            remaining = ctx.remaining_s()
+            if (
+                retryable
+                and attempt < self._max_retries
+                and breaker.state == CircuitState.CLOSED
+                and (remaining is None or remaining > delay)
+                and breaker.budget.try_spend()
+            ):
+                attempt += 1
+                _LOG.warning(
+                    '{"event":"tool_retry","tool":"%s","attempt":%s,"delay_s":%.3f}',
+                    spec.name,
+                    attempt,
+                    delay,
+                )
+                await self._sleep(delay)
+                continue
+            self._on_failure(spec.name, breaker)
+            if error is not None:
+                raise error
+            return result
+
+    # -- state machine ------------------------------------------------------------
+
+    def _breaker(self, tool: str) -> _Breaker:
+        breaker = self._breakers.get(tool)
+        if breaker is None:
+            breaker = self._breakers[tool] = _Breaker(RetryBudget(self._retry_ratio))
+        return breaker
+
+    def _admit(self, tool: str, breaker: _Breaker) -> bool:
+        if breaker.state == CircuitState.OPEN:
+            if self._clock() - breaker.opened_at < self._reset_timeout_s:
+                return False
+            self._transition(tool, breaker, CircuitState.HALF_OPEN)
+        if breaker.state == CircuitState.HALF_OPEN:
+            if breaker.trials >= self._half_open_max:
+                return False
+            breaker.trials += 1
+        return True
+
+    def _release_trial(self, breaker: _Breaker) -> None:
+        if breaker.state == CircuitState.HALF_OPEN and breaker.trials:
+            breaker.trials -= 1
+
+    def _on_success(self, tool: str, breaker: _Breaker) -> None:
+        breaker.failures = 0
+        if breaker.state != CircuitState.CLOSED:
+            self._transition(tool, breaker, CircuitState.CLOSED)
+
+    def _on_failure(self, tool: str, breaker: _Breaker) -> None:
+        breaker.failures += 1
+        if breaker.state == CircuitState.HALF_OPEN or breaker.failures >= self._threshold:
+            breaker.opened_at = self._clock()
+            self._transition(tool, breaker, CircuitState.OPEN)
+
+    def _transition(self, tool: str, breaker: _Breaker, state: CircuitState) -> None:
+        if breaker.state != state:
+            _LOG.warning(
+                '{"event":"circuit_%s","tool":"%s","failures":%s}',
+                state.value,
+                tool,
+                breaker.failures,
+            )
+        breaker.state = state
+        breaker.trials = 0
+        if state == CircuitState.CLOSED:
+            breaker.failures = 0
+        if self._metrics is not None:
+            self._metrics.annotate(tool, "circuit_state", state.value)
+            self._metrics.set_gauge(
+                "circuit_open", int(state == CircuitState.OPEN), labels={"tool": tool}
+            )
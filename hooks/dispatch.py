@@ -0,0 +1,156 @@
+"""Background dispatch for non-blocking post-hooks.
+
+Post-hooks are observers: the caller doesn't need their outcome, only the
+`SkillResult`. Hooks that declare `blocking = False` (audit logging,
+metrics) can therefore run after the result has been handed back, on a
+bounded queue drained by a few worker tasks, instead of adding their cost
+to every tool call.
+
+The queue is bounded, and when it's full `QueuePolicy` decides what happens:
+
+  * ``DROP`` — discard the observation and count it (`post_hooks_dropped`).
+    Tool latency never depends on observer throughput.
+  * ``BLOCK`` — the caller waits for room (backpressure). No observation is
+    ever lost, at the cost of tool latency when observers fall behind.
+
+`flush()` waits for everything queued so far; `aclose()` flushes and stops
+the workers, and belongs in the application's shutdown path.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+from mcp.registry import ToolSpec
+from skills.base import SkillContext, SkillResult
+
+_LOG = logging.getLogger("essales.hooks")
+
+_PostCall = Tuple[Any, ToolSpec, Dict[str, Any], SkillContext, SkillResult, float]
+
+
+class QueuePolicy(str, Enum):
+    """What `BackgroundDispatcher.submit` does when the queue is full."""
+
+    DROP = "drop"
+    BLOCK = "block"
+
+
+class BackgroundDispatcher:
+    """Bounded queue + worker tasks running post-hooks off the call path.
+
+    Args:
+        max_queue: most pending post-hook calls.
+        policy: behaviour when the queue is full.
+        workers: concurrent worker tasks draining the queue.
+        metrics: optional `MetricsHook`-like sink; receives the
+            `post_hook_queue_depth` gauge and `post_hooks_dropped` counter.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_queue: int = 1000,
+        policy: QueuePolicy = QueuePolicy.DROP,
+        workers: int = 1,
+        metrics: Optional[Any] = None,
+    ):
+        self._max_queue = max_queue
+        self._policy = QueuePolicy(policy)
+        self._worker_count = max(1, workers)
+        self._metrics = metrics
+        self._queue: Optional["asyncio.Queue[_PostCall]"] = None
+        self._workers: List["asyncio.Task[None]"] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.dropped = 0
+        self.processed = 0
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queue_depth": self.depth,
+            "dropped": self.dropped,
+            "processed": self.processed,
+        }
+
+    async def submit(
+        self,
+        hook: Any,
+        spec: ToolSpec,
+        arguments: Dict[str, Any],
+        ctx: SkillContext,
+        result: SkillResult,
+        duration_ms: float,
+    ) -> bool:
+        """Queue one `hook.post(...)` call; False if it was dropped."""
+        queue = self._ensure_started()
+        item = (hook, spec, arguments, ctx, result, duration_ms)
+        if self._policy == QueuePolicy.BLOCK:
+            await queue.put(item)
+        else:
+            try:
+                queue.put_nowait(item)
+            except asyncio.QueueFull:
+                self.dropped += 1
+                if self._metrics is not None:
+                    self._metrics.incr("post_hooks_dropped")
+                _LOG.warning(
+                    '{"event":"post_hook_dropped","hook":"%s","tool":"%s"}',
+                    type(hook).__name__,
+                    spec.name,
+                )
+                return False
+        self._report_depth()
+        return True
+
+    async def flush(self) -> None:
+        """Wait until every queued post-hook call has run."""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def aclose(self) -> None:
+        """Flush, then stop the workers. Safe to call more than once."""
+        await self.flush()
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        self._loop = None
+
+    def _ensure_started(self) -> "asyncio.Queue[_PostCall]":
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            # First use, or the previous loop is gone (e.g. between tests).
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self._max_queue)
+            self._workers = [
+                loop.create_task(self._worker()) for _ in range(self._worker_count)
+            ]
+        return self._queue
+
+    async def _worker(self) -> None:
+        queue = self._queue
+        assert queue is not None
+        while True:
+            hook, spec, arguments, ctx, result, duration_ms = await queue.get()
+            try:
+                await hook.post(spec, arguments, ctx, result, duration_ms)
+            except Exception:  # noqa: BLE001
+                _LOG.exception(
+                    "post-hook %s failed for tool=%s", type(hook).__name__, spec.name
+                )
+            finally:
+                self.processed += 1
+                queue.task_done()
+                self._report_depth()
+
+    def _report_depth(self) -> None:
+        if self._metrics is not None:
+            self._metrics.set_gauge("post_hook_queue_depth", self.depth)
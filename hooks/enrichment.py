@@ -16,12 +16,16 @@ class SessionEnrichmentHook(Hook):
     malformed tool calls without each skill having to re-implement the check.
     """
 
+    def applies_to(self, spec: ToolSpec) -> bool:
+        return "user_message" in spec.input_schema.get("properties", {})
+
     async def pre(
         self, spec: ToolSpec, arguments: Dict[str, Any], ctx: SkillContext
     ) -> Dict[str, Any]:
-        if "user_message" in spec.input_schema.get("properties", {}):
-            if not arguments.get("user_message"):
-                fallback = ctx.metadata.get("original_user_message")
-                if fallback:
-                    arguments["user_message"] = fallback
+        # `applies_to` already limits this to tools taking `user_message`;
+        # the check stays so the hook is correct when called directly.
+        if self.applies_to(spec) and not arguments.get("user_message"):
+            fallback = ctx.metadata.get("original_user_message")
+            if fallback:
+                arguments["user_message"] = fallback
         return arguments
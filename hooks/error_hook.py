@@ -1,4 +1,9 @@
-"""Error-hook: bounded retry + graceful fallback result."""
+"""Error-hook: bounded retry + graceful fallback result.
+
+Retries back off exponentially with full jitter (`backoff_delay`), so a
+burst of failing calls doesn't retry in lockstep. For per-tool failure
+tracking and fail-fast behaviour, pair it with `CircuitBreakerHook`.
+"""
 
 from __future__ import annotations
 
@@ -7,6 +12,7 @@ import logging
 from typing import Any, Dict, Optional, Tuple, Type
 
 from hooks.base import Hook
+from hooks.circuit_breaker import backoff_delay
 from mcp.registry import ToolSpec
 from skills.base import SkillContext, SkillResult
 
@@ -24,8 +30,13 @@ class RetryAndFallbackHook(Hook):
         max_retries: int = 1,
         retry_on: Tuple[Type[BaseException], ...] = (TimeoutError, ConnectionError),
         logger_name: str = "essales.errors",
+        *,
+        backoff_base_s: float = 0.1,
+        backoff_cap_s: float = 2.0,
     ):
         self._max_retries = max_retries
+        self._backoff_base_s = backoff_base_s
+        self._backoff_cap_s = backoff_cap_s
         self._retry_on = retry_on
         self._logger = logging.getLogger(logger_name)
 
@@ -39,14 +50,24 @@ class RetryAndFallbackHook(Hook):
         if isinstance(exc, self._retry_on):
             for attempt in range(1, self._max_retries + 1):
                 try:
-                    await asyncio.sleep(0.1 * attempt)
+                    await asyncio.sleep(
+                        backoff_delay(
+                            attempt,
+                            base_s=self._backoff_base_s,
+                            cap_s=self._backoff_cap_s,
+                        )
+                    )
                     self._logger.warning(
                         "tool=%s retry=%s after=%s", spec.name, attempt, type(exc).__name__
                     )
                     return await spec.skill.invoke(arguments, ctx)
-                except BaseException as retry_exc:  # noqa: BLE001
+                except Exception as retry_exc:  # noqa: BLE001
                     exc = retry_exc
 
+        if not isinstance(exc, Exception):
+            # Cancellation (and interpreter exits) must keep propagating;
+            # only errors become a failed result.
+            raise exc
         # Out of retries (or non-retryable) — convert to graceful failure.
         self._logger.exception("tool=%s unrecoverable error", spec.name)
         return SkillResult(
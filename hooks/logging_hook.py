@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 from typing import Any, Dict
 
 from hooks.base import Hook
@@ -16,11 +17,20 @@ class AuditLogHook(Hook):
 
     Captures: tool name, session id, correlation id, argument keys (not
     values, to avoid leaking PII unless explicitly enabled), success flag,
-    duration, and error string. The audit stream is the backbone of the
+    start time, duration, and error string. Calls dispatched by the agent
+    also carry their `turn_id` and how many calls of that turn were in
+    flight when they started, so overlap between parallel tool calls can be
+    read straight off the log; calls that waited for a bulkhead slot carry
+    `queue_wait_ms`. The audit stream is the backbone of the
     observability story — anything richer (traces, metrics) can attach to
     the same records.
+
+    Non-blocking: with a background dispatcher configured the record is
+    written after the result has gone back to the caller.
     """
 
+    blocking = False
+
     def __init__(
         self, logger_name: str = "essales.audit", log_argument_values: bool = False
     ):
@@ -41,9 +51,15 @@ class AuditLogHook(Hook):
             "session_id": ctx.session_id,
             "correlation_id": ctx.correlation_id,
             "success": result.success,
+            "started_at": round(
+                ctx.metadata.get("finished_at", time.time()) - duration_ms / 1000, 3
+            ),
             "duration_ms": round(duration_ms, 2),
             "arg_keys": sorted(arguments.keys()),
         }
+        for key in ("turn_id", "concurrent_calls", "queue_wait_ms"):
+            if key in ctx.metadata:
+                record[key] = ctx.metadata[key]
         if self._log_values:
             # Truncate to keep lines small. JSON dump swallows non-serializable.
             record["arguments"] = {
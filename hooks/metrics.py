@@ -1,25 +1,112 @@
 """Post-hook: simple in-memory metrics (success/failure counts, latency buckets).
 
+Latencies go into one log-bucketed histogram per tool
+(`observability.histogram`), so memory stays constant however long the
+worker runs, recording is O(1), and `snapshot()` reports p50/p90/p99
+alongside mean and max. Time spent queued behind a bulkhead is recorded in
+a separate histogram (`*_queue_wait_ms`), so it doesn't skew latency. Pass `window_s` to report latency over a sliding
+time window instead of the process lifetime (counts stay cumulative).
+
+Besides per-tool invocation stats, the hook doubles as the process's small
+metrics registry: other components (e.g. the agent's fast path) report
+named counters and gauges through `incr` / `set_gauge`, and per-tool
+state (e.g. circuit-breaker state) through `annotate`. Per-tool counters
+and gauges pass ``labels={"tool": name}`` instead of baking the tool into
+the metric name, so they render as one series per tool
+(``essales_result_cache_hits_total{tool="x"}``).
+
 Kept minimal and dependency-free; swap the backend for Prometheus/OTLP when
 the real observability stack is wired up.
 """
 
 from __future__ import annotations
 
+import time
 from collections import defaultdict
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 from hooks.base import Hook
 from mcp.registry import ToolSpec
+from observability.histogram import LogHistogram, SlidingHistogram
 from skills.base import SkillContext, SkillResult
 
+_PERCENTILES = (("p50", 0.5), ("p90", 0.9), ("p99", 0.99))
+
+#: Label pairs of one labelled series, sorted by label name.
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
 
 class MetricsHook(Hook):
-    def __init__(self) -> None:
+    blocking = False
+
+    def __init__(
+        self,
+        *,
+        window_s: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self._counts: Dict[str, Dict[str, int]] = defaultdict(
             lambda: {"success": 0, "failure": 0}
         )
-        self._latencies_ms: Dict[str, List[float]] = defaultdict(list)
+        if window_s:
+            self._latencies_ms: Dict[str, Union[LogHistogram, SlidingHistogram]] = (
+                defaultdict(lambda: SlidingHistogram(window_s, clock=clock))
+            )
+        else:
+            self._latencies_ms = defaultdict(LogHistogram)
+        # Bulkhead queue waits, kept apart from execution latency.
+        self._queue_wait_ms: Dict[str, LogHistogram] = defaultdict(LogHistogram)
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._gauges: Dict[str, float] = {}
+        self._annotations: Dict[str, Dict[str, Any]] = defaultdict(dict)
+        self._labelled_counters: Dict[str, Dict[Labels, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        self._labelled_gauges: Dict[str, Dict[Labels, float]] = defaultdict(dict)
+
+    def incr(
+        self, name: str, amount: float = 1, *, labels: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Add `amount` to a named counter (one series per `labels`, if given)."""
+        if labels:
+            self._labelled_counters[name][_labels(labels)] += amount
+        else:
+            self._counters[name] += amount
+
+    def set_gauge(
+        self, name: str, value: float, *, labels: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Record the latest value of a named gauge (one series per `labels`, if given)."""
+        if labels:
+            self._labelled_gauges[name][_labels(labels)] = value
+        else:
+            self._gauges[name] = value
+
+    def annotate(self, tool: str, key: str, value: Any) -> None:
+        """Attach a per-tool value (e.g. ``circuit_state``) to `snapshot()`."""
+        self._annotations[tool][key] = value
+
+    def counters(self) -> Dict[str, float]:
+        """Unlabelled counters and gauges reported via `incr` / `set_gauge`."""
+        return {**self._counters, **self._gauges}
+
+    def labelled(self) -> Dict[str, Dict[str, Dict[Labels, float]]]:
+        """Labelled series: ``{"counter"|"gauge": {name: {labels: value}}}``."""
+        return {
+            "counter": {name: dict(series) for name, series in self._labelled_counters.items()},
+            "gauge": {name: dict(series) for name, series in self._labelled_gauges.items()},
+        }
+
+    def value(self, name: str, **labels: str) -> float:
+        """Current value of one labelled counter or gauge series (0 if unseen)."""
+        key = _labels(labels)
+        if key in self._labelled_gauges.get(name, {}):
+            return self._labelled_gauges[name][key]
+        return self._labelled_counters.get(name, {}).get(key, 0)
 
     async def post(
         self,
@@ -31,18 +118,39 @@ class MetricsHook(Hook):
     ) -> None:
         bucket = self._counts[spec.name]
         bucket["success" if result.success else "failure"] += 1
-        self._latencies_ms[spec.name].append(duration_ms)
+        self._latencies_ms[spec.name].record(duration_ms)
+        if "queue_wait_ms" in ctx.metadata:
+            self._queue_wait_ms[spec.name].record(ctx.metadata["queue_wait_ms"])
+        if "rejected_by" in result.metadata:
+            self.incr("bulkhead_rejected", labels={"tool": spec.name})
 
     def snapshot(self) -> Dict[str, Dict[str, Any]]:
         out: Dict[str, Dict[str, Any]] = {}
-        for name, counts in self._counts.items():
-            samples = self._latencies_ms.get(name, [])
+        for name in {**self._counts, **self._annotations}:
+            counts = self._counts.get(name) or {"success": 0, "failure": 0}
+            hist = self._latencies_ms[name]
+            if isinstance(hist, SlidingHistogram):
+                hist = hist.merged()
             out[name] = {
                 **counts,
                 "invocations": counts["success"] + counts["failure"],
-                "avg_latency_ms": (
-                    round(sum(samples) / len(samples), 2) if samples else 0.0
-                ),
-                "max_latency_ms": round(max(samples), 2) if samples else 0.0,
+                "avg_latency_ms": round(hist.mean(), 2),
+                "max_latency_ms": round(hist.max or 0.0, 2),
+                **{
+                    f"{label}_latency_ms": round(hist.quantile(q), 2)
+                    for label, q in _PERCENTILES
+                },
+                "latency_sum_ms": round(hist.sum, 2),
+                "latency_count": hist.count,
+                **self._annotations.get(name, {}),
             }
+            waits = self._queue_wait_ms.get(name)
+            if waits is not None:
+                out[name].update(
+                    {
+                        "avg_queue_wait_ms": round(waits.mean(), 2),
+                        "p99_queue_wait_ms": round(waits.quantile(0.99), 2),
+                        "queue_wait_count": waits.count,
+                    }
+                )
         return out
@@ -5,61 +5,94 @@ Boots the agentic assistant:
   2. Instantiates the LLM and domain handlers.
   3. Builds the tool registry (skills + hooks).
   4. Wraps everything in a `SalesAgent` and hands it to the bot.
+
+Startup imports only what every request needs. Skills come from the skill
+catalog and are imported on first call; the handlers behind them are built
+through `Deferred`; the Bot Framework adapter is built on the first `/bot`
+request. `python -m benchmarks.bench_startup` tracks what boot imports.
 """
 
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import os
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
-import uvicorn
-from botbuilder.core import BotFrameworkAdapter, BotFrameworkAdapterSettings, TurnContext
-from botbuilder.schema import Activity
-from fastapi import FastAPI, Request, Response, status
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, Response, status
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from langchain_openai import ChatOpenAI
-
-from agent import SalesAgent, build_registry
-from bot.bot import MyBot
-from config.settings import OPENAI_API_KEY
-from handlers.company import CompanyHandler
-from handlers.opportunity import OpportunityHandler
-from handlers.proposal import ProposalHandler
+from pydantic import BaseModel
+
+from agent import FastPathRouter, SalesAgent, build_runtime
+from config.settings import (
+    AGENT_API_KEYS,
+    FAST_PATH_ENABLED,
+    MCP_HTTP_ENABLED,
+    OPENAI_API_KEY,
+    TURN_DEADLINE_S,
+)
+from data.chat_history import close_redis
+from mcp.jsonrpc import MCPServer
+from mcp.transport import http_router, manifest_response
 from observability.logging import configure_logging, get_logger
+from observability.prometheus import CONTENT_TYPE as PROMETHEUS_CONTENT_TYPE
+from observability.prometheus import render_prometheus
+from utils.auth import api_session_id, parse_api_keys, principal_for
 
 configure_logging(level=logging.INFO)
 _LOG = get_logger("essales.main")
 
 app = FastAPI(title="ES Sales Agentic Assistant")
 
-# Bot Framework credentials (empty strings are fine for local dev).
-app_id = os.getenv("MICROSOFT_APP_ID", "")
-app_password = os.getenv("MICROSOFT_APP_PASSWORD", "")
-adapter = BotFrameworkAdapter(BotFrameworkAdapterSettings(app_id, app_password))
-
 llm = ChatOpenAI(temperature=0, model="gpt-4o", api_key=OPENAI_API_KEY)
 
-# Domain handlers (preserved; now called through the skills layer, not the agent).
-company_handler = CompanyHandler(llm)
-opportunity_handler = OpportunityHandler(llm)
-proposal_handler = ProposalHandler(llm)
 
-registry = build_registry(
-    opportunity_handler=opportunity_handler,
-    company_handler=company_handler,
-    proposal_handler=proposal_handler,
+# Handlers, hooks and metrics are wired as for `python -m mcp`; handlers
+# are imported and built when a tool first needs them.
+runtime = build_runtime(llm)
+metrics, registry = runtime.metrics, runtime.registry
+sales_agent = SalesAgent(
+    llm=llm,
+    registry=registry,
+    fast_path=FastPathRouter() if FAST_PATH_ENABLED else None,
+    metrics=metrics,
 )
-sales_agent = SalesAgent(llm=llm, registry=registry)
-bot = MyBot(sales_agent)
+
+
+@lru_cache(maxsize=None)
+def _bot_adapter() -> Tuple[Any, Any]:
+    """The Bot Framework adapter and bot, built on the first `/bot` request."""
+    from botbuilder.core import BotFrameworkAdapter, BotFrameworkAdapterSettings
+
+    from bot.bot import MyBot
+
+    # Bot Framework credentials (empty strings are fine for local dev).
+    app_id = os.getenv("MICROSOFT_APP_ID", "")
+    app_password = os.getenv("MICROSOFT_APP_PASSWORD", "")
+    adapter = BotFrameworkAdapter(BotFrameworkAdapterSettings(app_id, app_password))
+    return adapter, MyBot(sales_agent)
+
+
+@app.on_event("shutdown")
+async def _shutdown() -> None:
+    await runtime.aclose()  # flush queued audit/metrics records
+    await close_redis()
 
 
 @app.post("/bot")
 async def messages(req: Request):
+    from botbuilder.schema import Activity
+
     try:
+        adapter, bot = _bot_adapter()
         body = await req.json()
         activity = Activity().deserialize(body)
 
-        async def call_bot_logic(turn_context: TurnContext):
+        async def call_bot_logic(turn_context):
             await bot.on_turn(turn_context)
 
         auth_header = req.headers.get("Authorization", "")
@@ -76,10 +109,85 @@ def health_check():
     return {"status": "ok", "service": "ES Sales Agentic Assistant"}
 
 
-@app.get("/agent/tools")
-def list_tools():
-    """Discovery endpoint — MCP-style manifest of available skills."""
-    return registry.get_manifest()
+@app.api_route("/agent/tools", methods=["GET", "HEAD"])
+def list_tools(request: Request):
+    """Discovery endpoint — MCP-style manifest of available skills.
+
+    Served from bytes cached per registry version, with an ETag; clients
+    that send `If-None-Match` get `304` until the tool set changes.
+    """
+    return manifest_response(registry, request.headers.get("if-none-match"))
+
+
+@app.get("/metrics")
+def prometheus_metrics():
+    """Prometheus scrape endpoint: tool counts, latency percentiles, counters."""
+    return PlainTextResponse(
+        render_prometheus(metrics.snapshot(), metrics.counters(), metrics.labelled()),
+        media_type=PROMETHEUS_CONTENT_TYPE,
+    )
+
+
+_API_KEYS = parse_api_keys(AGENT_API_KEYS)
+
+
+def require_api_principal(authorization: Optional[str] = Header(None)) -> str:
+    """The caller named by a valid ``Bearer`` key in `AGENT_API_KEYS`, else 401."""
+    principal = principal_for(authorization, _API_KEYS)
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return principal
+
+
+# JSON-RPC MCP endpoint: other agents call skills directly, without the LLM.
+# It skips the agent entirely, so it is off unless enabled, and keyed.
+if MCP_HTTP_ENABLED:
+    app.include_router(
+        http_router(MCPServer(registry), dependencies=[Depends(require_api_principal)])
+    )
+
+
+class StreamRequest(BaseModel):
+    message: str
+    session_id: str = "api"
+
+
+def _sse(event: str, payload: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
+
+
+@app.post("/agent/stream")
+async def stream_agent(body: StreamRequest, principal: str = Depends(require_api_principal)):
+    """Server-Sent Events view of a turn: token, tool_start, tool_end, final.
+
+    Requires an `AGENT_API_KEYS` key. The session id is namespaced by the
+    caller, so it can't reach a Teams conversation's memory.
+    """
+    session_id = api_session_id(principal, body.session_id)
+    deadline = time.monotonic() + TURN_DEADLINE_S
+
+    async def _events():
+        try:
+            async for event in sales_agent.astream(body.message, session_id, deadline=deadline):
+                yield _sse(event.type, event.as_dict())
+        except Exception:  # noqa: BLE001
+            _LOG.exception("agent stream failed")
+            yield _sse(
+                "error",
+                {
+                    "type": "error",
+                    "text": "Sorry, something went wrong while processing your message.",
+                },
+            )
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 async def test_agent():
@@ -4,9 +4,22 @@ This package implements an in-process, MCP-inspired tool registry so that
 skills are discoverable, have structured inputs/outputs, and can be re-used
 across agents and services. A thin `server` facade additionally speaks an
 MCP-compatible request/response shape (`tools/list` and `tools/call`) so the
-same skills can be exposed to external MCP clients without a rewrite.
+same skills can be exposed to external MCP clients without a rewrite, and
+`jsonrpc` + `transport` serve them as a JSON-RPC 2.0 MCP server over stdio
+(``python -m mcp``) and HTTP (``POST /mcp``).
 """
 
-from mcp.registry import ToolRegistry, ToolSpec
+from mcp.bulkhead import Bulkhead, BulkheadFullError
+from mcp.jsonrpc import MCPServer, MCPSession
+from mcp.registry import DirectToolOutput, ToolRegistry, ToolSpec, ToolTimeoutError
 
-__all__ = ["ToolRegistry", "ToolSpec"]
+__all__ = [
+    "Bulkhead",
+    "BulkheadFullError",
+    "DirectToolOutput",
+    "MCPServer",
+    "MCPSession",
+    "ToolRegistry",
+    "ToolSpec",
+    "ToolTimeoutError",
+]
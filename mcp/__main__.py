@@ -0,0 +1,39 @@
+"""Serve the production skills as an MCP server over stdio.
+
+    python -m mcp
+
+Builds the same handlers, registry and hook pipeline as `main.py`
+(`agent.runtime.build_runtime`), without the bot, and logs to stderr so
+stdout carries only protocol messages.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+
+from langchain_openai import ChatOpenAI
+
+from agent import Runtime, build_runtime
+from config.settings import OPENAI_API_KEY
+from mcp.jsonrpc import MCPServer
+from mcp.transport import run_stdio
+from observability.logging import configure_logging
+
+
+def main() -> None:
+    configure_logging(level=logging.INFO, stream=sys.stderr)
+    llm = ChatOpenAI(temperature=0, model="gpt-4o", api_key=OPENAI_API_KEY)
+    asyncio.run(_serve(build_runtime(llm)))
+
+
+async def _serve(runtime: Runtime) -> None:
+    try:
+        await run_stdio(MCPServer(runtime.registry))
+    finally:
+        await runtime.aclose()  # flush queued audit/metrics records
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Bulkheads: bounded concurrency with a bounded wait queue.
+
+A `Bulkhead` caps how many calls run at once and how many may wait for a
+slot; calls beyond both are rejected immediately instead of piling up. The
+registry keeps one per tool and one per tag that has a limit, so a burst of
+expensive calls (proposal drafting: LLM + PPTX + Blob) exhausts only its
+own slots and never queues in front of cheap interactive lookups.
+
+Rejections raise `BulkheadFullError`, which the registry turns into a
+structured `SkillResult` error the agent can read.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+
+class BulkheadFullError(Exception):
+    """No slot was free and the wait queue was full (or the wait timed out)."""
+
+    def __init__(self, bulkhead: str, reason: str):
+        super().__init__(f"{bulkhead}: {reason}")
+        self.bulkhead = bulkhead
+        self.reason = reason
+
+
+class Bulkhead:
+    """At most `max_concurrent` calls in flight and `max_queue` waiting.
+
+    Args:
+        name: reported in errors and stats (``tool:<name>`` / ``tag:<tag>``).
+        max_concurrent: concurrent calls allowed.
+        max_queue: calls allowed to wait for a slot; 0 rejects as soon as
+            every slot is busy.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int = 0):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be >= 1")
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self._sem = asyncio.Semaphore(max_concurrent)
+        self._active = 0
+        self._waiting = 0
+        self._rejected = 0
+
+    @asynccontextmanager
+    async def slot(self, timeout: Optional[float] = None) -> AsyncIterator[float]:
+        """Hold a slot for the block; yields the time spent waiting (ms).
+
+        Raises `BulkheadFullError` if the queue is full, or if no slot frees
+        up within `timeout` seconds.
+        """
+        start = time.perf_counter()
+        if self._sem.locked():
+            if self._waiting >= self.max_queue:
+                self._rejected += 1
+                raise BulkheadFullError(
+                    self.name, f"{self._active} calls running and the queue is full"
+                )
+            self._waiting += 1
+            try:
+                await asyncio.wait_for(self._sem.acquire(), timeout)
+            except asyncio.TimeoutError:
+                self._rejected += 1
+                raise BulkheadFullError(
+                    self.name, f"no slot freed up within {timeout:.1f}s"
+                ) from None
+            finally:
+                self._waiting -= 1
+        else:
+            await self._sem.acquire()
+        self._active += 1
+        try:
+            yield (time.perf_counter() - start) * 1000
+        finally:
+            self._active -= 1
+            self._sem.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "active": self._active,
+            "waiting": self._waiting,
+            "rejected": self._rejected,
+        }
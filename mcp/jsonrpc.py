@@ -0,0 +1,341 @@
+"""JSON-RPC 2.0 MCP server core (transport-agnostic).
+
+`MCPServer` turns JSON-RPC messages into registry calls and back. It knows
+nothing about sockets or HTTP; `mcp/transport.py` feeds it lines from stdio
+or request bodies from HTTP. Supported methods:
+
+  * ``initialize`` — protocol version negotiation and capabilities;
+  * ``notifications/initialized`` — marks the session ready (no reply);
+  * ``ping``;
+  * ``tools/list`` — the registry manifest;
+  * ``tools/call`` — `ToolRegistry.invoke`, hooks included. Tool failures
+    come back as a result with ``isError: true`` (as MCP specifies), not
+    as JSON-RPC errors; unknown tools and bad params are JSON-RPC errors.
+
+The `tools/list` result is built and serialized once per registry version.
+
+Batches (a JSON array of messages) are answered with an array, in order;
+notifications get no response. A batch holds at most `max_batch` messages.
+Its ``tools/call`` items run through `ToolRegistry.invoke_many`, at most
+`batch_concurrency` at a time; the other methods are answered in order.
+Every request runs with its own `SkillContext`, so concurrent requests on
+one connection don't share state.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from mcp.registry import ToolRegistry
+from skills.base import SkillContext, SkillResult
+
+_LOG = logging.getLogger("essales.mcp")
+
+#: Protocol revisions we speak, newest first.
+PROTOCOL_VERSIONS = ("2025-06-18", "2025-03-26", "2024-11-05")
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+#: Most messages accepted in one batch.
+MAX_BATCH_SIZE = 100
+#: Concurrent `tools/call` items per batch.
+BATCH_MAX_CONCURRENCY = 8
+
+
+class JSONRPCError(Exception):
+    def __init__(self, code: int, message: str, data: Any = None):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.data = data
+
+    def as_dict(self) -> Dict[str, Any]:
+        error: Dict[str, Any] = {"code": self.code, "message": self.message}
+        if self.data is not None:
+            error["data"] = self.data
+        return error
+
+
+@dataclass
+class MCPSession:
+    """Per-connection state (one per stdio stream; one per HTTP request)."""
+
+    transport: str = "stdio"
+    id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    protocol_version: Optional[str] = None
+    client_info: Dict[str, Any] = field(default_factory=dict)
+    initialized: bool = False
+
+
+ContextFactory = Callable[[MCPSession, Any], SkillContext]
+
+
+def _default_context(session: MCPSession, request_id: Any) -> SkillContext:
+    return SkillContext(
+        session_id=f"mcp:{session.id}",
+        correlation_id=f"{session.id}:{request_id}",
+        metadata={"transport": session.transport},
+    )
+
+
+class MCPServer:
+    """Serve a `ToolRegistry` as an MCP server over any transport.
+
+    Args:
+        registry: the tools to expose.
+        name / version: reported as `serverInfo` on `initialize`.
+        ctx_factory: builds the `SkillContext` for one request from the
+            session and the request id.
+        max_batch: most messages in one batch; larger batches are rejected.
+        batch_concurrency: most `tools/call` items of a batch run at once.
+    """
+
+    def __init__(
+        self,
+        registry: ToolRegistry,
+        *,
+        name: str = "essales-assistant",
+        version: str = "1.0.0",
+        ctx_factory: ContextFactory = _default_context,
+        max_batch: int = MAX_BATCH_SIZE,
+        batch_concurrency: int = BATCH_MAX_CONCURRENCY,
+    ):
+        self._registry = registry
+        self._info = {"name": name, "version": version}
+        self._ctx_factory = ctx_factory
+        self._max_batch = max_batch
+        self._batch_concurrency = batch_concurrency
+        # (registry version, tools/list result, its JSON) — rebuilt on change.
+        self._tools_cache: Optional[Tuple[int, Dict[str, Any], bytes]] = None
+
+    async def handle_raw(
+        self, data: Union[bytes, str], session: MCPSession
+    ) -> Optional[bytes]:
+        """Handle one serialized message; returns the serialized reply, if any."""
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError) as exc:
+            reply: Any = _error_response(
+                None, JSONRPCError(PARSE_ERROR, f"Parse error: {exc}")
+            )
+        else:
+            if _is_tools_list(message):
+                # Hot path for polling clients: splice the cached result in.
+                return b'{"jsonrpc":"2.0","id":%s,"result":%s}' % (
+                    json.dumps(message["id"]).encode(),
+                    self._tools_list()[1],
+                )
+            reply = await self.handle(message, session)
+        if reply is None:
+            return None
+        return json.dumps(reply, default=str).encode()
+
+    async def handle(self, message: Any, session: MCPSession) -> Any:
+        """Handle a decoded message or batch; `None` when nothing is owed."""
+        if isinstance(message, list):
+            if not message:
+                return _error_response(
+                    None, JSONRPCError(INVALID_REQUEST, "Empty batch")
+                )
+            if len(message) > self._max_batch:
+                return _error_response(
+                    None,
+                    JSONRPCError(
+                        INVALID_REQUEST, f"Batch too large (max {self._max_batch})"
+                    ),
+                )
+            replies = await self._handle_batch(message, session)
+            return [r for r in replies if r is not None] or None
+        return await self._handle_one(message, session)
+
+    async def _handle_batch(
+        self, batch: List[Any], session: MCPSession
+    ) -> List[Optional[Dict[str, Any]]]:
+        replies: List[Optional[Dict[str, Any]]] = [None] * len(batch)
+        calls: List[Tuple[str, Dict[str, Any], SkillContext]] = []
+        call_slots: List[int] = []
+        for index, item in enumerate(batch):
+            call = self._batched_call(item, session)
+            if call is None:
+                # Anything else, including malformed calls, is answered (or
+                # rejected) the same way as outside a batch.
+                replies[index] = await self._handle_one(item, session)
+            else:
+                calls.append(call)
+                call_slots.append(index)
+
+        results = await self._registry.invoke_many(
+            calls, max_concurrency=self._batch_concurrency
+        )
+        for index, result in zip(call_slots, results):
+            if "id" in batch[index]:
+                replies[index] = {
+                    "jsonrpc": "2.0",
+                    "id": batch[index]["id"],
+                    "result": tool_result(result),
+                }
+        return replies
+
+    def _batched_call(
+        self, message: Any, session: MCPSession
+    ) -> Optional[Tuple[str, Dict[str, Any], SkillContext]]:
+        """`(name, arguments, ctx)` for a well-formed batch `tools/call`, else `None`."""
+        if (
+            not isinstance(message, dict)
+            or message.get("jsonrpc") != "2.0"
+            or message.get("method") != "tools/call"
+        ):
+            return None
+        params = message.get("params") or {}
+        if not isinstance(params, dict):
+            return None
+        try:
+            return self._call_args(params, session, message.get("id"))
+        except JSONRPCError:
+            return None
+
+    async def _handle_one(
+        self, message: Any, session: MCPSession
+    ) -> Optional[Dict[str, Any]]:
+        if not isinstance(message, dict):
+            return _error_response(
+                None, JSONRPCError(INVALID_REQUEST, "Invalid Request")
+            )
+        request_id = message.get("id")
+        is_notification = "id" not in message
+        method = message.get("method")
+        try:
+            if message.get("jsonrpc") != "2.0" or not isinstance(method, str):
+                raise JSONRPCError(INVALID_REQUEST, "Invalid Request")
+            params = message.get("params") or {}
+            if not isinstance(params, dict):
+                raise JSONRPCError(INVALID_PARAMS, "params must be an object")
+            result = await self._dispatch(method, params, session, request_id)
+        except JSONRPCError as exc:
+            return None if is_notification else _error_response(request_id, exc)
+        except Exception as exc:  # noqa: BLE001 — report, keep the connection
+            _LOG.exception("mcp method=%s failed", method)
+            if is_notification:
+                return None
+            return _error_response(request_id, JSONRPCError(INTERNAL_ERROR, str(exc)))
+        if is_notification:
+            return None
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    async def _dispatch(
+        self, method: str, params: Dict[str, Any], session: MCPSession, request_id: Any
+    ) -> Any:
+        if method == "initialize":
+            return self._initialize(params, session)
+        if method == "notifications/initialized":
+            session.initialized = True
+            return None
+        if method == "ping":
+            return {}
+        if method == "tools/list":
+            return self._tools_list()[0]
+        if method == "tools/call":
+            return await self._call_tool(params, session, request_id)
+        raise JSONRPCError(METHOD_NOT_FOUND, f"Method not found: {method}")
+
+    def _tools_list(self) -> Tuple[Dict[str, Any], bytes]:
+        version = self._registry.version
+        if self._tools_cache is None or self._tools_cache[0] != version:
+            manifest = self._registry.get_manifest()
+            result = {"tools": [_tool_entry(tool) for tool in manifest["tools"]]}
+            body = json.dumps(result, default=str).encode()
+            self._tools_cache = (version, result, body)
+        return self._tools_cache[1], self._tools_cache[2]
+
+    def _initialize(self, params: Dict[str, Any], session: MCPSession) -> Dict[str, Any]:
+        requested = params.get("protocolVersion")
+        # Echo the client's version if we speak it, else offer our newest.
+        version = requested if requested in PROTOCOL_VERSIONS else PROTOCOL_VERSIONS[0]
+        session.protocol_version = version
+        session.client_info = params.get("clientInfo") or {}
+        _LOG.info(
+            '{"event":"mcp_initialize","session":"%s","transport":"%s",'
+            '"requested":"%s","version":"%s"}',
+            session.id,
+            session.transport,
+            requested,
+            version,
+        )
+        return {
+            "protocolVersion": version,
+            "capabilities": {"tools": {"listChanged": False}},
+            "serverInfo": self._info,
+        }
+
+    async def _call_tool(
+        self, params: Dict[str, Any], session: MCPSession, request_id: Any
+    ) -> Dict[str, Any]:
+        name, arguments, ctx = self._call_args(params, session, request_id)
+        return tool_result(await self._registry.invoke(name, arguments, ctx))
+
+    def _call_args(
+        self, params: Dict[str, Any], session: MCPSession, request_id: Any
+    ) -> Tuple[str, Dict[str, Any], SkillContext]:
+        name = params.get("name")
+        arguments = params.get("arguments") or {}
+        if not isinstance(name, str) or not isinstance(arguments, dict):
+            raise JSONRPCError(
+                INVALID_PARAMS, "tools/call needs a 'name' and object 'arguments'"
+            )
+        try:
+            self._registry.get(name)
+        except KeyError:
+            raise JSONRPCError(INVALID_PARAMS, f"Unknown tool: {name}") from None
+        return name, arguments, self._ctx_factory(session, request_id)
+
+
+def tool_result(result: SkillResult) -> Dict[str, Any]:
+    """A `SkillResult` as an MCP `tools/call` result."""
+    if not result.success:
+        return {
+            "isError": True,
+            "content": [{"type": "text", "text": result.error or ""}],
+        }
+    output = result.output
+    text = output if isinstance(output, str) else json.dumps(output, default=str)
+    reply: Dict[str, Any] = {
+        "isError": False,
+        "content": [{"type": "text", "text": text}],
+    }
+    if isinstance(output, dict):
+        reply["structuredContent"] = output
+    return reply
+
+
+def _is_tools_list(message: Any) -> bool:
+    return (
+        isinstance(message, dict)
+        and message.get("jsonrpc") == "2.0"
+        and message.get("method") == "tools/list"
+        and "id" in message
+    )
+
+
+def _tool_entry(tool: Dict[str, Any]) -> Dict[str, Any]:
+    entry = {
+        "name": tool["name"],
+        "description": tool["description"],
+        "inputSchema": tool["inputSchema"],
+    }
+    # MCP only allows object output schemas; string-returning tools omit it.
+    if tool["outputSchema"].get("type") == "object":
+        entry["outputSchema"] = tool["outputSchema"]
+    return entry
+
+
+def _error_response(request_id: Any, error: JSONRPCError) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "error": error.as_dict()}
+
@@ -5,7 +5,8 @@ Responsibilities:
   * Invoke a skill by name, with arguments validated against its input
     schema and with the hook pipeline applied automatically.
   * Expose discovery APIs (`list_tools`, `get_manifest`) so the agent —
-    and future external MCP clients — can learn what's available.
+    and future external MCP clients — can learn what's available. The
+    manifest is built and serialized once per registry `version`.
   * Adapt skills into LangChain `Tool` instances for the agent layer.
 
 The registry is deliberately the only place that knows how to *invoke* a
@@ -14,11 +15,33 @@ skill. Hooks live outside skills; skills stay pure.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import logging
+import uuid
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Any, Awaitable, Callable, Dict, List, Optional
-
-from skills.base import Skill, SkillContext, SkillResult
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from mcp.bulkhead import Bulkhead, BulkheadFullError
+from mcp.schema import Validator, compile_validator
+from skills.base import CachePolicy, ReturnDirect, Skill, SkillContext, SkillResult
+from utils.deadline import deadline_scope
+
+_LOG = logging.getLogger("essales.registry")
 
 
 @dataclass
@@ -31,19 +54,165 @@ class ToolSpec:
     output_schema: Dict[str, Any]
     skill: Skill
     tags: List[str] = field(default_factory=list)
+    return_direct: ReturnDirect = ReturnDirect.NEVER
+    cache: Optional[CachePolicy] = None
+    #: Per-call timeout in seconds (`None`: bounded only by the turn deadline).
+    timeout_s: Optional[float] = None
+    #: Argument validator compiled from `input_schema` by `register`.
+    validator: Optional[Validator] = field(default=None, repr=False, compare=False)
+
+    def validate(self, arguments: Dict[str, Any]) -> List[str]:
+        """Errors for `arguments` against `input_schema` (empty if valid)."""
+        if self.validator is None:
+            self.validator = compile_validator(self.input_schema)
+        return self.validator(arguments)
+
+    def is_direct(self, result: SkillResult) -> bool:
+        """Whether `result` may be shown to the user verbatim, ending the turn."""
+        if not result.success or self.return_direct == ReturnDirect.NEVER:
+            return False
+        if self.return_direct == ReturnDirect.ALWAYS:
+            return True
+        return bool(result.metadata.get("return_direct"))
+
+    def budget_s(self, ctx: SkillContext) -> Optional[float]:
+        """Time one call may take: the tool timeout, capped by the turn deadline."""
+        remaining = ctx.remaining_s()
+        if remaining is None:
+            return self.timeout_s
+        if self.timeout_s is None:
+            return remaining
+        return min(self.timeout_s, remaining)
+
+
+@dataclass(frozen=True)
+class _ManifestCache:
+    version: int
+    manifest: Dict[str, Any]
+    body: bytes
+    etag: str
+
+
+class ToolTimeoutError(TimeoutError):
+    """A tool call ran out of time (its own timeout or the turn deadline)."""
+
+
+class DirectToolOutput(str):
+    """Tool output that should end the agent turn as the final reply.
+
+    Returned by tools built with `to_langchain_tools()` when the spec's
+    `return_direct` policy accepts the result. It is a plain `str` to
+    LangChain, so executors that don't know about it simply keep going.
+    """
+
+
+@dataclass
+class InvocationScope:
+    """Per-turn state consulted by cached LangChain tools.
+
+    The LangChain tool set is built once per registry version and shared by
+    every turn, so anything that varies per turn (session id, correlation
+    ids, ...) can't be closed over at build time. Instead the agent binds a
+    scope around each executor run with `invocation_scope`; tool calls made
+    during that run resolve their `SkillContext` from it.
+
+    The scope also bounds how many tool calls of one turn run at once: the
+    model may emit several calls in a single step, which the executor
+    dispatches concurrently. Results of the turn's calls are kept in
+    `results`, so a turn cut short by its deadline can still report them.
+    """
+
+    ctx_factory: Callable[[], SkillContext]
+    max_concurrency: Optional[int] = None
+    turn_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    inflight: int = 0
+    results: List[Tuple[str, SkillResult]] = field(default_factory=list)
+    _semaphore: Optional[asyncio.Semaphore] = field(default=None, repr=False)
+
+    @asynccontextmanager
+    async def dispatch(self) -> AsyncIterator[int]:
+        """Hold one of the turn's concurrency slots; yields the in-flight count."""
+        if self.max_concurrency and self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if self._semaphore is not None:
+            await self._semaphore.acquire()
+        self.inflight += 1
+        try:
+            yield self.inflight
+        finally:
+            self.inflight -= 1
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+
+_CURRENT_SCOPE: ContextVar[Optional[InvocationScope]] = ContextVar(
+    "essales_invocation_scope", default=None
+)
+
+
+@contextmanager
+def invocation_scope(
+    ctx_factory: Callable[[], SkillContext],
+    *,
+    max_concurrency: Optional[int] = None,
+) -> Iterator[InvocationScope]:
+    """Bind per-turn state for tools built by `to_langchain_tools()`.
+
+    Backed by a `ContextVar`, so concurrent turns on the same event loop
+    each see their own scope (asyncio tasks copy the current context).
+    """
+    scope = InvocationScope(ctx_factory=ctx_factory, max_concurrency=max_concurrency)
+    token = _CURRENT_SCOPE.set(scope)
+    try:
+        yield scope
+    finally:
+        _CURRENT_SCOPE.reset(token)
+
+
+def current_scope() -> Optional[InvocationScope]:
+    return _CURRENT_SCOPE.get()
 
 
 class ToolRegistry:
     """Registry + structured invoker for skills."""
 
-    def __init__(self, hook_manager: Optional["HookManager"] = None):  # noqa: F821
+    def __init__(
+        self,
+        hook_manager: Optional["HookManager"] = None,  # noqa: F821
+        *,
+        default_timeout_s: Optional[float] = None,
+    ):
         # Avoid a hard import cycle with hooks/
         self._tools: Dict[str, ToolSpec] = {}
         self._hook_manager = hook_manager
+        self._default_timeout_s = default_timeout_s
+        # Concurrency limits: per tool name and per tag.
+        self._tool_bulkheads: Dict[str, Bulkhead] = {}
+        self._tag_bulkheads: Dict[str, Bulkhead] = {}
+        # Bumped on every registration change so callers can cache derived
+        # artifacts (LangChain tools, compiled agents, the manifest) per version.
+        self._version = 0
+        self._manifest_cache: Optional[_ManifestCache] = None
 
     # -- registration / discovery -------------------------------------------------
 
-    def register(self, skill: Skill, *, tags: Optional[List[str]] = None) -> ToolSpec:
+    def register(
+        self,
+        skill: Skill,
+        *,
+        tags: Optional[List[str]] = None,
+        return_direct: Optional[ReturnDirect] = None,
+        cache: Optional[CachePolicy] = None,
+        timeout_s: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        max_queue: int = 0,
+    ) -> ToolSpec:
+        """Add `skill` to the registry.
+
+        `max_concurrency` caps concurrent calls of this tool, with up to
+        `max_queue` more waiting for a slot; further calls are rejected.
+        Limits shared by every tool with a tag are set with `limit_tag`.
+        """
         if not skill.name:
             raise ValueError(f"Skill {skill!r} must declare a non-empty name")
         if skill.name in self._tools:
@@ -55,10 +224,40 @@ class ToolRegistry:
             output_schema=skill.output_schema,
             skill=skill,
             tags=list(tags or []),
+            return_direct=ReturnDirect(
+                skill.return_direct if return_direct is None else return_direct
+            ),
+            cache=skill.cache if cache is None else cache,
+            timeout_s=next(
+                (t for t in (timeout_s, skill.timeout_s, self._default_timeout_s) if t),
+                None,
+            ),
+            validator=compile_validator(skill.input_schema),
         )
         self._tools[skill.name] = spec
+        if max_concurrency is not None:
+            self._tool_bulkheads[skill.name] = Bulkhead(
+                f"tool:{skill.name}", max_concurrency, max_queue
+            )
+        self._version += 1
         return spec
 
+    def limit_tag(self, tag: str, max_concurrency: int, *, max_queue: int = 0) -> None:
+        """Cap concurrent calls across all tools tagged `tag` (bulkhead)."""
+        self._tag_bulkheads[tag] = Bulkhead(f"tag:{tag}", max_concurrency, max_queue)
+
+    def bulkhead_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Active, waiting and rejected calls per bulkhead."""
+        return {
+            b.name: b.stats()
+            for b in [*self._tool_bulkheads.values(), *self._tag_bulkheads.values()]
+        }
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter, incremented whenever the tool set changes."""
+        return self._version
+
     def list_tools(self) -> List[ToolSpec]:
         return list(self._tools.values())
 
@@ -68,19 +267,44 @@ class ToolRegistry:
         return self._tools[name]
 
     def get_manifest(self) -> Dict[str, Any]:
-        """MCP-style manifest of available tools (JSON-serializable)."""
-        return {
-            "tools": [
-                {
-                    "name": spec.name,
-                    "description": spec.description,
-                    "inputSchema": spec.input_schema,
-                    "outputSchema": spec.output_schema,
-                    "tags": spec.tags,
-                }
-                for spec in self._tools.values()
-            ]
-        }
+        """MCP-style manifest of available tools (JSON-serializable).
+
+        Built once per registry version and shared: treat it as read-only.
+        """
+        return self._manifest().manifest
+
+    def manifest_bytes(self) -> bytes:
+        """The manifest serialized as JSON, cached until the tool set changes."""
+        return self._manifest().body
+
+    @property
+    def manifest_etag(self) -> str:
+        """Strong ETag of `manifest_bytes()`; equal content, equal tag."""
+        return self._manifest().etag
+
+    def _manifest(self) -> "_ManifestCache":
+        cached = self._manifest_cache
+        if cached is None or cached.version != self._version:
+            manifest = {
+                "tools": [
+                    {
+                        "name": spec.name,
+                        "description": spec.description,
+                        "inputSchema": spec.input_schema,
+                        "outputSchema": spec.output_schema,
+                        "tags": spec.tags,
+                    }
+                    for spec in self._tools.values()
+                ]
+            }
+            body = json.dumps(manifest, separators=(",", ":"), default=str).encode()
+            cached = self._manifest_cache = _ManifestCache(
+                version=self._version,
+                manifest=manifest,
+                body=body,
+                etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            )
+        return cached
 
     # -- invocation ---------------------------------------------------------------
 
@@ -90,29 +314,168 @@ class ToolRegistry:
         arguments: Dict[str, Any],
         ctx: SkillContext,
     ) -> SkillResult:
-        """Invoke a tool by name with hook pipeline applied."""
+        """Invoke a tool by name with hook pipeline applied.
+
+        Each call of the skill is bounded by `spec.budget_s(ctx)` and raises
+        `ToolTimeoutError` past it (retries get a fresh, smaller budget). A
+        call made after the turn deadline has passed doesn't run at all.
+
+        Calls of tools under a bulkhead first wait for a slot (at most the
+        same budget); a call that finds the queue full gets a failed
+        `SkillResult` flagged ``metadata["rejected_by"]``. Time spent waiting
+        is reported as ``ctx.metadata["queue_wait_ms"]``, apart from the
+        execution time the hooks measure.
+        """
         spec = self.get(name)
+        ctx.metadata.pop("queue_wait_ms", None)
+        if ctx.deadline is not None and ctx.remaining_s() == 0:
+            _LOG.warning(
+                '{"event":"deadline_exceeded","tool":"%s","session_id":"%s"}',
+                name,
+                ctx.session_id,
+            )
+            return SkillResult(
+                success=False,
+                error=f"{name} was skipped: the turn ran out of time.",
+                metadata={"deadline_exceeded": True},
+            )
+
+        bulkheads = self._bulkheads_for(spec)
 
         async def _run(args: Dict[str, Any]) -> SkillResult:
-            return await spec.skill.invoke(args, ctx)
+            if not bulkheads:
+                return await _execute(spec, args, ctx)
+            async with AsyncExitStack() as slots:
+                try:
+                    for bulkhead in bulkheads:
+                        waited = await slots.enter_async_context(
+                            bulkhead.slot(spec.budget_s(ctx))
+                        )
+                        ctx.metadata["queue_wait_ms"] = (
+                            ctx.metadata.get("queue_wait_ms", 0.0) + waited
+                        )
+                except BulkheadFullError as exc:
+                    _LOG.warning(
+                        '{"event":"bulkhead_rejected","tool":"%s","bulkhead":"%s"}',
+                        name,
+                        exc.bulkhead,
+                    )
+                    return SkillResult(
+                        success=False,
+                        error=(
+                            f"{name} is busy ({exc.reason}); "
+                            "try again shortly or do something else first."
+                        ),
+                        metadata={"rejected_by": exc.bulkhead},
+                    )
+                return await _execute(spec, args, ctx)
 
         if self._hook_manager is None:
             return await _run(arguments)
         return await self._hook_manager.run(spec, arguments, ctx, _run)
 
+    async def invoke_many(
+        self,
+        calls: Sequence[Tuple[str, Dict[str, Any], SkillContext]],
+        *,
+        max_concurrency: int = 8,
+    ) -> List[SkillResult]:
+        """Invoke many `(name, arguments, ctx)` calls; results in call order.
+
+        At most `max_concurrency` calls run at once, each through `invoke`
+        (so hooks, timeouts and bulkheads apply per item). Give every call
+        its own `ctx`: hooks write per-call state into `ctx.metadata`. An
+        exception — an unknown tool name, say — fails only its own item.
+        """
+        results: List[Optional[SkillResult]] = [None] * len(calls)
+        pending = iter(enumerate(calls))
+
+        async def _worker() -> None:
+            for index, (name, arguments, ctx) in pending:
+                try:
+                    results[index] = await self.invoke(name, arguments, ctx)
+                except Exception as exc:  # noqa: BLE001 — confine to this item
+                    _LOG.exception("tool=%s raised in invoke_many", name)
+                    results[index] = SkillResult(
+                        success=False, error=f"{type(exc).__name__}: {exc}"
+                    )
+
+        workers = min(max_concurrency, len(calls))
+        await asyncio.gather(*(_worker() for _ in range(workers)))
+        return results  # type: ignore[return-value]
+
+    def _bulkheads_for(self, spec: ToolSpec) -> List[Bulkhead]:
+        # Always acquired in the same order (tool, then tags sorted), so two
+        # calls can never each hold a slot the other is waiting for.
+        bulkheads = [
+            self._tool_bulkheads[spec.name]
+        ] if spec.name in self._tool_bulkheads else []
+        bulkheads += [
+            self._tag_bulkheads[tag]
+            for tag in sorted(spec.tags)
+            if tag in self._tag_bulkheads
+        ]
+        return bulkheads
+
     # -- LangChain adapter --------------------------------------------------------
 
     def to_langchain_tools(
-        self, ctx_factory: Callable[[], SkillContext]
+        self, ctx_factory: Optional[Callable[[], SkillContext]] = None
     ) -> List[Any]:
         """Adapt each registered skill into a LangChain `StructuredTool`.
 
         `ctx_factory` is a zero-arg callable because a fresh `SkillContext`
         may need to be produced per invocation (e.g. a new correlation id).
+        Results accepted by the spec's `return_direct` policy come back as
+        `DirectToolOutput` so the agent can end the turn on them.
+
+        When `ctx_factory` is omitted, the tools are turn-agnostic: each call
+        resolves its factory from the active `invocation_scope`, which lets
+        the agent build the tool set once and reuse it across turns and
+        sessions, and which caps how many calls of one turn run at once.
+
+        Exceptions escaping `invoke` are turned into an ``ERROR: ...``
+        observation for that call only, so sibling calls dispatched in the
+        same agent step keep running.
         """
         # Local import keeps core registry importable without LangChain.
-        from langchain.tools import StructuredTool
-        from pydantic import create_model, Field
+        try:
+            from langchain.tools import StructuredTool  # type: ignore
+        except ImportError:  # pragma: no cover - langchain >= 1.0
+            from langchain_core.tools import StructuredTool  # type: ignore
+
+        async def _call(tool_name: str, arguments: Dict[str, Any]) -> str:
+            scope = None if ctx_factory is not None else current_scope()
+            if ctx_factory is None and scope is None:
+                raise RuntimeError(
+                    f"Tool '{tool_name}' called outside an invocation_scope()."
+                )
+            try:
+                if scope is None:
+                    result = await self.invoke(tool_name, arguments, ctx_factory())
+                else:
+                    async with scope.dispatch() as inflight:
+                        ctx = scope.ctx_factory()
+                        ctx.metadata.update(
+                            {"turn_id": scope.turn_id, "concurrent_calls": inflight}
+                        )
+                        result = await self.invoke(tool_name, arguments, ctx)
+                    scope.results.append((tool_name, result))
+            except Exception as exc:  # noqa: BLE001 — confine to this call
+                # Sibling calls of the same step run concurrently; one failure
+                # must not cancel them, so it becomes this call's observation.
+                _LOG.exception("tool=%s raised outside the hook pipeline", tool_name)
+                return _result_to_tool_text(
+                    SkillResult(
+                        success=False, error=f"{type(exc).__name__}: {exc}"
+                    )
+                )
+            if self._tools[tool_name].is_direct(result):
+                return DirectToolOutput(
+                    result.metadata.get("display_text")
+                    or _result_to_tool_text(result)
+                )
+            return _result_to_tool_text(result)
 
         tools: List[Any] = []
         for spec in self._tools.values():
@@ -122,8 +485,10 @@ class ToolRegistry:
                 __spec_name: str = spec.name,
                 **kwargs: Any,
             ) -> str:
-                result = await self.invoke(__spec_name, kwargs, ctx_factory())
-                return _result_to_tool_text(result)
+                # The args model fills omitted optionals with None; drop them
+                # so the schema sees them as absent and skill defaults apply.
+                arguments = {k: v for k, v in kwargs.items() if v is not None}
+                return await _call(__spec_name, arguments)
 
             def _sync(__spec_name: str = spec.name, **kwargs: Any) -> str:
                 # StructuredTool requires a sync func even when coroutine is set.
@@ -146,6 +511,22 @@ class ToolRegistry:
 # ---------- helpers ------------------------------------------------------------
 
 
+async def _execute(
+    spec: ToolSpec, arguments: Dict[str, Any], ctx: SkillContext
+) -> SkillResult:
+    """Run the skill itself, bounded by `spec.budget_s(ctx)`."""
+    budget = spec.budget_s(ctx)
+    with deadline_scope(ctx.deadline):
+        if budget is None:
+            return await spec.skill.invoke(arguments, ctx)
+        try:
+            return await asyncio.wait_for(spec.skill.invoke(arguments, ctx), budget)
+        except asyncio.TimeoutError:
+            raise ToolTimeoutError(
+                f"{spec.name} did not finish within {budget:.1f}s"
+            ) from None
+
+
 def _result_to_tool_text(result: SkillResult) -> str:
     """Serialize a SkillResult into what the agent sees as the tool output.
 
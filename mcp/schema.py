@@ -0,0 +1,125 @@
+"""Compiled argument validators for tool input schemas.
+
+`compile_validator(schema)` does the schema analysis once and returns a
+callable that checks one arguments dict, returning human-readable error
+strings (empty when the arguments are valid). The registry compiles one
+per tool at `register` time and keeps it on the `ToolSpec`, so validating
+a call never re-parses the schema.
+
+Three strategies, picked per schema:
+
+  * **flat** — the shape every built-in skill uses: an object whose
+    properties are plain ``string`` / ``number`` / ``integer`` /
+    ``boolean`` (optionally with ``enum``), plus ``required`` and
+    ``additionalProperties``. Checked with a few dict lookups and
+    `isinstance` calls; messages mirror `jsonschema`'s wording.
+  * **jsonschema** — anything richer, via a `Draft202012Validator` built
+    once and reused.
+  * **required-only** — when `jsonschema` isn't installed, a best-effort
+    required-key check so minimal installs keep working.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from jsonschema import Draft202012Validator  # type: ignore
+    _HAS_JSONSCHEMA = True
+except Exception:  # pragma: no cover - optional dependency
+    _HAS_JSONSCHEMA = False
+
+#: `arguments -> [error, ...]`; an empty list means the arguments are valid.
+Validator = Callable[[Dict[str, Any]], List[str]]
+
+_FLAT_TYPES: Dict[str, Tuple[type, ...]] = {
+    "string": (str,),
+    "number": (int, float),
+    "integer": (int,),
+    "boolean": (bool,),
+}
+
+#: Property keywords the flat path understands; annotations are ignored.
+_FLAT_PROPERTY_KEYS = {"type", "enum", "description", "title", "default", "examples"}
+_FLAT_SCHEMA_KEYS = {
+    "type", "properties", "required", "additionalProperties",
+    "description", "title", "$schema",
+}
+
+
+def compile_validator(schema: Dict[str, Any], *, fast_path: bool = True) -> Validator:
+    """Build the cheapest correct validator for `schema`."""
+    if fast_path:
+        flat = _compile_flat(schema)
+        if flat is not None:
+            return flat
+    if _HAS_JSONSCHEMA:
+        return _compile_jsonschema(schema)
+    return _compile_required_only(schema)
+
+
+def _compile_flat(schema: Dict[str, Any]) -> Optional[Validator]:
+    """Return a flat validator, or None if `schema` needs the full engine."""
+    if schema.get("type") != "object" or set(schema) - _FLAT_SCHEMA_KEYS:
+        return None
+    additional = schema.get("additionalProperties", True)
+    if not isinstance(additional, bool):
+        return None
+    props: Dict[str, Tuple[str, Tuple[type, ...], Optional[List[Any]]]] = {}
+    for name, prop in (schema.get("properties") or {}).items():
+        kind = prop.get("type")
+        if kind not in _FLAT_TYPES or set(prop) - _FLAT_PROPERTY_KEYS:
+            return None
+        props[name] = (kind, _FLAT_TYPES[kind], prop.get("enum"))
+    required = list(schema.get("required") or [])
+
+    def _validate(arguments: Dict[str, Any]) -> List[str]:
+        if not isinstance(arguments, dict):
+            return [f"<root>: {arguments!r} is not of type 'object'"]
+        errors: List[str] = []
+        for name in required:
+            if name not in arguments:
+                errors.append(f"<root>: '{name}' is a required property")
+        for name, value in arguments.items():
+            rule = props.get(name)
+            if rule is None:
+                if not additional:
+                    errors.append(
+                        "<root>: Additional properties are not allowed "
+                        f"('{name}' was unexpected)"
+                    )
+                continue
+            kind, types, enum = rule
+            # bool is an int subclass, but JSON Schema keeps them apart.
+            if not isinstance(value, types) or (kind != "boolean" and isinstance(value, bool)):
+                if not (kind == "integer" and isinstance(value, float) and value.is_integer()):
+                    errors.append(f"['{name}']: {value!r} is not of type '{kind}'")
+                    continue
+            if enum is not None and value not in enum:
+                errors.append(f"['{name}']: {value!r} is not one of {enum!r}")
+        return errors
+
+    return _validate
+
+
+def _compile_jsonschema(schema: Dict[str, Any]) -> Validator:
+    validator = Draft202012Validator(schema)
+
+    def _validate(arguments: Dict[str, Any]) -> List[str]:
+        errors = list(validator.iter_errors(arguments))
+        if not errors:
+            return []
+        errors.sort(key=lambda e: list(e.path))
+        return [f"{list(e.path) or '<root>'}: {e.message}" for e in errors]
+
+    return _validate
+
+
+def _compile_required_only(schema: Dict[str, Any]) -> Validator:
+    required = list(schema.get("required") or [])
+
+    def _validate(arguments: Dict[str, Any]) -> List[str]:
+        missing = [r for r in required if r not in arguments]
+        return [f"missing {missing}"] if missing else []
+
+    return _validate
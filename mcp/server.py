@@ -10,24 +10,41 @@ Supported methods:
   * `tools/call` -> { "content": [{ "type": "text", "text": "..." }],
                      "isError": bool }
 
+A JSON-RPC style batch — a list of such requests — returns a list of
+results in the same order. Its `tools/call` items run concurrently through
+`ToolRegistry.invoke_many`, each with its own copy of `ctx`, so N lookups
+cost one round trip instead of N. Batches get the same bounds as
+`MCPServer`: at most `MAX_BATCH_SIZE` items (a larger batch is rejected
+whole, with code -32600) and `BATCH_MAX_CONCURRENCY` calls at a time.
+
 This is intentionally minimal but schema-compatible with the MCP spec's
-shape for those two methods, so a thin adapter can promote it to a real
-MCP server later.
+shape for those two methods. The full JSON-RPC 2.0 server, with stdio and
+HTTP transports, lives in `mcp/jsonrpc.py` and `mcp/transport.py`.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict
+import uuid
+from dataclasses import replace
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+from mcp.jsonrpc import BATCH_MAX_CONCURRENCY, INVALID_REQUEST, MAX_BATCH_SIZE, tool_result
 from mcp.registry import ToolRegistry
 from skills.base import SkillContext
 
 
 async def handle_mcp_request(
-    payload: Dict[str, Any],
+    payload: Union[Dict[str, Any], List[Any]],
     registry: ToolRegistry,
     ctx: SkillContext,
-) -> Dict[str, Any]:
+) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+    if isinstance(payload, list):
+        if len(payload) > MAX_BATCH_SIZE:
+            return _error(
+                f"Batch too large (max {MAX_BATCH_SIZE})", code=INVALID_REQUEST
+            )
+        return await _handle_batch(payload, registry, ctx)
+
     method = payload.get("method")
     params = payload.get("params") or {}
 
@@ -35,29 +52,67 @@ async def handle_mcp_request(
         return registry.get_manifest()
 
     if method == "tools/call":
-        name = params.get("name")
-        arguments = params.get("arguments") or {}
-        if not name:
-            return {
-                "isError": True,
-                "content": [{"type": "text", "text": "Missing 'name' in params."}],
-            }
+        call = _parse_call(params)
+        if isinstance(call, dict):
+            return call
+        name, arguments = call
         result = await registry.invoke(name, arguments, ctx)
-        return {
-            "isError": not result.success,
-            "content": [
-                {
-                    "type": "text",
-                    "text": (result.output if result.success else result.error)
-                    if isinstance(result.output, str) or not result.success
-                    else __import__("json").dumps(result.output, default=str),
-                }
-            ],
-        }
-
-    return {
+        return tool_result(result)
+
+    return _error(f"Unknown method: {method!r}")
+
+
+async def _handle_batch(
+    payload: List[Any], registry: ToolRegistry, ctx: SkillContext
+) -> List[Dict[str, Any]]:
+    responses: List[Optional[Dict[str, Any]]] = [None] * len(payload)
+    calls: List[Tuple[str, Dict[str, Any], SkillContext]] = []
+    call_slots: List[int] = []
+    for index, item in enumerate(payload):
+        if not isinstance(item, dict):
+            responses[index] = _error("Batch items must be request objects.")
+        elif item.get("method") == "tools/call":
+            call = _parse_call(item.get("params") or {})
+            if isinstance(call, dict):
+                responses[index] = call
+            else:
+                calls.append((*call, _item_context(ctx)))
+                call_slots.append(index)
+        else:
+            responses[index] = await handle_mcp_request(  # type: ignore[assignment]
+                item, registry, ctx
+            )
+
+    results = await registry.invoke_many(
+        calls, max_concurrency=BATCH_MAX_CONCURRENCY
+    )
+    for index, result in zip(call_slots, results):
+        responses[index] = tool_result(result)
+    return responses  # type: ignore[return-value]
+
+
+def _item_context(ctx: SkillContext) -> SkillContext:
+    """A per-item copy of the batch's context (hooks write to `metadata`)."""
+    return replace(
+        ctx, correlation_id=str(uuid.uuid4()), metadata=dict(ctx.metadata)
+    )
+
+
+def _parse_call(
+    params: Dict[str, Any],
+) -> Union[Tuple[str, Dict[str, Any]], Dict[str, Any]]:
+    """`(name, arguments)` for a `tools/call`, or the error response."""
+    name = params.get("name")
+    if not name:
+        return _error("Missing 'name' in params.")
+    return name, params.get("arguments") or {}
+
+
+def _error(message: str, *, code: Optional[int] = None) -> Dict[str, Any]:
+    error: Dict[str, Any] = {
         "isError": True,
-        "content": [
-            {"type": "text", "text": f"Unknown method: {method!r}"}
-        ],
+        "content": [{"type": "text", "text": message}],
     }
+    if code is not None:
+        error["code"] = code
+    return error
@@ -0,0 +1,149 @@
+"""Transports for `MCPServer`: newline-delimited stdio and HTTP POST.
+
+stdio follows MCP's framing: one JSON-RPC message (or batch) per line, in
+both directions. Requests on one connection are *pipelined*: each line is
+handled in its own task as soon as it is read, and each reply is written
+when it is ready, so a slow `tools/call` doesn't hold up the ones behind
+it. Clients match replies to requests by `id`. At most `max_inflight`
+requests run at once per connection; beyond that the reader stops
+reading, which pushes back on the client.
+
+HTTP is one POST per message or batch (`http_router`). Replies come back
+in the response body; a body with only notifications gets ``202``. The
+router takes FastAPI `dependencies`, so the app can put it behind auth.
+`manifest_response` serves the registry's pre-serialized manifest with an
+ETag, answering a matching ``If-None-Match`` with ``304``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+from typing import Any, Optional, Sequence, Set
+
+from fastapi import APIRouter, Request, Response
+
+from mcp.jsonrpc import MCPServer, MCPSession
+from mcp.registry import ToolRegistry
+
+_LOG = logging.getLogger("essales.mcp")
+
+#: Longest line accepted on a stream connection.
+MAX_LINE_BYTES = 4 * 1024 * 1024
+
+
+async def serve_stream(
+    server: MCPServer,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    *,
+    max_inflight: int = 64,
+    transport: str = "stdio",
+) -> None:
+    """Serve one connection until the reader hits EOF."""
+    session = MCPSession(transport=transport)
+    slots = asyncio.Semaphore(max_inflight)
+    write_lock = asyncio.Lock()
+    tasks: Set[asyncio.Task] = set()
+
+    async def _respond(line: bytes) -> None:
+        try:
+            reply = await server.handle_raw(line, session)
+            if reply is not None:
+                async with write_lock:
+                    writer.write(reply + b"\n")
+                    await writer.drain()
+        except Exception:  # noqa: BLE001 — one bad request mustn't end the stream
+            _LOG.exception("mcp %s: failed to answer a request", transport)
+        finally:
+            slots.release()
+
+    try:
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:  # line longer than the reader's limit
+                _LOG.error(
+                    "mcp %s: message over %s bytes; closing", transport, MAX_LINE_BYTES
+                )
+                break
+            if not line:
+                break
+            if not line.strip():
+                continue
+            await slots.acquire()
+            task = asyncio.create_task(_respond(line))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+    finally:
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def run_stdio(server: MCPServer, *, max_inflight: int = 64) -> None:
+    """Serve MCP over this process's stdin/stdout (keep logs on stderr)."""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=MAX_LINE_BYTES)
+    await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+    )
+    write_transport, write_protocol = await loop.connect_write_pipe(
+        asyncio.streams.FlowControlMixin, sys.stdout
+    )
+    writer = asyncio.StreamWriter(write_transport, write_protocol, reader, loop)
+    await serve_stream(server, reader, writer, max_inflight=max_inflight)
+
+
+def http_router(
+    server: MCPServer, *, path: str = "/mcp", dependencies: Sequence[Any] = ()
+) -> APIRouter:
+    """A FastAPI router exposing `server` at ``POST {path}``.
+
+    `dependencies` (e.g. ``[Depends(require_api_principal)]``) run before
+    every request, so an auth dependency can reject it with ``401``.
+    """
+    router = APIRouter(dependencies=list(dependencies))
+
+    @router.post(path)
+    async def _mcp(request: Request) -> Response:
+        body = await request.body()
+        reply: Optional[bytes] = await server.handle_raw(
+            body, MCPSession(transport="http")
+        )
+        if reply is None:
+            return Response(status_code=202)
+        return Response(content=reply, media_type="application/json")
+
+    return router
+
+
+#: Response header carrying `ToolRegistry.version`.
+VERSION_HEADER = "X-Registry-Version"
+
+
+def manifest_response(
+    registry: ToolRegistry, if_none_match: Optional[str] = None
+) -> Response:
+    """The tool manifest as a cacheable HTTP response (``304`` if unchanged)."""
+    etag = registry.manifest_etag
+    headers = {
+        "ETag": etag,
+        VERSION_HEADER: str(registry.version),
+        "Cache-Control": "no-cache",  # always revalidate; 304s are cheap
+    }
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=registry.manifest_bytes(),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses weak comparison: ignore W/ prefixes.
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        tag.removeprefix("W/") == etag for tag in candidates
+    )
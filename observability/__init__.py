@@ -1,5 +1,13 @@
-"""Observability helpers (structured logging, audit trail)."""
+"""Observability helpers (structured logging, audit trail, metrics)."""
 
+from observability.histogram import LogHistogram, SlidingHistogram
 from observability.logging import configure_logging, get_logger
+from observability.prometheus import render_prometheus
 
-__all__ = ["configure_logging", "get_logger"]
+__all__ = [
+    "LogHistogram",
+    "SlidingHistogram",
+    "configure_logging",
+    "get_logger",
+    "render_prometheus",
+]
@@ -0,0 +1,151 @@
+"""Constant-memory latency histograms.
+
+`LogHistogram` buckets values on a logarithmic scale: each bucket is a
+fixed factor wider than the previous one, so any value in range is
+recorded in O(1) into a fixed array of counters, and every quantile comes
+back within `relative_error` of the true sample (the same idea as
+DDSketch). Memory depends only on the configured range and accuracy,
+never on how many samples were recorded.
+
+`SlidingHistogram` keeps the last `window_s` seconds only, as a ring of
+`LogHistogram` slices that are recycled as time moves on; queries merge
+the live slices.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import Callable, List, Optional
+
+
+class LogHistogram:
+    """Log-bucketed histogram with bounded relative error.
+
+    Args:
+        min_value: values at or below this share the lowest bucket.
+        max_value: values above this share the highest bucket.
+        relative_error: accuracy target for `quantile`; sets bucket width.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_value: float = 0.01,
+        max_value: float = 3_600_000.0,
+        relative_error: float = 0.02,
+    ):
+        self._min_value = min_value
+        self._gamma = (1 + relative_error) / (1 - relative_error)
+        self._log_gamma = math.log(self._gamma)
+        size = int(math.ceil(math.log(max_value / min_value) / self._log_gamma)) + 2
+        self._buckets: List[int] = [0] * size
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def record(self, value: float) -> None:
+        self._buckets[self._index(value)] += 1
+        self.count += 1
+        self.sum += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Approximate `q`-quantile (0 <= q <= 1); 0.0 when empty."""
+        if not self.count:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = 0
+        for index, n in enumerate(self._buckets):
+            seen += n
+            if seen > rank:
+                # Out-of-range buckets report the observed extreme instead.
+                if index == 0:
+                    return self.min  # type: ignore[return-value]
+                if index == len(self._buckets) - 1:
+                    return self.max  # type: ignore[return-value]
+                value = self._representative(index)
+                return min(max(value, self.min), self.max)  # type: ignore[type-var]
+        return self.max  # type: ignore[return-value]
+
+    def merge(self, other: "LogHistogram") -> None:
+        """Add `other`'s samples (must share this histogram's layout)."""
+        if other._gamma != self._gamma or len(other._buckets) != len(self._buckets):
+            raise ValueError("cannot merge histograms with different layouts")
+        for index, n in enumerate(other._buckets):
+            if n:
+                self._buckets[index] += n
+        self.count += other.count
+        self.sum += other.sum
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def empty_like(self) -> "LogHistogram":
+        clone = LogHistogram.__new__(LogHistogram)
+        clone._min_value = self._min_value
+        clone._gamma = self._gamma
+        clone._log_gamma = self._log_gamma
+        clone._buckets = [0] * len(self._buckets)
+        clone.count, clone.sum, clone.min, clone.max = 0, 0.0, None, None
+        return clone
+
+    def _index(self, value: float) -> int:
+        if value <= self._min_value:
+            return 0
+        index = 1 + int(math.log(value / self._min_value) / self._log_gamma)
+        return min(index, len(self._buckets) - 1)
+
+    def _representative(self, index: int) -> float:
+        # Bucket i covers [min * g^(i-1), min * g^i); this point is within
+        # relative_error of both ends.
+        lower = self._min_value * self._gamma ** (index - 1)
+        return lower * 2 * self._gamma / (self._gamma + 1)
+
+
+class SlidingHistogram:
+    """`LogHistogram` over the last `window_s` seconds.
+
+    The window is split into `slices` sub-histograms; a slice is cleared
+    and reused once it falls out of the window, so expiry is coarse by
+    `window_s / slices` but costs nothing per sample.
+    """
+
+    def __init__(
+        self,
+        window_s: float,
+        *,
+        slices: int = 6,
+        clock: Callable[[], float] = time.monotonic,
+        **histogram_kwargs: float,
+    ):
+        self._slice_s = window_s / slices
+        self._clock = clock
+        self._template = LogHistogram(**histogram_kwargs)
+        self._slices = [self._template.empty_like() for _ in range(slices)]
+        self._epochs = [-1] * slices
+
+    def record(self, value: float) -> None:
+        epoch = int(self._clock() / self._slice_s)
+        pos = epoch % len(self._slices)
+        if self._epochs[pos] != epoch:
+            self._slices[pos] = self._template.empty_like()
+            self._epochs[pos] = epoch
+        self._slices[pos].record(value)
+
+    def merged(self) -> LogHistogram:
+        """One histogram holding every sample still inside the window."""
+        current = int(self._clock() / self._slice_s)
+        out = self._template.empty_like()
+        for epoch, part in zip(self._epochs, self._slices):
+            if current - len(self._slices) < epoch <= current:
+                out.merge(part)
+        return out
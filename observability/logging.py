@@ -10,7 +10,7 @@ from __future__ import annotations
 import json
 import logging
 import sys
-from typing import Any, Dict
+from typing import IO, Any, Dict, Optional
 
 
 class _JSONFormatter(logging.Formatter):
@@ -46,14 +46,20 @@ class _JSONFormatter(logging.Formatter):
         return json.dumps(base, default=str)
 
 
-def configure_logging(level: int = logging.INFO) -> None:
-    """Install the JSON formatter on the root logger (idempotent)."""
+def configure_logging(
+    level: int = logging.INFO, stream: Optional[IO[str]] = None
+) -> None:
+    """Install the JSON formatter on the root logger (idempotent).
+
+    Logs go to stdout unless `stream` says otherwise (the stdio MCP server
+    keeps stdout for protocol messages and logs to stderr).
+    """
     root = logging.getLogger()
     # Avoid stacking handlers across reloads (uvicorn --reload, pytest).
     for handler in list(root.handlers):
         root.removeHandler(handler)
 
-    handler = logging.StreamHandler(sys.stdout)
+    handler = logging.StreamHandler(stream or sys.stdout)
     handler.setFormatter(_JSONFormatter())
     root.addHandler(handler)
     root.setLevel(level)
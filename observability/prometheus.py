@@ -0,0 +1,89 @@
+"""Prometheus text exposition (format 0.0.4) for `MetricsHook` data.
+
+Kept dependency-free: the hook already holds the numbers, this module only
+renders them. Per-tool latency is exposed as a summary (p50/p90/p99 plus
+`_sum` / `_count`), outcomes as a counter, and the named counters/gauges
+reported through `MetricsHook.incr` / `set_gauge` as untyped samples.
+Labelled series (`MetricsHook.labelled()`) render as typed metrics with
+their labels; counters get the conventional ``_total`` suffix.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Optional
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_PREFIX = "essales"
+_QUANTILES = (("0.5", "p50_latency_ms"), ("0.9", "p90_latency_ms"), ("0.99", "p99_latency_ms"))
+
+
+def _metric_name(name: str) -> str:
+    return f"{_PREFIX}_" + re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_prometheus(
+    snapshot: Dict[str, Dict[str, Any]],
+    counters: Dict[str, float],
+    labelled: Optional[Dict[str, Dict[str, Dict[Any, float]]]] = None,
+) -> str:
+    """Render `MetricsHook.snapshot()` + `counters()` (+ `labelled()`) as Prometheus text."""
+    lines: List[str] = [
+        f"# HELP {_PREFIX}_tool_invocations_total Tool invocations by outcome.",
+        f"# TYPE {_PREFIX}_tool_invocations_total counter",
+    ]
+    for tool, stats in sorted(snapshot.items()):
+        for outcome in ("success", "failure"):
+            lines.append(
+                f'{_PREFIX}_tool_invocations_total{{tool="{_label(tool)}",'
+                f'outcome="{outcome}"}} {stats[outcome]}'
+            )
+
+    lines += [
+        f"# HELP {_PREFIX}_tool_latency_ms Tool latency in milliseconds.",
+        f"# TYPE {_PREFIX}_tool_latency_ms summary",
+    ]
+    for tool, stats in sorted(snapshot.items()):
+        label = f'tool="{_label(tool)}"'
+        for quantile, key in _QUANTILES:
+            lines.append(
+                f'{_PREFIX}_tool_latency_ms{{{label},quantile="{quantile}"}} {stats[key]}'
+            )
+        lines.append(f"{_PREFIX}_tool_latency_ms_sum{{{label}}} {stats['latency_sum_ms']}")
+        lines.append(f"{_PREFIX}_tool_latency_ms_count{{{label}}} {stats['latency_count']}")
+
+    waited = [
+        (tool, stats)
+        for tool, stats in sorted(snapshot.items())
+        if "queue_wait_count" in stats
+    ]
+    if waited:
+        lines += [
+            f"# HELP {_PREFIX}_tool_queue_wait_ms Time tool calls waited for a bulkhead slot.",
+            f"# TYPE {_PREFIX}_tool_queue_wait_ms summary",
+        ]
+    for tool, stats in waited:
+        label = f'tool="{_label(tool)}"'
+        lines.append(
+            f'{_PREFIX}_tool_queue_wait_ms{{{label},quantile="0.99"}} {stats["p99_queue_wait_ms"]}'
+        )
+        lines.append(f"{_PREFIX}_tool_queue_wait_ms_count{{{label}}} {stats['queue_wait_count']}")
+
+    for kind, series in sorted((labelled or {}).items()):
+        for name, samples in sorted(series.items()):
+            metric = _metric_name(name) + ("_total" if kind == "counter" else "")
+            lines.append(f"# TYPE {metric} {kind}")
+            for labels, value in sorted(samples.items()):
+                pairs = ",".join(f'{key}="{_label(val)}"' for key, val in labels)
+                lines.append(f"{metric}{{{pairs}}} {value}")
+
+    for name, value in sorted(counters.items()):
+        metric = _metric_name(name)
+        lines.append(f"# TYPE {metric} untyped")
+        lines.append(f"{metric} {value}")
+    return "\n".join(lines) + "\n"
@@ -9,6 +9,6 @@ Skills are registered into the MCP-style `ToolRegistry`, which the agent
 consults at runtime instead of relying on hardcoded intent -> function routing.
 """
 
-from skills.base import Skill, SkillContext, SkillResult
+from skills.base import CachePolicy, ReturnDirect, Skill, SkillContext, SkillResult
 
-__all__ = ["Skill", "SkillContext", "SkillResult"]
+__all__ = ["CachePolicy", "ReturnDirect", "Skill", "SkillContext", "SkillResult"]
@@ -11,7 +11,47 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple
+
+from utils.deadline import remaining_s
+
+
+class ReturnDirect(str, Enum):
+    """Whether a skill's output can be shown to the user verbatim.
+
+    A direct result ends the agent turn immediately, skipping the LLM call
+    that would otherwise re-word the tool output.
+
+      * ``NEVER``     — always let the agent synthesize a reply (default).
+      * ``ALWAYS``    — every successful result is user-ready.
+      * ``ON_RESULT`` — decided per call: the skill sets
+        ``SkillResult.metadata["return_direct"] = True`` when the output is
+        user-ready, optionally with a ``"display_text"`` to show instead of
+        the serialized output.
+    """
+
+    NEVER = "never"
+    ALWAYS = "always"
+    ON_RESULT = "on_result"
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Declares that a skill's successful results may be reused.
+
+    Only declare this for skills whose output depends on their arguments
+    alone — not on the session, the clock, or side effects of the call.
+
+      * ``ttl_s``      — how long a cached result stays valid.
+      * ``key_fields`` — arguments that identify a result; ``None`` uses all.
+      * ``normalize``  — strip and lowercase string key values, so
+        "Acme " and "acme" share an entry.
+    """
+
+    ttl_s: float = 300.0
+    key_fields: Optional[Tuple[str, ...]] = None
+    normalize: bool = True
 
 
 @dataclass
@@ -19,13 +59,22 @@ class SkillContext:
     """Runtime context threaded through every skill invocation.
 
     Carries identifiers and cross-cutting concerns (session id, correlation
-    id, caller identity) without polluting the skill's input schema.
+    id, caller identity, turn deadline) without polluting the skill's input
+    schema.
+
+    `deadline` is a `time.monotonic()` timestamp by which the whole turn
+    must be answered; the registry cuts tool calls short at it.
     """
 
     session_id: str = "default"
     correlation_id: Optional[str] = None
     user_id: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    deadline: Optional[float] = None
+
+    def remaining_s(self) -> Optional[float]:
+        """Seconds left before `deadline` (never negative); `None` if unbounded."""
+        return None if self.deadline is None else remaining_s(self.deadline)
 
 
 @dataclass
@@ -71,6 +120,15 @@ class Skill(ABC):
     #: JSON Schema describing the `output` field of `SkillResult` on success.
     output_schema: Dict[str, Any] = {"type": "string"}
 
+    #: Whether successful outputs may end the agent turn verbatim.
+    return_direct: ReturnDirect = ReturnDirect.NEVER
+
+    #: Set to make successful results cacheable by `ResultCacheHook`.
+    cache: Optional[CachePolicy] = None
+
+    #: Per-call timeout in seconds; `None` uses the registry's default.
+    timeout_s: Optional[float] = None
+
     @abstractmethod
     async def invoke(
         self, arguments: Dict[str, Any], ctx: SkillContext
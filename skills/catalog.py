@@ -0,0 +1,320 @@
+"""Skill catalog: register skills from metadata, import them on first call.
+
+The catalog holds everything the registry needs to list, validate and
+describe a tool: its name, description, schemas, tags and policies. It
+also records the ``module:Class`` that implements the tool.
+`register_catalog` registers one `LazySkill` per entry. The implementing
+module is imported on the tool's first invocation, and so is the handler
+behind it when that handler is passed as a `Deferred`. A worker can
+therefore boot and publish its manifest without importing pptx,
+azure-storage-blob or botbuilder.
+
+Entries come from `skills/catalog.json`. Installed packages can add more
+through the ``essales.skills`` entry point group: each entry point
+resolves to a list of entry dicts with the same shape as the JSON file.
+
+The JSON file is generated from the built-in skill classes, so the
+classes remain the single source of truth:
+
+    python -m skills.catalog            # rewrite skills/catalog.json
+    python -m skills.catalog --check    # exit 1 if it is out of date
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import inspect
+import json
+import logging
+import sys
+import time
+from dataclasses import dataclass
+from importlib.metadata import entry_points
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from skills.base import CachePolicy, ReturnDirect, Skill, SkillContext, SkillResult
+
+_LOG = logging.getLogger("essales.skills")
+
+#: The catalog shipped with the built-in skills.
+CATALOG_PATH = Path(__file__).with_name("catalog.json")
+
+#: Entry point group through which other packages contribute skills.
+ENTRY_POINT_GROUP = "essales.skills"
+
+#: Built-in skills and their tags, in registration order (``python -m
+#: skills.catalog`` turns this into `CATALOG_PATH`).
+BUILTIN_SKILLS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("skills.greeting:GreetingSkill", ("conversation",)),
+    ("skills.farewell:FarewellSkill", ("conversation",)),
+    ("skills.thanks:ThanksSkill", ("conversation",)),
+    ("skills.fallback:FallbackSkill", ("conversation",)),
+    ("skills.company_info:CompanyInfoSkill", ("research",)),
+    ("skills.past_projects:PastProjectsSkill", ("research",)),
+    ("skills.search_projects:SearchProjectsSkill", ("research",)),
+    ("skills.create_opportunity:CreateOpportunitySkill", ("crm",)),
+    ("skills.draft_proposal:DraftProposalSkill", ("content",)),
+)
+
+
+@dataclass(frozen=True)
+class SkillEntry:
+    """Catalog metadata for one skill, enough to register it unimported.
+
+    `requires` names the required constructor arguments, which
+    `register_catalog` fills from its dependencies (e.g.
+    ``"proposal_handler"``).
+    """
+
+    name: str
+    target: str
+    description: str
+    input_schema: Dict[str, Any]
+    output_schema: Dict[str, Any]
+    tags: Tuple[str, ...] = ()
+    requires: Tuple[str, ...] = ()
+    return_direct: ReturnDirect = ReturnDirect.NEVER
+    cache: Optional[CachePolicy] = None
+    timeout_s: Optional[float] = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "SkillEntry":
+        cache = data.get("cache")
+        if cache is not None:
+            key_fields = cache.get("key_fields")
+            cache = CachePolicy(
+                ttl_s=cache.get("ttl_s", CachePolicy.ttl_s),
+                key_fields=tuple(key_fields) if key_fields is not None else None,
+                normalize=cache.get("normalize", CachePolicy.normalize),
+            )
+        return cls(
+            name=data["name"],
+            target=data["target"],
+            description=data.get("description", ""),
+            input_schema=data.get("input_schema") or dict(Skill.input_schema),
+            output_schema=data.get("output_schema") or dict(Skill.output_schema),
+            tags=tuple(data.get("tags", ())),
+            requires=tuple(data.get("requires", ())),
+            return_direct=ReturnDirect(data.get("return_direct", ReturnDirect.NEVER)),
+            cache=cache,
+            timeout_s=data.get("timeout_s"),
+        )
+
+    @classmethod
+    def from_class(
+        cls, skill_cls: type, target: str, tags: Iterable[str] = ()
+    ) -> "SkillEntry":
+        """The entry describing `skill_cls`, read off its class attributes."""
+        params = inspect.signature(skill_cls.__init__).parameters
+        return cls(
+            name=skill_cls.name,
+            target=target,
+            description=skill_cls.description,
+            input_schema=skill_cls.input_schema,
+            output_schema=skill_cls.output_schema,
+            tags=tuple(tags),
+            requires=tuple(
+                p.name
+                for p in params.values()
+                if p.name != "self"
+                and p.default is p.empty
+                and p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+            ),
+            return_direct=ReturnDirect(skill_cls.return_direct),
+            cache=skill_cls.cache,
+            timeout_s=skill_cls.timeout_s,
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "name": self.name,
+            "target": self.target,
+            "description": self.description,
+            "input_schema": self.input_schema,
+            "output_schema": self.output_schema,
+            "tags": list(self.tags),
+            "requires": list(self.requires),
+            "return_direct": self.return_direct.value,
+        }
+        if self.cache is not None:
+            data["cache"] = {
+                "ttl_s": self.cache.ttl_s,
+                "key_fields": (
+                    list(self.cache.key_fields)
+                    if self.cache.key_fields is not None
+                    else None
+                ),
+                "normalize": self.cache.normalize,
+            }
+        if self.timeout_s is not None:
+            data["timeout_s"] = self.timeout_s
+        return data
+
+
+_UNSET = object()
+
+
+class Deferred:
+    """A dependency built by `factory` the first time a skill needs it.
+
+    Lets the caller hand over a handler without importing its module
+    (and that module's SDKs) until a tool that uses it is first called.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._value: Any = _UNSET
+
+    def get(self) -> Any:
+        if self._value is _UNSET:
+            self._value = self._factory()
+        return self._value
+
+
+class LazySkill(Skill):
+    """Stands in for a catalog skill until its first invocation.
+
+    Carries the entry's metadata, so registration, the manifest and the
+    LangChain tool set never import the implementation. The first
+    `invoke` (or an explicit `load()`) imports it, builds it with its
+    dependencies, and from then on delegates.
+    """
+
+    def __init__(self, entry: SkillEntry, deps: Optional[Mapping[str, Any]] = None):
+        self.entry = entry
+        self.name = entry.name
+        self.description = entry.description
+        self.input_schema = entry.input_schema
+        self.output_schema = entry.output_schema
+        self.return_direct = entry.return_direct
+        self.cache = entry.cache
+        self.timeout_s = entry.timeout_s
+        self._deps = dict(deps or {})
+        self._skill: Optional[Skill] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._skill is not None
+
+    def load(self) -> Skill:
+        """Import and build the implementation (once); returns it."""
+        if self._skill is None:
+            start = time.perf_counter()
+            module_name, _, attr = self.entry.target.partition(":")
+            skill_cls = getattr(importlib.import_module(module_name), attr)
+            kwargs = {dep: _resolve(self._deps[dep]) for dep in self.entry.requires}
+            self._skill = skill_cls(**kwargs)
+            _LOG.info(
+                '{"event":"skill_loaded","tool":"%s","target":"%s","ms":%.1f}',
+                self.name,
+                self.entry.target,
+                (time.perf_counter() - start) * 1000,
+            )
+        return self._skill
+
+    async def invoke(
+        self, arguments: Dict[str, Any], ctx: SkillContext
+    ) -> SkillResult:
+        return await self.load().invoke(arguments, ctx)
+
+
+def _resolve(dep: Any) -> Any:
+    return dep.get() if isinstance(dep, Deferred) else dep
+
+
+def load_catalog(path: Optional[Path] = None) -> List[SkillEntry]:
+    """Entries from a catalog JSON file (default: the built-in catalog)."""
+    with open(path or CATALOG_PATH, "r", encoding="utf-8") as fh:
+        data = json.load(fh)
+    return [SkillEntry.from_dict(item) for item in data["skills"]]
+
+
+def discover_entry_points(group: str = ENTRY_POINT_GROUP) -> List[SkillEntry]:
+    """Entries contributed by installed packages under `group`.
+
+    Loading an entry point imports only the module that holds its entry
+    list, so keep that module free of heavy imports.
+    """
+    entries: List[SkillEntry] = []
+    for ep in entry_points(group=group):
+        try:
+            items = ep.load()
+            entries.extend(SkillEntry.from_dict(item) for item in items)
+        except Exception:  # noqa: BLE001 — one broken plugin mustn't stop boot
+            _LOG.exception("skill entry point %s failed to load", ep.name)
+    return entries
+
+
+def register_catalog(
+    registry: Any,
+    entries: Iterable[SkillEntry],
+    deps: Optional[Mapping[str, Any]] = None,
+    *,
+    limits: Optional[Mapping[str, Mapping[str, Any]]] = None,
+) -> List[LazySkill]:
+    """Register a `LazySkill` per entry; nothing is imported yet.
+
+    Args:
+        registry: the `ToolRegistry` to populate.
+        entries: catalog entries, in registration order.
+        deps: constructor arguments by name; a `Deferred` is built on the
+            first call of a tool that requires it.
+        limits: extra `register` keyword arguments per tool name, e.g.
+            ``{"draft_proposal": {"max_concurrency": 2}}``.
+
+    Raises:
+        ValueError: an entry requires a dependency missing from `deps`,
+            caught here rather than on the tool's first call.
+    """
+    deps = deps or {}
+    limits = limits or {}
+    skills: List[LazySkill] = []
+    for entry in entries:
+        missing = [dep for dep in entry.requires if dep not in deps]
+        if missing:
+            raise ValueError(f"Skill '{entry.name}' requires {', '.join(missing)}")
+        skill = LazySkill(entry, {dep: deps[dep] for dep in entry.requires})
+        registry.register(skill, tags=list(entry.tags), **limits.get(entry.name, {}))
+        skills.append(skill)
+    return skills
+
+
+def build_catalog() -> Dict[str, Any]:
+    """The catalog document for `BUILTIN_SKILLS` (imports every skill)."""
+    entries = []
+    for target, tags in BUILTIN_SKILLS:
+        module_name, _, attr = target.partition(":")
+        skill_cls = getattr(importlib.import_module(module_name), attr)
+        entries.append(SkillEntry.from_class(skill_cls, target, tags).as_dict())
+    return {"skills": entries}
+
+
+def render_catalog(catalog: Dict[str, Any]) -> str:
+    return json.dumps(catalog, indent=2, ensure_ascii=False) + "\n"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, default=CATALOG_PATH)
+    parser.add_argument(
+        "--check", action="store_true", help="fail if the file is out of date"
+    )
+    args = parser.parse_args(argv)
+
+    catalog = build_catalog()
+    rendered = render_catalog(catalog)
+    if args.check:
+        current = args.output.read_text(encoding="utf-8") if args.output.exists() else ""
+        if current != rendered:
+            print(f"{args.output} is out of date; run python -m skills.catalog")
+            return 1
+        return 0
+    args.output.write_text(rendered, encoding="utf-8")
+    print(f"wrote {len(catalog['skills'])} skills to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from skills.base import Skill, SkillContext, SkillResult
+from skills.base import ReturnDirect, Skill, SkillContext, SkillResult
 
 
 class CreateOpportunitySkill(Skill):
@@ -28,6 +28,11 @@ class CreateOpportunitySkill(Skill):
         "additionalProperties": False,
     }
     output_schema = {"type": "string"}
+    return_direct = ReturnDirect.ON_RESULT
+
+    #: Handler replies that are already phrased for the user: the prompt for
+    #: missing CRM fields and the creation confirmation.
+    _USER_READY_PREFIXES = ("Please provide the following missing fields", "✅")
 
     def __init__(self, opportunity_handler: Any):
         self.opportunity_handler = opportunity_handler
@@ -38,7 +43,13 @@ class CreateOpportunitySkill(Skill):
         user_message: str = arguments["user_message"]
         try:
             reply = await self.opportunity_handler.handle(user_message, ctx.session_id)
-            return SkillResult(success=True, output=reply)
+            return SkillResult(
+                success=True,
+                output=reply,
+                metadata={
+                    "return_direct": str(reply).startswith(self._USER_READY_PREFIXES)
+                },
+            )
         except Exception as exc:  # noqa: BLE001
             return SkillResult(
                 success=False,
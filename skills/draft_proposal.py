@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from skills.base import Skill, SkillContext, SkillResult
+from skills.base import ReturnDirect, Skill, SkillContext, SkillResult
 
 
 class DraftProposalSkill(Skill):
@@ -32,6 +32,9 @@ class DraftProposalSkill(Skill):
             "attachment_url": {"type": "string"},
         },
     }
+    return_direct = ReturnDirect.ON_RESULT
+    # LLM outline + deck rendering + Blob upload: the slowest tool we have.
+    timeout_s = 10.0
 
     def __init__(self, proposal_handler: Any):
         self.proposal_handler = proposal_handler
@@ -49,10 +52,15 @@ class DraftProposalSkill(Skill):
             attachments = getattr(activity, "attachments", None) or []
             if attachments:
                 attachment_url = getattr(attachments[0], "content_url", None)
+            display_text = f"{text}\n{attachment_url}" if attachment_url else text
             return SkillResult(
                 success=True,
                 output={"text": text, "attachment_url": attachment_url},
-                metadata={"activity": activity},
+                metadata={
+                    "activity": activity,
+                    "return_direct": True,
+                    "display_text": display_text,
+                },
             )
         except Exception as exc:  # noqa: BLE001
             return SkillResult(
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from skills.base import Skill, SkillContext, SkillResult
+from skills.base import ReturnDirect, Skill, SkillContext, SkillResult
 
 
 class FallbackSkill(Skill):
@@ -21,6 +21,7 @@ class FallbackSkill(Skill):
         "additionalProperties": False,
     }
     output_schema = {"type": "string"}
+    return_direct = ReturnDirect.ALWAYS
 
     async def invoke(
         self, arguments: Dict[str, Any], ctx: SkillContext
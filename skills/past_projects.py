@@ -7,10 +7,11 @@ company profile (e.g. "have we worked with Acme before?").
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import Any, Dict, Optional
 
-from skills.base import Skill, SkillContext, SkillResult
-from utils.loader import load_json
+from data.knowledge_base import get_knowledge_base
+from skills.base import CachePolicy, Skill, SkillContext, SkillResult
 
 
 class PastProjectsSkill(Skill):
@@ -41,28 +42,22 @@ class PastProjectsSkill(Skill):
         },
     }
 
-    def __init__(self, data_path: str = "data/known_companies.json"):
-        self._data_path = data_path
-        self._cache: Optional[List[Dict[str, Any]]] = None
+    # A pure lookup keyed by company: safe to reuse across sessions.
+    cache = CachePolicy(ttl_s=600, key_fields=("company_name",))
+    # Local file lookup; anything slower than this is a stuck disk.
+    timeout_s = 2.0
 
-    def _load(self) -> List[Dict[str, Any]]:
-        if self._cache is None:
-            self._cache = load_json(self._data_path)
-        return self._cache
+    def __init__(self, data_path: Optional[str] = None):
+        self._data_path = data_path
 
     async def invoke(
         self, arguments: Dict[str, Any], ctx: SkillContext
     ) -> SkillResult:
-        target = arguments["company_name"].strip().lower()
         try:
-            match = next(
-                (
-                    c
-                    for c in self._load()
-                    if c.get("company_name", "").lower() == target
-                ),
-                None,
-            )
+            # Exact name, alias ("Alphabet"), or close spelling ("Gogle").
+            # Off the event loop: the SQLite backend reads from disk.
+            kb = get_knowledge_base(self._data_path)
+            match = await asyncio.to_thread(kb.lookup, arguments["company_name"])
         except Exception as exc:  # noqa: BLE001
             return SkillResult(success=False, error=f"Knowledge base read failed: {exc}")
 
@@ -73,13 +68,14 @@ class PastProjectsSkill(Skill):
                 metadata={"found": False},
             )
 
+        record = match.record
         return SkillResult(
             success=True,
             output={
-                "company_name": match["company_name"],
-                "project_details": match.get("project_details", ""),
-                "worked_with": match.get("worked_with", ""),
-                "contacts": match.get("contacts", []),
+                "company_name": record["company_name"],
+                "project_details": record.get("project_details", ""),
+                "worked_with": record.get("worked_with", ""),
+                "contacts": record.get("contacts", []),
             },
-            metadata={"found": True},
+            metadata={"found": True, "match": match.how, "score": match.score},
         )
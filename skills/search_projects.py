@@ -0,0 +1,82 @@
+"""Search projects skill: full-text search over past engagements.
+
+`get_past_projects` needs a company name. This skill goes the other way
+and finds the companies whose past work matches a topic or skill ("who
+have we built forecasting models for?"). On the SQLite knowledge base it
+is an FTS5 query ranked by bm25.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, Optional
+
+from data.knowledge_base import get_knowledge_base
+from skills.base import CachePolicy, Skill, SkillContext, SkillResult
+
+
+class SearchProjectsSkill(Skill):
+    name = "search_past_projects"
+    description = (
+        "Search the known-companies knowledge base for past projects matching "
+        "a topic, skill or technology. Use when the user asks which clients "
+        "we have done similar work for, without naming a company."
+    )
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Words describing the work, e.g. 'demand forecasting'.",
+            },
+            "limit": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 20,
+                "description": "Maximum number of companies to return (default 5).",
+            },
+        },
+        "required": ["query"],
+        "additionalProperties": False,
+    }
+    output_schema = {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "properties": {
+                "company_name": {"type": "string"},
+                "project_details": {"type": "string"},
+                "score": {"type": "number"},
+            },
+        },
+    }
+
+    cache = CachePolicy(ttl_s=600, key_fields=("query", "limit"))
+    timeout_s = 2.0
+
+    def __init__(self, data_path: Optional[str] = None):
+        self._data_path = data_path
+
+    async def invoke(
+        self, arguments: Dict[str, Any], ctx: SkillContext
+    ) -> SkillResult:
+        try:
+            kb = get_knowledge_base(self._data_path)
+            hits = await asyncio.to_thread(
+                kb.search_projects, arguments["query"], arguments.get("limit", 5)
+            )
+        except Exception as exc:  # noqa: BLE001
+            return SkillResult(success=False, error=f"Knowledge base search failed: {exc}")
+
+        return SkillResult(
+            success=True,
+            output=[
+                {
+                    "company_name": hit["company_name"],
+                    "project_details": hit.get("project_details", ""),
+                    "score": hit["score"],
+                }
+                for hit in hits
+            ],
+            metadata={"found": len(hits)},
+        )
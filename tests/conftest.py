@@ -3,6 +3,33 @@
 import os
 import sys
 
+import pytest
+
 _ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if _ROOT not in sys.path:
     sys.path.insert(0, _ROOT)
+
+
+@pytest.fixture
+def clock():
+    """A settable clock starting at 0; tests advance it with ``clock.now = ...``."""
+    from tests.stubs import FakeClock
+
+    return FakeClock()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_session_store(monkeypatch):
+    """Give every test its own in-process chat history store."""
+    import data.chat_history as chat_history
+    from data.session_store import SessionStore
+
+    monkeypatch.setattr(chat_history, "session_store", SessionStore())
+
+
+@pytest.fixture(autouse=True)
+def _fresh_session_state(monkeypatch):
+    """Give every test its own in-process session slots."""
+    import data.session_state as session_state
+
+    monkeypatch.setattr(session_state, "session_state", session_state.InMemorySessionState())
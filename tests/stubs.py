@@ -0,0 +1,60 @@
+"""Stub skills and a fake clock shared by the test modules."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict
+
+from skills.base import Skill, SkillContext, SkillResult
+
+
+class FakeClock:
+    """A settable time source: pass it as ``clock=`` and move `now` by hand."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class EchoSkill(Skill):
+    """Echo `message` back, after an optional `delay`; "fail" is refused."""
+
+    name = "echo"
+    description = "Echo the message back."
+    input_schema = {
+        "type": "object",
+        "properties": {"message": {"type": "string"}, "delay": {"type": "number"}},
+        "required": ["message"],
+        "additionalProperties": False,
+    }
+    output_schema = {"type": "string"}
+
+    async def invoke(self, arguments: Dict[str, Any], ctx: SkillContext) -> SkillResult:
+        await asyncio.sleep(arguments.get("delay", 0))
+        if arguments["message"] == "fail":
+            return SkillResult(success=False, error="echo refused")
+        return SkillResult(success=True, output=arguments["message"])
+
+
+class SlowSkill(Skill):
+    """Answers ``"<name> ok"`` after `delay` seconds; raises when asked to ``fail``."""
+
+    input_schema = {
+        "type": "object",
+        "properties": {"fail": {"type": "boolean"}},
+        "required": [],
+        "additionalProperties": False,
+    }
+
+    def __init__(self, name: str, delay: float = 0.2):
+        self.name = name
+        self.description = f"slow {name}"
+        self.delay = delay
+
+    async def invoke(self, arguments, ctx):
+        await asyncio.sleep(self.delay)
+        if arguments.get("fail"):
+            raise RuntimeError(f"{self.name} exploded")
+        return SkillResult(success=True, output=f"{self.name} ok")
@@ -0,0 +1,390 @@
+"""SalesAgent tests against a scripted chat model.
+
+No network: the LLM is a LangChain fake that replays canned `AIMessage`s,
+including OpenAI-style tool calls, so the real `AgentExecutor` loop runs
+end-to-end through the registry and hooks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any, Dict, List
+
+import pytest
+from langchain_core.language_models.fake_chat_models import (
+    FakeMessagesListChatModel,
+    GenericFakeChatModel,
+)
+from langchain_core.messages import AIMessage
+
+from agent.sales_agent import SalesAgent
+from hooks.base import HookManager
+from hooks.logging_hook import AuditLogHook
+from hooks.metrics import MetricsHook
+from mcp.registry import ToolRegistry
+from skills.base import ReturnDirect, Skill, SkillContext, SkillResult
+from tests.stubs import SlowSkill
+
+
+def tool_call(name: str, arguments: Dict[str, Any], call_id: str = "call_1") -> AIMessage:
+    return AIMessage(
+        content="",
+        additional_kwargs={
+            "tool_calls": [
+                {
+                    "id": call_id,
+                    "type": "function",
+                    "function": {"name": name, "arguments": json.dumps(arguments)},
+                }
+            ]
+        },
+    )
+
+
+def scripted_llm(*responses: AIMessage) -> FakeMessagesListChatModel:
+    return FakeMessagesListChatModel(responses=list(responses))
+
+
+class RecordingSkill(Skill):
+    name = "record"
+    description = "Record the session id it was invoked under."
+    input_schema = {
+        "type": "object",
+        "properties": {"user_message": {"type": "string"}},
+        "required": [],
+        "additionalProperties": False,
+    }
+
+    def __init__(self) -> None:
+        self.contexts: List[SkillContext] = []
+
+    async def invoke(self, arguments, ctx):
+        self.contexts.append(ctx)
+        return SkillResult(success=True, output=f"recorded {ctx.session_id}")
+
+
+class OtherSkill(Skill):
+    name = "other"
+    description = "Unused."
+
+    async def invoke(self, arguments, ctx):
+        return SkillResult(success=True, output="other")
+
+
+@pytest.mark.asyncio
+async def test_agent_routes_tool_call_through_registry():
+    skill = RecordingSkill()
+    reg = ToolRegistry()
+    reg.register(skill)
+    llm = scripted_llm(tool_call("record", {"user_message": "hi"}), AIMessage(content="done"))
+
+    reply = await SalesAgent(llm=llm, registry=reg).run("hi", "s1")
+
+    assert reply == "done"
+    assert [c.session_id for c in skill.contexts] == ["s1"]
+    assert skill.contexts[0].metadata["original_user_message"] == "hi"
+
+
+@pytest.mark.asyncio
+async def test_executor_is_reused_across_turns_and_sessions():
+    skill = RecordingSkill()
+    reg = ToolRegistry()
+    reg.register(skill)
+    llm = scripted_llm(
+        tool_call("record", {}),
+        AIMessage(content="first"),
+        tool_call("record", {}),
+        AIMessage(content="second"),
+    )
+    agent = SalesAgent(llm=llm, registry=reg)
+
+    executor = agent._get_executor()
+    assert await agent.run("a", "s1") == "first"
+    assert await agent.run("b", "s2") == "second"
+
+    assert agent._get_executor() is executor
+    # Per-turn state still reaches the shared tools.
+    assert [c.session_id for c in skill.contexts] == ["s1", "s2"]
+
+
+def test_executor_recompiled_when_registry_changes():
+    reg = ToolRegistry()
+    reg.register(RecordingSkill())
+    agent = SalesAgent(llm=scripted_llm(AIMessage(content="x")), registry=reg)
+
+    first = agent._get_executor()
+    reg.register(OtherSkill())
+    second = agent._get_executor()
+
+    assert second is not first
+    assert {t.name for t in second.tools} == {"record", "other"}
+
+
+@pytest.mark.asyncio
+async def test_cached_tools_require_invocation_scope():
+    reg = ToolRegistry()
+    reg.register(RecordingSkill())
+    (tool,) = reg.to_langchain_tools()
+    with pytest.raises(RuntimeError):
+        await tool.ainvoke({})
+
+
+def streaming_llm(*responses: AIMessage) -> GenericFakeChatModel:
+    return GenericFakeChatModel(messages=iter(responses))
+
+
+@pytest.mark.asyncio
+async def test_astream_yields_tool_events_tokens_and_final():
+    reg = ToolRegistry()
+    reg.register(RecordingSkill())
+    llm = streaming_llm(tool_call("record", {}), AIMessage(content="all done here"))
+
+    events = [e async for e in SalesAgent(llm=llm, registry=reg).astream("hi", "s1")]
+    types = [e.type for e in events]
+
+    assert types[0] == "tool_start" and events[0].tool == "record"
+    assert types[1] == "tool_end" and events[1].data["output"] == "recorded s1"
+    assert "".join(e.text for e in events if e.type == "token") == "all done here"
+    assert types[-1] == "final" and events[-1].text == "all done here"
+
+
+@pytest.mark.asyncio
+async def test_astream_hides_llm_calls_made_inside_skills():
+    inner = streaming_llm(AIMessage(content="internal extraction json"))
+
+    class NestedLLMSkill(Skill):
+        name = "nested"
+        description = "Calls an LLM internally."
+
+        async def invoke(self, arguments, ctx):
+            msg = await inner.ainvoke("extract")
+            return SkillResult(success=True, output=msg.content)
+
+    reg = ToolRegistry()
+    reg.register(NestedLLMSkill())
+    llm = streaming_llm(tool_call("nested", {}), AIMessage(content="visible"))
+
+    events = [e async for e in SalesAgent(llm=llm, registry=reg).astream("q", "s1")]
+
+    assert "".join(e.text for e in events if e.type == "token") == "visible"
+
+
+class DirectSkill(Skill):
+    name = "direct"
+    description = "Returns a user-ready answer when asked to."
+    input_schema = {
+        "type": "object",
+        "properties": {"ready": {"type": "boolean"}},
+        "required": [],
+        "additionalProperties": False,
+    }
+    return_direct = ReturnDirect.ON_RESULT
+
+    async def invoke(self, arguments, ctx):
+        ready = bool(arguments.get("ready"))
+        return SkillResult(
+            success=True,
+            output={"raw": "payload"},
+            metadata={"return_direct": ready, "display_text": "Ready for you."},
+        )
+
+
+@pytest.mark.asyncio
+async def test_return_direct_result_ends_turn_without_synthesis():
+    metrics = MetricsHook()
+    reg = ToolRegistry()
+    reg.register(DirectSkill())
+    # Only the tool-selection response is scripted: a synthesis call would fail.
+    llm = scripted_llm(tool_call("direct", {"ready": True}))
+
+    reply = await SalesAgent(llm=llm, registry=reg, metrics=metrics).run("q", "s1")
+
+    assert reply == "Ready for you."
+    assert metrics.counters()["llm_calls_saved"] == 1
+
+
+@pytest.mark.asyncio
+async def test_return_direct_policy_respects_result_metadata():
+    reg = ToolRegistry()
+    reg.register(DirectSkill())
+    llm = scripted_llm(tool_call("direct", {"ready": False}), AIMessage(content="synth"))
+
+    assert await SalesAgent(llm=llm, registry=reg).run("q", "s1") == "synth"
+
+
+@pytest.mark.asyncio
+async def test_register_can_override_return_direct_policy():
+    reg = ToolRegistry()
+    reg.register(RecordingSkill(), return_direct=ReturnDirect.ALWAYS)
+    llm = scripted_llm(tool_call("record", {}))
+
+    assert await SalesAgent(llm=llm, registry=reg).run("q", "s9") == "recorded s9"
+
+
+def multi_tool_call(*calls: tuple) -> AIMessage:
+    return AIMessage(
+        content="",
+        additional_kwargs={
+            "tool_calls": [
+                {
+                    "id": f"call_{i}",
+                    "type": "function",
+                    "function": {"name": name, "arguments": json.dumps(args)},
+                }
+                for i, (name, args) in enumerate(calls)
+            ]
+        },
+    )
+
+
+async def _run_parallel_step(max_parallel_tools: int, *calls: tuple):
+    reg = ToolRegistry()
+    for name in ("a", "b", "c"):
+        reg.register(SlowSkill(name))
+    llm = scripted_llm(multi_tool_call(*calls), AIMessage(content="done"))
+    agent = SalesAgent(llm=llm, registry=reg, max_parallel_tools=max_parallel_tools)
+    executor = agent._get_executor()
+    executor.return_intermediate_steps = True
+    start = time.perf_counter()
+    with agent._turn_scope("s1", "q"):
+        raw = await executor.ainvoke({"input": "q", "chat_history": []})
+    return raw["intermediate_steps"], time.perf_counter() - start
+
+
+@pytest.mark.asyncio
+async def test_parallel_tool_calls_overlap_and_keep_order():
+    steps, elapsed = await _run_parallel_step(
+        4, ("c", {}), ("a", {}), ("b", {})
+    )
+    assert [obs for _, obs in steps] == ["c ok", "a ok", "b ok"]
+    assert elapsed < 0.45  # three 0.2s calls overlapped
+
+
+@pytest.mark.asyncio
+async def test_parallel_tool_calls_respect_turn_cap():
+    _, elapsed = await _run_parallel_step(1, ("a", {}), ("b", {}))
+    assert elapsed >= 0.4
+
+
+@pytest.mark.asyncio
+async def test_parallel_tool_call_failure_is_confined():
+    steps, _ = await _run_parallel_step(
+        4, ("a", {"fail": True}), ("b", {})
+    )
+    assert steps[0][1].startswith("ERROR: RuntimeError: a exploded")
+    assert steps[1][1] == "b ok"
+
+
+@pytest.mark.asyncio
+async def test_audit_records_show_overlap(caplog):
+    caplog.set_level("INFO", logger="essales.audit")
+    reg = ToolRegistry(hook_manager=HookManager(post=[AuditLogHook()]))
+    reg.register(SlowSkill("a", delay=0.05))
+    reg.register(SlowSkill("b", delay=0.05))
+    llm = scripted_llm(multi_tool_call(("a", {}), ("b", {})), AIMessage(content="done"))
+
+    await SalesAgent(llm=llm, registry=reg).run("q", "s1")
+
+    records = [json.loads(r.message) for r in caplog.records if r.name == "essales.audit"]
+    assert len(records) == 2
+    assert records[0]["turn_id"] == records[1]["turn_id"]
+    assert max(r["concurrent_calls"] for r in records) == 2
+
+
+def _deadline_agent(llm, metrics=None) -> SalesAgent:
+    reg = ToolRegistry()
+    reg.register(SlowSkill("a", delay=0.01))
+    reg.register(SlowSkill("b", delay=5))
+    return SalesAgent(llm=llm, registry=reg, metrics=metrics, deadline_reserve_s=0.1)
+
+
+@pytest.mark.asyncio
+async def test_deadline_returns_partial_answer_from_finished_tools():
+    metrics = MetricsHook()
+    llm = scripted_llm(tool_call("a", {}), tool_call("b", {}), AIMessage(content="never"))
+    agent = _deadline_agent(llm, metrics)
+
+    start = time.monotonic()
+    reply = await agent.run("q", "s1", deadline=start + 0.4)
+
+    assert time.monotonic() - start < 1
+    assert "ran out of time" in reply and "a ok" in reply
+    assert metrics.counters()["deadline_partial_answers"] == 1
+
+
+@pytest.mark.asyncio
+async def test_astream_ends_with_partial_answer_at_deadline():
+    llm = streaming_llm(tool_call("b", {}), AIMessage(content="never"))
+    agent = _deadline_agent(llm)
+
+    events = [
+        e async for e in agent.astream("q", "s1", deadline=time.monotonic() + 0.3)
+    ]
+    assert events[-1].type == "final"
+    assert events[-1].text.startswith("Sorry, this is taking longer")
+
+
+class _SlowMemory:
+    """Memory whose reads and writes take `delay` seconds."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.saved: List[str] = []
+
+    async def load(self, session_id):
+        await asyncio.sleep(self.delay)
+        return []
+
+    async def save_turn(self, session_id, user_input, output):
+        await asyncio.sleep(self.delay)
+        self.saved.append(output)
+
+
+@pytest.mark.asyncio
+async def test_memory_load_and_save_stay_within_the_deadline():
+    metrics, memory = MetricsHook(), _SlowMemory(delay=0.5)
+    reg = ToolRegistry()
+    reg.register(OtherSkill())
+    agent = SalesAgent(
+        llm=scripted_llm(AIMessage(content="answer")),
+        registry=reg,
+        metrics=metrics,
+        memory=memory,
+        deadline_reserve_s=0.05,
+    )
+
+    start = time.monotonic()
+    reply = await agent.run("q", "s1", deadline=start + 0.3)
+
+    assert reply == "answer" and time.monotonic() - start < 0.45
+    assert metrics.counters()["memory_load_timeouts"] == 1
+    assert metrics.counters()["memory_saves_deferred"] == 1
+    await asyncio.sleep(0.6)
+    assert memory.saved == ["answer"]  # finished in the background
+
+
+class DictSkill(Skill):
+    name = "profile"
+    description = "Structured output."
+
+    async def invoke(self, arguments, ctx):
+        return SkillResult(
+            success=True,
+            output={"company_name": "Initech", "industry": "Software", "notes": ""},
+        )
+
+
+@pytest.mark.asyncio
+async def test_partial_answer_formats_structured_outputs():
+    reg = ToolRegistry()
+    reg.register(DictSkill())
+    reg.register(SlowSkill("b", delay=5))
+    llm = scripted_llm(tool_call("profile", {}), tool_call("b", {}), AIMessage(content="never"))
+    agent = SalesAgent(llm=llm, registry=reg, deadline_reserve_s=0.1)
+
+    reply = await agent.run("q", "s1", deadline=time.monotonic() + 0.4)
+
+    assert "Company name: Initech\nIndustry: Software" in reply
+    assert "{" not in reply and "Notes" not in reply
@@ -0,0 +1,28 @@
+"""API-key parsing, bearer checks and session namespacing."""
+
+from __future__ import annotations
+
+from utils.auth import api_session_id, parse_api_keys, principal_for
+
+
+def test_parse_api_keys_maps_keys_to_principals():
+    keys = parse_api_keys(" ci=abc , crm=def,broken, =nokey,nobody= ")
+    assert keys == {"abc": "ci", "def": "crm"}
+
+
+def test_principal_for_accepts_only_known_bearer_keys():
+    keys = parse_api_keys("ci=abc")
+    assert principal_for("Bearer abc", keys) == "ci"
+    assert principal_for("bearer  abc ", keys) == "ci"
+    assert principal_for("Bearer wrong", keys) is None
+    assert principal_for("Basic abc", keys) is None
+    assert principal_for(None, keys) is None
+
+
+def test_no_configured_keys_rejects_everyone():
+    assert principal_for("Bearer anything", parse_api_keys("")) is None
+
+
+def test_api_sessions_are_namespaced_by_caller():
+    assert api_session_id("ci", "19:teams-conversation") == "api:ci:19:teams-conversation"
+    assert api_session_id("ci", "x") != api_session_id("crm", "x")
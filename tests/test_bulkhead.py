@@ -0,0 +1,93 @@
+"""Bulkheads: per-tool and per-tag concurrency limits in the registry."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from hooks.base import HookManager
+from hooks.metrics import MetricsHook
+from mcp.bulkhead import Bulkhead, BulkheadFullError
+from mcp.registry import ToolRegistry
+from skills.base import SkillContext
+from tests.stubs import SlowSkill
+
+
+@pytest.mark.asyncio
+async def test_proposal_burst_is_shed_without_starving_lookups():
+    reg = ToolRegistry()
+    reg.register(SlowSkill("draft", 0.2), max_concurrency=2, max_queue=2)
+    reg.register(SlowSkill("lookup", 0.01))
+
+    burst = [
+        asyncio.create_task(reg.invoke("draft", {}, SkillContext())) for _ in range(10)
+    ]
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    lookup = await reg.invoke("lookup", {}, SkillContext())
+    assert lookup.success and time.perf_counter() - start < 0.1
+
+    results = await asyncio.gather(*burst)
+    rejected = [r for r in results if not r.success]
+    assert sum(r.success for r in results) == 4  # 2 running + 2 queued
+    assert len(rejected) == 6
+    assert rejected[0].metadata["rejected_by"] == "tool:draft"
+    assert "busy" in rejected[0].error
+    assert reg.bulkhead_stats()["tool:draft"]["rejected"] == 6
+
+
+@pytest.mark.asyncio
+async def test_tag_limit_is_shared_across_tools():
+    reg = ToolRegistry()
+    reg.register(SlowSkill("a", 0.1), tags=["content"])
+    reg.register(SlowSkill("b", 0.1), tags=["content"])
+    reg.limit_tag("content", 1)
+
+    first = asyncio.create_task(reg.invoke("a", {}, SkillContext()))
+    await asyncio.sleep(0)
+    second = await reg.invoke("b", {}, SkillContext())
+    assert not second.success
+    assert second.metadata["rejected_by"] == "tag:content"
+    assert (await first).success
+
+
+@pytest.mark.asyncio
+async def test_queue_wait_is_recorded_apart_from_execution_time():
+    metrics = MetricsHook()
+    reg = ToolRegistry(hook_manager=HookManager(post=[metrics]))
+    reg.register(SlowSkill("draft", 0.1), max_concurrency=1, max_queue=1)
+
+    ctxs = [SkillContext(), SkillContext()]
+    await asyncio.gather(*(reg.invoke("draft", {}, c) for c in ctxs))
+
+    assert ctxs[1].metadata["queue_wait_ms"] >= 80
+    stats = metrics.snapshot()["draft"]
+    assert stats["queue_wait_count"] == 2
+    assert stats["avg_queue_wait_ms"] >= 40
+    assert stats["max_latency_ms"] < 150  # the wait isn't counted as latency
+
+
+@pytest.mark.asyncio
+async def test_queue_wait_is_bounded_by_the_turn_deadline():
+    reg = ToolRegistry()
+    reg.register(SlowSkill("draft", 0.3), max_concurrency=1, max_queue=5)
+
+    first = asyncio.create_task(reg.invoke("draft", {}, SkillContext()))
+    await asyncio.sleep(0)
+    ctx = SkillContext(deadline=time.monotonic() + 0.05)
+    result = await reg.invoke("draft", {}, ctx)
+    assert not result.success and "no slot freed up" in result.error
+    assert (await first).success
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_rejects_when_queue_is_full():
+    bulkhead = Bulkhead("tool:x", 1, max_queue=0)
+    async with bulkhead.slot():
+        with pytest.raises(BulkheadFullError):
+            async with bulkhead.slot():
+                pass
+    async with bulkhead.slot() as waited:
+        assert waited >= 0
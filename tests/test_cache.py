@@ -0,0 +1,130 @@
+"""TTLCache, the around phase, and ResultCacheHook."""
+
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+from fakeredis import aioredis
+
+from hooks.base import Hook, HookManager
+from hooks.cache_hook import ResultCacheHook
+from hooks.metrics import MetricsHook
+from mcp.registry import ToolRegistry
+from skills.base import CachePolicy, Skill, SkillContext, SkillResult
+from utils.cache import MISSING, TTLCache
+
+
+def test_ttl_cache_expires_and_evicts_lru(clock):
+    cache = TTLCache(max_entries=2, ttl_s=10, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)  # evicts b, the least recently used
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+
+    clock.now = 11
+    assert cache.get("a") is MISSING
+    cache.set("d", None, ttl_s=100)
+    assert cache.get("d") is None
+
+
+class _LookupSkill(Skill):
+    name = "lookup"
+    description = "Counted lookup."
+    input_schema = {
+        "type": "object",
+        "properties": {"company_name": {"type": "string"}, "note": {"type": "string"}},
+        "required": ["company_name"],
+    }
+    cache = CachePolicy(ttl_s=60, key_fields=("company_name",))
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def invoke(self, arguments, ctx):
+        self.calls += 1
+        if arguments["company_name"] == "boom":
+            return SkillResult(success=False, error="lookup failed")
+        return SkillResult(success=True, output={"company": arguments["company_name"]})
+
+
+def _registry(skill: Skill, cache_hook: ResultCacheHook, metrics: MetricsHook) -> ToolRegistry:
+    reg = ToolRegistry(hook_manager=HookManager(post=[metrics], around=[cache_hook]))
+    reg.register(skill)
+    return reg
+
+
+@pytest.mark.asyncio
+async def test_result_cache_hits_on_normalized_key_fields():
+    skill, metrics = _LookupSkill(), MetricsHook()
+    hook = ResultCacheHook(metrics=metrics)
+    reg = _registry(skill, hook, metrics)
+
+    first = await reg.invoke("lookup", {"company_name": "Acme"}, SkillContext())
+    second = await reg.invoke(
+        "lookup", {"company_name": "  acme ", "note": "ignored"}, SkillContext()
+    )
+
+    assert skill.calls == 1
+    assert second.output == first.output and second.metadata["cache_hit"] is True
+    assert hook.stats()["lookup"] == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+    assert metrics.value("result_cache_hits", tool="lookup") == 1
+    # Post-hooks still observe the cached answer.
+    assert metrics.snapshot()["lookup"]["invocations"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failures_are_not_cached():
+    skill, metrics = _LookupSkill(), MetricsHook()
+    reg = _registry(skill, ResultCacheHook(), metrics)
+    for _ in range(2):
+        assert not (await reg.invoke("lookup", {"company_name": "boom"}, SkillContext())).success
+    assert skill.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_tools_without_policy_are_not_wrapped():
+    class Plain(_LookupSkill):
+        name = "plain"
+        cache = None
+
+    hook = ResultCacheHook()
+    reg = _registry(Plain(), hook, MetricsHook())
+    assert reg._hook_manager.pipeline(reg.get("plain")).around == []
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_is_shared_between_workers():
+    redis = aioredis.FakeRedis()
+    skill_a, skill_b = _LookupSkill(), _LookupSkill()
+    worker_a = _registry(skill_a, ResultCacheHook(redis=redis), MetricsHook())
+    worker_b = _registry(skill_b, ResultCacheHook(redis=redis), MetricsHook())
+
+    await worker_a.invoke("lookup", {"company_name": "Acme"}, SkillContext())
+    result = await worker_b.invoke("lookup", {"company_name": "ACME"}, SkillContext())
+
+    assert (skill_a.calls, skill_b.calls) == (1, 0)
+    assert result.output == {"company": "Acme"} and result.metadata["cache_hit"]
+    assert 0 < await redis.ttl('essales:toolcache:lookup:{"company_name": "acme"}') <= 60
+
+
+@pytest.mark.asyncio
+async def test_around_hooks_nest_in_registration_order():
+    order: List[str] = []
+
+    class Tag(Hook):
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        async def around(self, spec, arguments, ctx, call_next):
+            order.append(f"{self.name}>")
+            result = await call_next(arguments)
+            order.append(f"<{self.name}")
+            return result
+
+    reg = ToolRegistry(hook_manager=HookManager(around=[Tag("outer"), Tag("inner")]))
+    reg.register(_LookupSkill())
+    await reg.invoke("lookup", {"company_name": "x"}, SkillContext())
+    assert order == ["outer>", "inner>", "<inner", "<outer"]
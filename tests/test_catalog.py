@@ -0,0 +1,121 @@
+"""Tests for the skill catalog and lazy skill registration."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from agent.runtime import build_runtime
+from agent.sales_agent import build_registry
+from mcp.registry import ToolRegistry
+from skills.base import ReturnDirect, SkillContext
+from skills.catalog import (
+    BUILTIN_SKILLS,
+    CATALOG_PATH,
+    Deferred,
+    SkillEntry,
+    build_catalog,
+    load_catalog,
+    register_catalog,
+    render_catalog,
+)
+
+_MODULE = '''
+from skills.base import Skill, SkillResult
+
+class ShoutSkill(Skill):
+    name = "shout"
+
+    def __init__(self, greeter):
+        self.greeter = greeter
+
+    async def invoke(self, arguments, ctx):
+        return SkillResult(success=True, output=self.greeter(arguments["text"]))
+'''
+
+
+def _entry(module: str) -> SkillEntry:
+    return SkillEntry.from_dict(
+        {
+            "name": "shout",
+            "target": f"{module}:ShoutSkill",
+            "description": "Shout the text.",
+            "input_schema": {
+                "type": "object",
+                "properties": {"text": {"type": "string"}},
+                "required": ["text"],
+            },
+            "tags": ["test"],
+            "requires": ["greeter"],
+            "return_direct": "always",
+        }
+    )
+
+
+def test_catalog_file_is_up_to_date():
+    # Regenerate with `python -m skills.catalog` after changing a skill.
+    assert CATALOG_PATH.read_text(encoding="utf-8") == render_catalog(build_catalog())
+
+
+def test_entries_round_trip_through_dicts():
+    for entry in load_catalog():
+        assert SkillEntry.from_dict(entry.as_dict()) == entry
+    assert len(load_catalog()) == len(BUILTIN_SKILLS)
+
+
+@pytest.mark.asyncio
+async def test_skill_is_imported_and_built_on_first_call(tmp_path, monkeypatch):
+    (tmp_path / "lazy_shout.py").write_text(_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_shout", raising=False)
+    builds = []
+
+    def _greeter():
+        builds.append(1)
+        return str.upper
+
+    reg = ToolRegistry()
+    (skill,) = register_catalog(reg, [_entry("lazy_shout")], {"greeter": Deferred(_greeter)})
+
+    spec = reg.get("shout")
+    assert spec.return_direct == ReturnDirect.ALWAYS and spec.tags == ["test"]
+    assert reg.get_manifest()["tools"][0]["description"] == "Shout the text."
+    assert "lazy_shout" not in sys.modules and not skill.loaded and not builds
+
+    for _ in range(2):
+        result = await reg.invoke("shout", {"text": "hi"}, SkillContext())
+        assert result.output == "HI"
+    assert "lazy_shout" in sys.modules and skill.loaded and builds == [1]
+
+
+def test_missing_dependency_fails_at_registration():
+    with pytest.raises(ValueError, match="greeter"):
+        register_catalog(ToolRegistry(), [_entry("lazy_shout")], {})
+
+
+def test_build_registry_registers_the_catalog_without_building_handlers():
+    def _never():
+        raise AssertionError("handler built at registration")
+
+    reg = build_registry(
+        opportunity_handler=Deferred(_never),
+        company_handler=Deferred(_never),
+        proposal_handler=Deferred(_never),
+    )
+    assert [s.name for s in reg.list_tools()] == [e.name for e in load_catalog()]
+    assert reg.bulkhead_stats()["tool:draft_proposal"]["max_concurrent"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_runtime_builds_the_company_handler_with_extractor_and_cache():
+    from langchain_core.language_models.fake import FakeListLLM
+
+    runtime = build_runtime(FakeListLLM(responses=["unused"]))
+    assert [s.name for s in runtime.registry.list_tools()] == [e.name for e in load_catalog()]
+
+    skill = runtime.registry.get("get_company_info").skill
+    handler = skill.load().company_handler
+    assert handler.extractor is not None and handler.profile_cache is not None
+    assert handler.metrics is runtime.metrics
+    await runtime.aclose()
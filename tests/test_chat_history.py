@@ -0,0 +1,95 @@
+"""AsyncRedisChatMessageHistory against an in-process fake Redis."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from fakeredis import aioredis
+from langchain_core.messages import AIMessage, HumanMessage, message_to_dict
+
+import data.chat_history as chat_history
+from data.chat_history import AsyncRedisChatMessageHistory
+
+
+@pytest.fixture
+def client():
+    return aioredis.FakeRedis()
+
+
+@pytest.mark.asyncio
+async def test_round_trip_preserves_order(client):
+    history = AsyncRedisChatMessageHistory("s1", client=client)
+    await history.aadd_messages([HumanMessage(content="q1"), AIMessage(content="a1")])
+    await history.aadd_messages([HumanMessage(content="q2")])
+
+    messages = await history.aget_messages()
+
+    assert [(m.type, m.content) for m in messages] == [
+        ("human", "q1"),
+        ("ai", "a1"),
+        ("human", "q2"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_messages_from_reads_only_the_tail(client):
+    history = AsyncRedisChatMessageHistory("s1", client=client)
+    await history.aadd_messages([HumanMessage(content=f"m{i}") for i in range(5)])
+
+    assert [m.content for m in (await history.aget_messages_from(3))[1]] == ["m3", "m4"]
+    assert (await history.aget_messages_from(0))[0] == 5
+    assert await history.aget_messages_from(5) == (5, [])
+    assert await history.aget_messages_from(9) == (5, [])
+
+
+@pytest.mark.asyncio
+async def test_reads_sessions_written_by_the_sync_client_layout(client):
+    # RedisChatMessageHistory LPUSHes JSON message dicts under message_store:<id>.
+    raw = json.dumps(message_to_dict(HumanMessage(content="hi")))
+    await client.lpush("message_store:old", raw)
+
+    messages = await AsyncRedisChatMessageHistory("old", client=client).aget_messages()
+
+    assert [m.content for m in messages] == ["hi"]
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_isolated_and_clearable(client):
+    a = AsyncRedisChatMessageHistory("a", client=client)
+    b = AsyncRedisChatMessageHistory("b", client=client)
+    await a.aadd_messages([HumanMessage(content="for a")])
+    await b.aadd_messages([HumanMessage(content="for b")])
+
+    await a.aclear()
+
+    assert await a.aget_messages() == []
+    assert [m.content for m in await b.aget_messages()] == ["for b"]
+
+
+@pytest.mark.asyncio
+async def test_ttl_is_refreshed_on_write(client):
+    history = AsyncRedisChatMessageHistory("s1", client=client, ttl=60)
+    await history.aadd_messages([HumanMessage(content="q")])
+    assert 0 < await client.ttl("message_store:s1") <= 60
+
+
+def test_sync_api_refuses_to_block():
+    history = AsyncRedisChatMessageHistory("s1", client=aioredis.FakeRedis())
+    with pytest.raises(TypeError):
+        history.messages
+    with pytest.raises(TypeError):
+        history.add_message(HumanMessage(content="q"))
+
+
+@pytest.mark.asyncio
+async def test_shared_client_is_a_singleton(monkeypatch):
+    monkeypatch.setattr(chat_history, "REDIS_URL", "redis://localhost:6379/0")
+    monkeypatch.setattr(chat_history, "_redis", None)
+
+    first = chat_history.get_redis()
+    assert chat_history.get_redis() is first
+    assert first.connection_pool.max_connections == chat_history.REDIS_MAX_CONNECTIONS
+
+    await chat_history.close_redis()
+    assert chat_history._redis is None
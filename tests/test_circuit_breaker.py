@@ -0,0 +1,184 @@
+"""Circuit breaker: per-tool state machine, budgeted retries, metrics."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from hooks.base import HookManager
+from hooks.circuit_breaker import CircuitBreakerHook, CircuitState, RetryBudget, backoff_delay
+from hooks.metrics import MetricsHook
+from mcp.registry import ToolRegistry
+from observability.prometheus import render_prometheus
+from skills.base import Skill, SkillContext, SkillResult
+from tests.stubs import FakeClock
+
+
+class FlakySkill(Skill):
+    """Follows a script of outcomes: "ok", "fail" (result), "raise", or "hang"."""
+
+    name = "flaky"
+    description = "Scripted failures."
+    input_schema = {"type": "object", "properties": {}, "additionalProperties": False}
+
+    def __init__(self, script: List[str]):
+        self.script = list(script)
+        self.calls = 0
+
+    async def invoke(self, arguments: Dict[str, Any], ctx: SkillContext) -> SkillResult:
+        self.calls += 1
+        outcome = self.script.pop(0) if self.script else "ok"
+        if outcome == "raise":
+            raise ConnectionError("upstream down")
+        if outcome == "hang":
+            await asyncio.Event().wait()
+        if outcome == "fail":
+            return SkillResult(success=False, error="upstream said no")
+        return SkillResult(success=True, output="fine")
+
+
+def _setup(script, **kwargs):
+    clock, sleeps, metrics = FakeClock(), [], MetricsHook()
+
+    async def _sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    breaker = CircuitBreakerHook(
+        clock=clock, sleep=_sleep, rng=lambda: 1.0, metrics=metrics, **kwargs
+    )
+    skill = FlakySkill(script)
+    registry = ToolRegistry(hook_manager=HookManager(post=[metrics], around=[breaker]))
+    registry.register(skill)
+    return registry, skill, breaker, clock, sleeps, metrics
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_and_fails_fast():
+    registry, skill, breaker, _, _, metrics = _setup(
+        ["fail"] * 3, failure_threshold=3, max_retries=0
+    )
+    for _ in range(3):
+        assert not (await registry.invoke("flaky", {}, SkillContext())).success
+    assert breaker.state("flaky") == CircuitState.OPEN
+
+    result = await registry.invoke("flaky", {}, SkillContext())
+    assert not result.success
+    assert result.metadata["circuit"] == "open"
+    assert "temporarily unavailable" in result.error
+    assert skill.calls == 3  # fail-fast: the skill wasn't run
+    assert metrics.snapshot()["flaky"]["circuit_state"] == "open"
+    assert metrics.value("circuit_open", tool="flaky") == 1
+
+
+@pytest.mark.asyncio
+async def test_half_open_trial_closes_or_reopens():
+    registry, skill, breaker, clock, _, metrics = _setup(
+        ["fail", "fail", "fail", "ok"],
+        failure_threshold=2,
+        reset_timeout_s=10,
+        max_retries=0,
+    )
+    for _ in range(2):
+        await registry.invoke("flaky", {}, SkillContext())
+    assert breaker.state("flaky") == CircuitState.OPEN
+
+    clock.now = 10  # trial call fails: straight back to open
+    assert not (await registry.invoke("flaky", {}, SkillContext())).success
+    assert breaker.state("flaky") == CircuitState.OPEN
+    clock.now = 15
+    assert (await registry.invoke("flaky", {}, SkillContext())).metadata["circuit"] == "open"
+
+    clock.now = 20  # trial call succeeds: closed again
+    assert (await registry.invoke("flaky", {}, SkillContext())).success
+    assert breaker.state("flaky") == CircuitState.CLOSED
+    assert metrics.value("circuit_open", tool="flaky") == 0
+    assert skill.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_cancelled_call_is_not_a_failure():
+    registry, skill, breaker, clock, _, _ = _setup(
+        ["fail", "hang", "fail", "hang", "ok"],
+        failure_threshold=2,
+        reset_timeout_s=10,
+        max_retries=0,
+    )
+
+    async def _cancel_mid_call() -> None:
+        task = asyncio.ensure_future(registry.invoke("flaky", {}, SkillContext()))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    await registry.invoke("flaky", {}, SkillContext())
+    await _cancel_mid_call()
+    assert breaker.state("flaky") == CircuitState.CLOSED
+    assert breaker._breakers["flaky"].failures == 1
+
+    await registry.invoke("flaky", {}, SkillContext())
+    assert breaker.state("flaky") == CircuitState.OPEN
+
+    clock.now = 10  # the trial call is cancelled: its slot is freed
+    await _cancel_mid_call()
+    assert breaker.state("flaky") == CircuitState.HALF_OPEN
+    assert (await registry.invoke("flaky", {}, SkillContext())).success
+    assert breaker.state("flaky") == CircuitState.CLOSED
+    assert skill.calls == 5
+
+
+@pytest.mark.asyncio
+async def test_transient_exceptions_retry_with_exponential_backoff():
+    registry, skill, breaker, _, sleeps, _ = _setup(
+        ["raise", "raise", "ok"], max_retries=3, backoff_base_s=0.1, backoff_cap_s=10
+    )
+    result = await registry.invoke("flaky", {}, SkillContext())
+    assert result.success and skill.calls == 3
+    assert sleeps == pytest.approx([0.1, 0.2])
+    assert breaker.state("flaky") == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_failed_results_are_not_retried_unless_flagged():
+    registry, skill, _, _, sleeps, _ = _setup(["fail"], max_retries=3)
+    assert not (await registry.invoke("flaky", {}, SkillContext())).success
+    assert skill.calls == 1 and sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_caps_retries_across_calls():
+    registry, skill, _, _, sleeps, _ = _setup(
+        ["raise"] * 20, failure_threshold=100, max_retries=2, retry_ratio=0.0
+    )
+    for _ in range(5):
+        with pytest.raises(ConnectionError):
+            await registry.invoke("flaky", {}, SkillContext())
+    # Only the initial budget (3 tokens) is spent; the rest fail without retrying.
+    assert len(sleeps) == 3
+    assert skill.calls == 5 + 3
+
+
+def test_backoff_delay_is_capped_and_jittered():
+    assert backoff_delay(1, base_s=0.1, cap_s=1, rng=lambda: 1.0) == pytest.approx(0.1)
+    assert backoff_delay(10, base_s=0.1, cap_s=1, rng=lambda: 1.0) == 1
+    assert backoff_delay(3, base_s=0.1, cap_s=1, rng=lambda: 0.5) == pytest.approx(0.2)
+
+
+def test_retry_budget_refills_with_traffic():
+    budget = RetryBudget(ratio=0.5, min_tokens=0, max_tokens=2)
+    assert not budget.try_spend()
+    budget.record_call()
+    budget.record_call()
+    assert budget.try_spend()
+    assert not budget.try_spend()
+
+
+@pytest.mark.asyncio
+async def test_breaker_state_renders_in_prometheus():
+    registry, _, _, _, _, metrics = _setup(["fail"], failure_threshold=1, max_retries=0)
+    await registry.invoke("flaky", {}, SkillContext())
+    text = render_prometheus(metrics.snapshot(), metrics.counters(), metrics.labelled())
+    assert "# TYPE essales_circuit_open gauge" in text
+    assert 'essales_circuit_open{tool="flaky"} 1' in text
@@ -0,0 +1,63 @@
+"""Tests for the known-companies index."""
+
+from __future__ import annotations
+
+from data.company_index import CompanyIndex, normalize_company
+
+_RECORDS = [
+    {"company_name": "Acme Corporation"},
+    {"company_name": "Google", "aliases": ["Alphabet"]},
+    {"company_name": "Globex"},
+    {"company_name": "Société Générale"},
+]
+
+
+def test_normalize_folds_case_punctuation_and_legal_suffixes():
+    assert normalize_company("  ACME Corp. ") == "acme"
+    assert normalize_company("Acme Corporation") == "acme"
+    assert normalize_company("Ben & Jerry's, Inc.") == "ben and jerry s"
+    assert normalize_company("Société Générale SA") == "societe generale"
+    # A suffix on its own is still a name.
+    assert normalize_company("Company") == "company"
+
+
+def test_exact_and_alias_lookup():
+    index = CompanyIndex(_RECORDS, aliases={"GOOG": "Google", "Ghost": "Nope"})
+    assert index.get("acme corp")["company_name"] == "Acme Corporation"
+    assert index.get("societe generale")["company_name"] == "Société Générale"
+    assert index.lookup("Alphabet Inc").how == "alias"
+    assert index.lookup("goog").record["company_name"] == "Google"
+    assert index.get("Ghost") is None
+    assert len(index) == 4
+
+
+def test_alias_never_shadows_a_company_name():
+    index = CompanyIndex([{"company_name": "Acme", "aliases": ["Globex"]}, *_RECORDS[2:3]])
+    assert index.lookup("Globex").how == "exact"
+
+
+def test_fuzzy_lookup_and_search():
+    index = CompanyIndex(_RECORDS)
+    match = index.lookup("Gogle")
+    assert match.record["company_name"] == "Google"
+    assert match.how == "fuzzy" and 0.5 <= match.score < 1
+
+    assert index.lookup("Initech") is None
+    assert index.lookup("") is None
+
+    results = index.search("Globe", limit=5)
+    assert [m.record["company_name"] for m in results] == ["Globex"]
+
+
+def test_search_ranks_one_match_per_company():
+    index = CompanyIndex(
+        [
+            {"company_name": "Northwind Traders", "aliases": ["Northwind Trading"]},
+            {"company_name": "Northwind Health"},
+        ]
+    )
+    results = index.search("northwind trader", limit=5)
+    names = [m.record["company_name"] for m in results]
+    assert names[0] == "Northwind Traders" and len(names) == len(set(names))
+    assert results == sorted(results, key=lambda m: -m.score)
+
@@ -0,0 +1,125 @@
+"""Background dispatch of non-blocking post-hooks."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import List
+
+import pytest
+
+from hooks.base import Hook, HookManager
+from hooks.dispatch import BackgroundDispatcher, QueuePolicy
+from hooks.metrics import MetricsHook
+from mcp.registry import ToolRegistry
+from skills.base import Skill, SkillContext, SkillResult
+
+
+class _Echo(Skill):
+    name = "echo"
+    description = "e"
+
+    async def invoke(self, arguments, ctx):
+        return SkillResult(success=True, output="ok")
+
+
+class _SlowObserver(Hook):
+    blocking = False
+
+    def __init__(self, delay: float = 0.1) -> None:
+        self.delay = delay
+        self.seen: List[str] = []
+
+    async def post(self, spec, arguments, ctx, result, duration_ms):
+        await asyncio.sleep(self.delay)
+        self.seen.append(spec.name)
+
+
+class _InlineObserver(Hook):
+    def __init__(self) -> None:
+        self.seen: List[str] = []
+
+    async def post(self, spec, arguments, ctx, result, duration_ms):
+        self.seen.append(spec.name)
+
+
+def _registry(*post: Hook, dispatcher=None) -> ToolRegistry:
+    reg = ToolRegistry(hook_manager=HookManager(post=list(post), dispatcher=dispatcher))
+    reg.register(_Echo())
+    return reg
+
+
+@pytest.mark.asyncio
+async def test_non_blocking_hook_runs_after_result_is_returned():
+    slow, inline = _SlowObserver(), _InlineObserver()
+    reg = _registry(slow, inline, dispatcher=BackgroundDispatcher())
+
+    start = time.perf_counter()
+    result = await reg.invoke("echo", {}, SkillContext())
+    elapsed = time.perf_counter() - start
+
+    assert result.success and elapsed < 0.05
+    assert inline.seen == ["echo"]  # blocking hooks keep inline semantics
+    assert slow.seen == []
+
+    await reg._hook_manager.flush()
+    assert slow.seen == ["echo"]
+
+
+@pytest.mark.asyncio
+async def test_without_dispatcher_non_blocking_hooks_run_inline():
+    slow = _SlowObserver(delay=0)
+    await _registry(slow).invoke("echo", {}, SkillContext())
+    assert slow.seen == ["echo"]
+
+
+@pytest.mark.asyncio
+async def test_drop_policy_counts_overflow_and_reports_depth():
+    metrics = MetricsHook()
+    slow = _SlowObserver(delay=0.05)
+    dispatcher = BackgroundDispatcher(max_queue=2, policy=QueuePolicy.DROP, metrics=metrics)
+    reg = _registry(slow, dispatcher=dispatcher)
+
+    for _ in range(6):
+        await reg.invoke("echo", {}, SkillContext())
+
+    # Nothing yielded to the worker yet: two queued, the rest dropped.
+    assert dispatcher.dropped == 4
+    assert metrics.counters()["post_hooks_dropped"] == 4
+    assert metrics.counters()["post_hook_queue_depth"] == 2
+
+    await dispatcher.aclose()
+    assert len(slow.seen) == 2
+    assert metrics.counters()["post_hook_queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_block_policy_applies_backpressure_and_loses_nothing():
+    slow = _SlowObserver(delay=0.05)
+    dispatcher = BackgroundDispatcher(max_queue=1, policy=QueuePolicy.BLOCK)
+    reg = _registry(slow, dispatcher=dispatcher)
+
+    start = time.perf_counter()
+    for _ in range(4):
+        await reg.invoke("echo", {}, SkillContext())
+    elapsed = time.perf_counter() - start
+
+    assert elapsed >= 0.09  # callers waited for room
+    await dispatcher.aclose()
+    assert len(slow.seen) == 4 and dispatcher.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_failing_background_hook_is_logged_not_raised(caplog):
+    class Broken(Hook):
+        blocking = False
+
+        async def post(self, *args):
+            raise RuntimeError("boom")
+
+    dispatcher = BackgroundDispatcher()
+    reg = _registry(Broken(), dispatcher=dispatcher)
+    assert (await reg.invoke("echo", {}, SkillContext())).success
+    await dispatcher.aclose()
+    assert dispatcher.processed == 1
+    assert "post-hook Broken failed" in caplog.text
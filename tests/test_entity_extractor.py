@@ -0,0 +1,124 @@
+"""Local entity extraction: labelled corpus, plus CompanyHandler wiring."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from langchain_core.language_models.fake import FakeListLLM
+
+from data.knowledge_base import JSONKnowledgeBase
+from handlers.company import CompanyHandler
+from handlers.entity_extractor import EntityExtractor
+from hooks.metrics import MetricsHook
+
+_RECORDS = [
+    {
+        "company_name": "Acme Corporation",
+        "aliases": ["Roadrunner Supply"],
+        "project_details": "Demand forecasting",
+        "worked_with": "2020",
+        "contacts": ["Jane Doe"],
+    },
+    {"company_name": "Globex", "project_details": "Chatbot", "worked_with": "2022", "contacts": []},
+    {"company_name": "The Home Depot", "project_details": "BI", "worked_with": "2021", "contacts": []},
+]
+
+# Messages the extractor must answer locally: (message, company, is_query, change).
+POSITIVE = [
+    ("Tell me about Acme", "acme corporation", True, False),
+    ("tell me more about acme corp.", "acme corporation", True, False),
+    ("What do we know about Roadrunner Supply?", "acme corporation", True, False),
+    ("Can you look up Globex for me", "globex", True, False),
+    ("who is our contact at Globex?", "globex", True, False),
+    ("background on The Home Depot", "the home depot", True, False),
+    ("have we worked with Acme's team before", "acme corporation", True, False),
+    ("Globex?", "globex", True, False),
+    ("switch to Globex", "globex", False, True),
+    ("Let's change the company to Acme Corporation", "acme corporation", False, True),
+    ("Tell me about Initech", "initech", True, False),
+    ("switch to Initech Ltd.", "initech ltd", False, True),
+]
+
+# Messages the extractor must leave to the LLM.
+NEGATIVE = [
+    "what about their revenue?",
+    "tell me about their revenue",
+    "Who is John Smith?",
+    "Tell me about Acme and Globex",
+    "draft a proposal for Acme",
+    "Acme's revenue last year",
+    "how big is the company?",
+    "hi",
+    "",
+]
+
+
+@pytest.fixture
+def extractor(tmp_path):
+    path = tmp_path / "known.json"
+    path.write_text(json.dumps(_RECORDS))
+    return EntityExtractor(JSONKnowledgeBase(str(path)))
+
+
+def test_extractor_precision_and_recall_on_corpus(extractor):
+    for message, company, is_query, change in POSITIVE:
+        result = extractor.match(message)
+        assert result is not None, message
+        assert (result.company_name, result.is_company_query, result.change_company) == (
+            company,
+            is_query,
+            change,
+        ), message
+    for message in NEGATIVE:
+        assert extractor.match(message) is None, message
+
+    stats = extractor.stats()
+    assert stats["hits"] == len(POSITIVE) and stats["misses"] == len(NEGATIVE)
+
+
+def test_known_company_carries_its_match(extractor):
+    result = extractor.match("tell me about roadrunner supply")
+    assert result.match.how == "alias"
+    assert result.match.record["company_name"] == "Acme Corporation"
+
+
+def test_ms_saved_uses_observed_llm_latency(extractor):
+    extractor.match("switch to Globex")
+    extractor.record_llm_extraction(0.8)
+    extractor.record_llm_extraction(1.2)
+    stats = extractor.stats()
+    assert stats["llm_ms_mean"] == 1000.0
+    assert stats["ms_saved"] == 1000.0
+
+
+@pytest.mark.asyncio
+async def test_handler_skips_llm_extraction_on_local_hit(extractor):
+    metrics = MetricsHook()
+    llm = FakeListLLM(responses=["Initech makes TPS reports", "unused"])
+    handler = CompanyHandler(llm, extractor=extractor, metrics=metrics)
+
+    reply = await handler.handle("Tell me about Acme", "s-local")
+    assert reply.startswith("Acme Corporation is a known company")
+    reply = await handler.handle("Tell me about Initech", "s-local")
+    # The only LLM call was the profile; extraction never reached it.
+    assert reply == "Initech makes TPS reports" and llm.i == 1
+
+    counters = metrics.counters()
+    assert counters["company_extraction_local_hits"] == 2
+    assert counters["llm_calls_saved"] == 2
+    assert counters["company_extraction_hit_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_handler_falls_back_to_llm_when_unsure(extractor):
+    metrics = MetricsHook()
+    llm = FakeListLLM(
+        responses=['{"company_name": "globex", "is_company_query": false, "change_company": true}']
+    )
+    handler = CompanyHandler(llm, extractor=extractor, metrics=metrics)
+
+    reply = await handler.handle("ok, Globex from here on", "s-llm")
+    assert reply == "Company context changed to Globex."
+    assert metrics.counters()["company_extraction_llm_fallbacks"] == 1
+    assert extractor.stats()["llm_ms_mean"] > 0
@@ -0,0 +1,199 @@
+"""Fast-path router: labelled corpus for precision/recall, plus agent wiring."""
+
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+from langchain_core.language_models.fake_chat_models import (
+    FakeMessagesListChatModel,
+)
+from langchain_core.messages import AIMessage
+
+from agent.fast_path import FastPathRouter
+from agent.sales_agent import SalesAgent
+from hooks.base import HookManager
+from hooks.metrics import MetricsHook
+from mcp.registry import ToolRegistry
+from skills.farewell import FarewellSkill
+from skills.greeting import GreetingSkill
+from skills.thanks import ThanksSkill
+
+# Messages the router must answer locally, with the skill it should pick.
+POSITIVE = [
+    ("hi", "greet_user"),
+    ("Hi!", "greet_user"),
+    ("hello", "greet_user"),
+    ("Hello Jordan", "greet_user"),
+    ("hey there", "greet_user"),
+    ("hey 👋", "greet_user"),
+    ("Good morning!", "greet_user"),
+    ("good afternoon team", "greet_user"),
+    ("howdy", "greet_user"),
+    ("yo", "greet_user"),
+    ("thanks", "acknowledge_thanks"),
+    ("Thanks!", "acknowledge_thanks"),
+    ("thank you", "acknowledge_thanks"),
+    ("Thank you so much", "acknowledge_thanks"),
+    ("thanks a lot Jordan", "acknowledge_thanks"),
+    ("thx", "acknowledge_thanks"),
+    ("much appreciated", "acknowledge_thanks"),
+    ("appreciate it", "acknowledge_thanks"),
+    ("great, thanks for the help", "acknowledge_thanks"),
+    ("cheers", "acknowledge_thanks"),
+    ("bye", "say_goodbye"),
+    ("Goodbye!", "say_goodbye"),
+    ("bye bye", "say_goodbye"),
+    ("see you later", "say_goodbye"),
+    ("talk later", "say_goodbye"),
+    ("talk to you soon", "say_goodbye"),
+    ("ttyl", "say_goodbye"),
+    ("thanks, that's all", "say_goodbye"),
+    ("that's all for now", "say_goodbye"),
+    ("ok bye", "say_goodbye"),
+    ("have a great day", "say_goodbye"),
+]
+
+# Messages that must reach the agent: business requests, even when they
+# open or close with a pleasantry.
+NEGATIVE = [
+    "hi, can you tell me about Tesla?",
+    "hello, I need to create an opportunity",
+    "hey what do we know about Google",
+    "thanks, now draft a proposal for Acme",
+    "thank you, what about their revenue?",
+    "thanks for the Google info, what about Tesla?",
+    "bye the way, who is our contact at Tesla?",
+    "say goodbye to the Acme deal and close it lost",
+    "Hello Corp company profile",
+    "create opportunity for Hey Inc",
+    "good morning, draft a pitch deck for Tesla",
+    "what's the weather?",
+    "see you at the Acme meeting, can you prep a deck",
+    "Draft a proposal for Thanks Ltd",
+]
+
+
+def test_router_precision_and_recall_on_corpus():
+    router = FastPathRouter()
+
+    true_pos = sum(router.match(msg) == skill for msg, skill in POSITIVE)
+    false_pos = sum(router.match(msg) is not None for msg in NEGATIVE)
+    wrong_skill = [
+        (msg, router.match(msg)) for msg, skill in POSITIVE
+        if router.match(msg) not in (None, skill)
+    ]
+
+    precision = true_pos / (true_pos + false_pos + len(wrong_skill))
+    recall = true_pos / len(POSITIVE)
+    assert precision == 1.0, (false_pos, wrong_skill)
+    assert recall >= 0.95
+
+
+def test_router_tracks_hit_rate():
+    router = FastPathRouter()
+    router.match("hi")
+    assert router.stats()["hits"] == 0  # a match alone isn't a hit
+    router.record(True)
+    router.record(False)
+    assert router.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_router_ignores_long_messages():
+    assert FastPathRouter(max_length=10).match("hello hello hello hello") is None
+
+
+def _conversational_registry(metrics: MetricsHook) -> ToolRegistry:
+    reg = ToolRegistry(hook_manager=HookManager(post=[metrics]))
+    reg.register(GreetingSkill())
+    reg.register(ThanksSkill())
+    reg.register(FarewellSkill())
+    return reg
+
+
+@pytest.mark.asyncio
+async def test_agent_fast_path_skips_llm_but_runs_hooks():
+    metrics = MetricsHook()
+    # An LLM with no scripted responses: any call would raise.
+    llm = FakeMessagesListChatModel(responses=[])
+    agent = SalesAgent(
+        llm=llm,
+        registry=_conversational_registry(metrics),
+        fast_path=FastPathRouter(),
+        metrics=metrics,
+    )
+
+    reply = await agent.run("Thanks!", "s1")
+
+    assert reply.startswith("You're welcome")
+    assert metrics.snapshot()["acknowledge_thanks"]["success"] == 1
+    counters = metrics.counters()
+    assert counters["fast_path_hits"] == 1
+    assert counters["llm_calls_saved"] == 2
+    assert counters["fast_path_hit_rate"] == 1.0
+
+
+class _RecordingMemory:
+    """Counts history loads; keeps saved replies."""
+
+    def __init__(self) -> None:
+        self.loads = 0
+        self.saved: List[str] = []
+
+    async def load(self, session_id):
+        self.loads += 1
+        return []
+
+    async def save_turn(self, session_id, user_input, output):
+        self.saved.append(output)
+
+
+@pytest.mark.asyncio
+async def test_agent_fast_path_skips_executor_and_history():
+    memory = _RecordingMemory()
+    agent = SalesAgent(
+        llm=FakeMessagesListChatModel(responses=[]),
+        registry=_conversational_registry(MetricsHook()),
+        fast_path=FastPathRouter(),
+        memory=memory,
+    )
+
+    await agent.run("hi", "s1")
+    [event async for event in agent.astream("thanks", "s1")]
+
+    assert agent._executor is None
+    assert memory.loads == 0
+    assert len(memory.saved) == 2
+
+
+@pytest.mark.asyncio
+async def test_agent_fast_path_counts_unregistered_skill_as_miss():
+    metrics = MetricsHook()
+    reg = ToolRegistry(hook_manager=HookManager(post=[metrics]))
+    reg.register(ThanksSkill())  # no greet_user
+    router = FastPathRouter()
+    agent = SalesAgent(
+        llm=FakeMessagesListChatModel(responses=[AIMessage(content="Hello from the agent")]),
+        registry=reg,
+        fast_path=router,
+        metrics=metrics,
+    )
+
+    assert await agent.run("hi", "s1") == "Hello from the agent"
+    assert router.stats() == {"hits": 0, "misses": 1, "hit_rate": 0.0}
+    counters = metrics.counters()
+    assert counters["fast_path_misses"] == 1
+    assert "fast_path_hits" not in counters
+
+
+@pytest.mark.asyncio
+async def test_agent_fast_path_streams_final_event():
+    metrics = MetricsHook()
+    agent = SalesAgent(
+        llm=FakeMessagesListChatModel(responses=[]),
+        registry=_conversational_registry(metrics),
+        fast_path=FastPathRouter(),
+    )
+    events = [e async for e in agent.astream("bye", "s1")]
+    assert [e.type for e in events] == ["tool_start", "tool_end", "final"]
+    assert events[-1].text.startswith("Goodbye")
@@ -0,0 +1,57 @@
+"""Log-bucketed histograms: accuracy, bounded memory, sliding window."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from observability.histogram import LogHistogram, SlidingHistogram
+
+
+def _exact(samples, q):
+    ordered = sorted(samples)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def test_quantiles_within_relative_error():
+    rng = random.Random(7)
+    samples = [rng.lognormvariate(4, 1.2) for _ in range(20_000)]
+    hist = LogHistogram(relative_error=0.02)
+    for value in samples:
+        hist.record(value)
+
+    for q in (0.5, 0.9, 0.99):
+        assert hist.quantile(q) == pytest.approx(_exact(samples, q), rel=0.021)
+    assert hist.max == max(samples)
+    assert hist.mean() == pytest.approx(sum(samples) / len(samples))
+
+
+def test_memory_does_not_grow_with_samples():
+    hist = LogHistogram()
+    size = len(hist._buckets)
+    for i in range(50_000):
+        hist.record(float(i % 5000) + 0.5)
+    assert len(hist._buckets) == size
+
+
+def test_empty_and_out_of_range_values():
+    hist = LogHistogram(min_value=1.0, max_value=100.0)
+    assert hist.quantile(0.5) == 0.0
+    hist.record(0.001)
+    hist.record(10_000.0)
+    assert hist.quantile(0.0) == 0.001
+    assert hist.quantile(1.0) == 10_000.0
+
+
+def test_sliding_window_forgets_old_samples(clock):
+    hist = SlidingHistogram(60, slices=6, clock=clock)
+    hist.record(1000.0)
+    clock.now = 30
+    hist.record(5.0)
+    assert hist.merged().count == 2
+
+    clock.now = 65  # the first slice has left the window
+    merged = hist.merged()
+    assert merged.count == 1
+    assert merged.max == 5.0
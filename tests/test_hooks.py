@@ -6,6 +6,7 @@ from typing import Any, Dict
 
 import pytest
 
+from hooks.base import Hook
 from hooks.enrichment import SessionEnrichmentHook
 from hooks.logging_hook import AuditLogHook
 from mcp.registry import ToolRegistry, ToolSpec
@@ -64,3 +65,83 @@ async def test_audit_log_hook_emits_structured_record(caplog):
         duration_ms=12.3,
     )
     assert any("tool_invocation" in rec.message for rec in caplog.records)
+
+
+@pytest.mark.asyncio
+async def test_metrics_snapshot_reports_percentiles_and_renders_prometheus():
+    from hooks.metrics import MetricsHook
+    from observability.prometheus import render_prometheus
+
+    metrics = MetricsHook()
+    for ms in range(1, 101):
+        await metrics.post(_spec(), {}, SkillContext(), SkillResult(success=True), float(ms))
+    metrics.incr("fast_path_hits")
+
+    stats = metrics.snapshot()["dummy"]
+    assert stats["invocations"] == 100
+    assert stats["max_latency_ms"] == 100.0
+    assert stats["p50_latency_ms"] == pytest.approx(50, rel=0.03)
+    assert stats["p99_latency_ms"] == pytest.approx(99, rel=0.03)
+
+    text = render_prometheus(metrics.snapshot(), metrics.counters())
+    assert 'essales_tool_invocations_total{tool="dummy",outcome="success"} 100' in text
+    assert 'essales_tool_latency_ms{tool="dummy",quantile="0.99"}' in text
+    assert "essales_tool_latency_ms_count{tool=\"dummy\"} 100" in text
+    assert "essales_fast_path_hits 1.0" in text
+
+
+def test_labelled_counters_render_one_series_per_tool():
+    from hooks.metrics import MetricsHook
+    from observability.prometheus import render_prometheus
+
+    metrics = MetricsHook()
+    metrics.incr("bulkhead_rejected", labels={"tool": "draft_proposal"})
+    metrics.incr("bulkhead_rejected", 2, labels={"tool": "lookup"})
+    metrics.incr("bulkhead_rejected", labels={"tool": "lookup"})
+
+    assert metrics.value("bulkhead_rejected", tool="lookup") == 3
+    assert metrics.value("bulkhead_rejected", tool="unseen") == 0
+    assert metrics.counters() == {}
+    text = render_prometheus(metrics.snapshot(), metrics.counters(), metrics.labelled())
+    assert "# TYPE essales_bulkhead_rejected_total counter" in text
+    assert 'essales_bulkhead_rejected_total{tool="draft_proposal"} 1' in text
+    assert 'essales_bulkhead_rejected_total{tool="lookup"} 3' in text
+
+
+class _PostOnly(Hook):
+    async def post(self, spec, arguments, ctx, result, duration_ms):
+        return None
+
+
+class _NoUserMessageSkill(_DummySkill):
+    name = "bare"
+    input_schema = {"type": "object", "properties": {}, "required": []}
+
+
+def test_pipeline_keeps_only_overriding_and_applicable_hooks():
+    from hooks.base import HookManager
+    from hooks.error_hook import RetryAndFallbackHook
+
+    enrich, post_only, retry = SessionEnrichmentHook(), _PostOnly(), RetryAndFallbackHook()
+    manager = HookManager(pre=[enrich, post_only], post=[post_only, enrich], error=[retry])
+    bare = ToolRegistry().register(_NoUserMessageSkill())
+
+    with_message = manager.pipeline(_spec())
+    assert with_message.pre == [enrich]
+    assert with_message.post == [post_only]
+    assert with_message.error == [retry]
+    # Enrichment has nothing to do for a tool without `user_message`.
+    assert manager.pipeline(bare).pre == []
+
+
+def test_pipeline_is_cached_and_invalidated_by_add():
+    from hooks.base import HookManager
+
+    manager = HookManager()
+    spec = _spec()
+    first = manager.pipeline(spec)
+    assert manager.pipeline(spec) is first
+
+    manager.add_post(_PostOnly())
+    assert manager.pipeline(spec) is not first
+    assert len(manager.pipeline(spec).post) == 1
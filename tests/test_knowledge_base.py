@@ -0,0 +1,225 @@
+"""Tests for the knowledge-base backends and hot reload."""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langchain_core.messages import AIMessage
+
+from data import sqlite_kb
+from data.knowledge_base import (
+    FileWatcher,
+    JSONKnowledgeBase,
+    get_knowledge_base,
+    open_knowledge_base,
+)
+from agent.sales_agent import SalesAgent
+from hooks.base import HookManager
+from hooks.metrics import MetricsHook
+from mcp.registry import ToolRegistry
+from skills.base import SkillContext
+from skills.search_projects import SearchProjectsSkill
+
+_RECORDS = [
+    {
+        "company_name": "Acme Corporation",
+        "aliases": ["Roadrunner Supply"],
+        "project_details": "Demand forecasting models for retail inventory",
+        "skills_required": ["Python", "Forecasting"],
+        "resources_used": ["Azure ML"],
+        "worked_with": "Jane",
+        "contacts": ["jane@acme.com"],
+    },
+    {
+        "company_name": "Globex Inc",
+        "project_details": "Customer support chatbot",
+        "skills_required": ["NLP"],
+        "resources_used": ["OpenAI"],
+    },
+]
+
+
+def _write_json(path, records):
+    path.write_text(json.dumps(records))
+    # Make the change visible even on filesystems with coarse mtimes.
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10**9))
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def kb(request, tmp_path):
+    if request.param == "json":
+        path = tmp_path / "known.json"
+        _write_json(path, _RECORDS)
+    else:
+        path = tmp_path / "known.db"
+        sqlite_kb.build(_RECORDS, str(path))
+    kb = open_knowledge_base(str(path))
+    yield kb
+    kb.close()
+
+
+@pytest.mark.parametrize(
+    "query, how",
+    [
+        ("ACME Corp.", "exact"),
+        ("roadrunner supply", "alias"),
+        ("Road Runner Suply", "fuzzy"),
+    ],
+)
+def test_backends_agree_on_lookups(kb, query, how):
+    match = kb.lookup(query)
+    assert match.record["company_name"] == "Acme Corporation"
+    assert match.how == how
+    assert match.record["contacts"] == ["jane@acme.com"]
+
+
+def test_lookup_miss_and_count(kb):
+    assert kb.lookup("Initech") is None
+    assert kb.lookup("   ") is None
+    assert kb.count() == 2
+
+
+def test_search_projects_finds_matching_work(kb):
+    hits = kb.search_projects("forecasting for retailers")
+    assert [h["company_name"] for h in hits] == ["Acme Corporation"]
+    assert kb.search_projects("chatbot")[0]["company_name"] == "Globex Inc"
+    assert kb.search_projects("blockchain") == []
+
+
+def test_sqlite_build_replaces_the_file_atomically(tmp_path):
+    db = tmp_path / "known.db"
+    assert sqlite_kb.build(_RECORDS, str(db)) == 2
+    assert sqlite_kb.build(_RECORDS[:1], str(db)) == 1
+    assert os.listdir(tmp_path) == ["known.db"]
+
+
+def test_watcher_reloads_in_the_background_once_per_change(tmp_path, clock):
+    path = tmp_path / "known.json"
+    path.write_text("[]")
+    reloads = []
+    watcher = FileWatcher(str(path), lambda: reloads.append(1), interval_s=5, clock=clock)
+
+    _write_json(path, _RECORDS)
+    watcher.poll()  # throttled: the interval hasn't passed
+    assert reloads == []
+    clock.now = 5
+    watcher.poll()
+    watcher.join()
+    assert reloads == [1]
+    clock.now = 10
+    watcher.poll()  # same file: nothing to do
+    watcher.join()
+    assert reloads == [1]
+
+
+def test_failed_reload_keeps_serving_old_data(tmp_path):
+    path = tmp_path / "known.json"
+    _write_json(path, _RECORDS)
+    kb = JSONKnowledgeBase(str(path), check_interval_s=0)
+
+    path.write_text("not json")
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 2 * 10**9))
+    kb.lookup("acme")
+    kb.watcher.join()
+    assert kb.lookup("acme").record["company_name"] == "Acme Corporation"
+
+
+def test_failed_reload_waits_for_the_next_change(tmp_path, clock):
+    path = tmp_path / "known.json"
+    path.write_text("[]")
+    attempts = []
+
+    def _reload():
+        attempts.append(1)
+        raise ValueError("bad file")
+
+    watcher = FileWatcher(str(path), _reload, interval_s=1, clock=clock)
+    _write_json(path, _RECORDS)
+    for clock.now in (1, 2, 3):
+        watcher.poll()
+        watcher.join()
+    assert attempts == [1]
+
+    path.write_text("[]")
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 2 * 10**9))
+    clock.now = 4
+    watcher.poll()
+    watcher.join()
+    assert attempts == [1, 1]
+
+
+@pytest.mark.parametrize("suffix", [".json", ".db"])
+def test_hot_reload_picks_up_a_rebuilt_file(tmp_path, suffix):
+    path = tmp_path / f"known{suffix}"
+    renamed = [dict(_RECORDS[1], company_name="Initech")]
+
+    def write(records):
+        if suffix == ".json":
+            _write_json(path, records)
+        else:
+            sqlite_kb.build(records, str(path))
+
+    write(_RECORDS)
+    kb = open_knowledge_base(str(path), check_interval_s=0)
+    assert kb.lookup("initech") is None
+
+    write(renamed)
+    kb.lookup("initech")  # notices the change, reloads off-thread
+    kb.watcher.join()
+    assert kb.lookup("initech").record["company_name"] == "Initech"
+    assert kb.count() == 1
+    kb.close()
+
+
+def test_shared_instance_per_path(tmp_path):
+    path = tmp_path / "known.json"
+    _write_json(path, _RECORDS)
+    assert get_knowledge_base(str(path)) is get_knowledge_base(str(path))
+
+
+def test_unknown_extension_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="known.csv"):
+        open_knowledge_base(str(tmp_path / "known.csv"))
+
+
+@pytest.mark.asyncio
+async def test_search_projects_skill(tmp_path):
+    path = tmp_path / "known.db"
+    sqlite_kb.build(_RECORDS, str(path))
+    skill = SearchProjectsSkill(data_path=str(path))
+    result = await skill.invoke({"query": "inventory forecasting"}, SkillContext())
+    assert result.success
+    assert result.output[0]["company_name"] == "Acme Corporation"
+    assert result.metadata["found"] == 1
+
+
+@pytest.mark.asyncio
+async def test_agent_can_call_search_projects_without_a_limit(tmp_path):
+    path = tmp_path / "known.db"
+    sqlite_kb.build(_RECORDS, str(path))
+    metrics = MetricsHook()
+    reg = ToolRegistry(hook_manager=HookManager(post=[metrics]))
+    reg.register(SearchProjectsSkill(data_path=str(path)))
+    # The model leaves out the optional `limit`, as it usually does.
+    call = AIMessage(
+        content="",
+        additional_kwargs={
+            "tool_calls": [
+                {
+                    "id": "call_1",
+                    "type": "function",
+                    "function": {
+                        "name": "search_past_projects",
+                        "arguments": json.dumps({"query": "forecasting"}),
+                    },
+                }
+            ]
+        },
+    )
+    llm = FakeMessagesListChatModel(responses=[call, AIMessage(content="done")])
+
+    assert await SalesAgent(llm=llm, registry=reg).run("who did forecasting?", "s1") == "done"
+    assert metrics.snapshot()["search_past_projects"]["success"] == 1
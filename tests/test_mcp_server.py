@@ -0,0 +1,241 @@
+"""JSON-RPC MCP server: protocol handling and the stdio/HTTP transports."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+
+from mcp.jsonrpc import PROTOCOL_VERSIONS, MCPServer, MCPSession
+from mcp.registry import ToolRegistry
+from mcp.transport import VERSION_HEADER, http_router, manifest_response, serve_stream
+from tests.stubs import EchoSkill
+
+
+def _server() -> MCPServer:
+    reg = ToolRegistry()
+    reg.register(EchoSkill())
+    return MCPServer(reg)
+
+
+def _call(request_id, message, delay=0.0):
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {"name": "echo", "arguments": {"message": message, "delay": delay}},
+    }
+
+
+@pytest.mark.asyncio
+async def test_initialize_negotiates_protocol_version():
+    server, session = _server(), MCPSession()
+    reply = await server.handle(
+        {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {"protocolVersion": "2024-11-05", "clientInfo": {"name": "t"}},
+        },
+        session,
+    )
+    assert reply["result"]["protocolVersion"] == "2024-11-05"
+    assert reply["result"]["capabilities"] == {"tools": {"listChanged": False}}
+
+    reply = await server.handle(
+        {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "method": "initialize",
+            "params": {"protocolVersion": "1999"},
+        },
+        session,
+    )
+    assert reply["result"]["protocolVersion"] == PROTOCOL_VERSIONS[0]
+
+    note = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+    assert await server.handle(note, session) is None
+    assert session.initialized
+
+
+@pytest.mark.asyncio
+async def test_tools_list_and_call():
+    server, session = _server(), MCPSession()
+    listed = await server.handle(
+        {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}, session
+    )
+    (tool,) = listed["result"]["tools"]
+    assert tool["name"] == "echo" and "outputSchema" not in tool
+
+    ok = await server.handle(_call(2, "hi"), session)
+    assert ok == {
+        "jsonrpc": "2.0",
+        "id": 2,
+        "result": {"isError": False, "content": [{"type": "text", "text": "hi"}]},
+    }
+    failed = await server.handle(_call(3, "fail"), session)
+    assert failed["result"]["isError"] is True
+
+
+@pytest.mark.asyncio
+async def test_protocol_errors():
+    server, session = _server(), MCPSession()
+    parse = json.loads(await server.handle_raw(b"{nope", session))
+    assert parse["error"]["code"] == -32700 and parse["id"] is None
+
+    invalid = await server.handle({"id": 1, "method": "ping"}, session)
+    assert invalid["error"]["code"] == -32600
+
+    unknown = await server.handle({"jsonrpc": "2.0", "id": 2, "method": "nope"}, session)
+    assert unknown["error"]["code"] == -32601
+
+    bad_tool = await server.handle(
+        {"jsonrpc": "2.0", "id": 3, "method": "tools/call", "params": {"name": "x"}},
+        session,
+    )
+    assert bad_tool["error"]["code"] == -32602
+
+
+@pytest.mark.asyncio
+async def test_batch_replies_in_order_without_notifications():
+    server, session = _server(), MCPSession()
+    replies = await server.handle(
+        [
+            _call(1, "slow", delay=0.05),
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            _call(2, "fast"),
+        ],
+        session,
+    )
+    assert [r["id"] for r in replies] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_batch_tool_calls_are_bounded():
+    reg = ToolRegistry()
+    reg.register(EchoSkill())
+    server, session = MCPServer(reg, max_batch=4, batch_concurrency=2), MCPSession()
+
+    start = time.perf_counter()
+    replies = await server.handle([_call(i, f"m{i}", delay=0.05) for i in range(4)], session)
+    assert time.perf_counter() - start >= 0.1  # two at a time
+    assert [r["result"]["content"][0]["text"] for r in replies] == ["m0", "m1", "m2", "m3"]
+
+    too_big = await server.handle([_call(i, "x") for i in range(5)], session)
+    assert too_big["error"]["code"] == -32600
+
+    unknown = {"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": {"name": "x"}}
+    mixed = await server.handle([_call(1, "ok"), unknown], session)
+    assert mixed[0]["result"]["content"][0]["text"] == "ok"
+    assert mixed[1]["error"]["code"] == -32602
+
+
+@pytest.mark.asyncio
+async def test_stream_transport_pipelines_requests():
+    server = _server()
+
+    async def _handle(reader, writer):
+        await serve_stream(server, reader, writer, transport="tcp")
+        writer.close()
+
+    listener = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(json.dumps(_call("slow", "a", delay=0.2)).encode() + b"\n")
+        writer.write(json.dumps(_call("fast", "b")).encode() + b"\n")
+        await writer.drain()
+        first = json.loads(await reader.readline())
+        second = json.loads(await reader.readline())
+    finally:
+        writer.close()
+        listener.close()
+        await listener.wait_closed()
+
+    # The fast request isn't stuck behind the slow one; ids correlate.
+    assert first["id"] == "fast" and first["result"]["content"][0]["text"] == "b"
+    assert second["id"] == "slow" and second["result"]["content"][0]["text"] == "a"
+
+
+def test_http_transport():
+    app = FastAPI()
+    app.include_router(http_router(_server()))
+    client = TestClient(app)
+
+    reply = client.post("/mcp", json=_call(1, "over http"))
+    assert reply.status_code == 200
+    assert reply.json()["result"]["content"][0]["text"] == "over http"
+
+    note = client.post(
+        "/mcp", json={"jsonrpc": "2.0", "method": "notifications/initialized"}
+    )
+    assert note.status_code == 202
+
+
+def test_http_transport_runs_auth_dependencies():
+    def _deny() -> None:
+        raise HTTPException(status_code=401)
+
+    app = FastAPI()
+    app.include_router(http_router(_server(), dependencies=[Depends(_deny)]))
+    reply = TestClient(app).post("/mcp", json=_call(1, "blocked"))
+    assert reply.status_code == 401
+
+
+def test_manifest_is_cached_per_registry_version():
+    reg = ToolRegistry()
+    reg.register(EchoSkill())
+    manifest, body, etag = reg.get_manifest(), reg.manifest_bytes(), reg.manifest_etag
+    assert reg.get_manifest() is manifest and reg.manifest_bytes() is body
+    assert json.loads(body) == manifest
+
+    class _Other(EchoSkill):
+        name = "other"
+
+    version = reg.version
+    reg.register(_Other())
+    assert reg.version == version + 1
+    assert reg.manifest_etag != etag
+    assert [t["name"] for t in reg.get_manifest()["tools"]] == ["echo", "other"]
+
+
+def test_manifest_etag_and_conditional_get():
+    reg = ToolRegistry()
+    reg.register(EchoSkill())
+    app = FastAPI()
+
+    @app.get("/tools")
+    def tools(request: Request):
+        return manifest_response(reg, request.headers.get("if-none-match"))
+
+    client = TestClient(app)
+
+    first = client.get("/tools")
+    assert first.status_code == 200
+    assert first.json() == reg.get_manifest()
+    etag = first.headers["etag"]
+    assert first.headers[VERSION_HEADER] == str(reg.version)
+
+    cached = client.get("/tools", headers={"If-None-Match": etag})
+    assert cached.status_code == 304 and cached.content == b""
+    assert manifest_response(reg, f'"stale", W/{etag}').status_code == 304
+    assert manifest_response(reg, "*").status_code == 304
+    assert manifest_response(reg, '"stale"').status_code == 200
+
+    class _Other(EchoSkill):
+        name = "other"
+
+    reg.register(_Other())
+    assert manifest_response(reg, etag).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_tools_list_fast_path_matches_full_reply():
+    server = _server()
+    request = {"jsonrpc": "2.0", "id": 7, "method": "tools/list"}
+    raw = json.loads(await server.handle_raw(json.dumps(request), MCPSession()))
+    assert raw == await server.handle(request, MCPSession())
@@ -0,0 +1,151 @@
+"""SummarizingMemory: bounded verbatim window + incremental rolling summary."""
+
+from __future__ import annotations
+
+from typing import Dict, List, Sequence
+
+import asyncio
+
+import pytest
+from langchain_core.chat_history import InMemoryChatMessageHistory
+from langchain_core.messages import BaseMessage, SystemMessage
+
+from agent.memory import SummarizingMemory
+
+
+class _Histories:
+    """Session-keyed in-memory histories that survive across calls."""
+
+    def __init__(self) -> None:
+        self.store: Dict[str, InMemoryChatMessageHistory] = {}
+
+    def __call__(self, session_id: str) -> InMemoryChatMessageHistory:
+        return self.store.setdefault(session_id, InMemoryChatMessageHistory())
+
+
+class _RecordingSummarizer:
+    def __init__(self) -> None:
+        self.calls: List[int] = []
+
+    async def __call__(self, summary: str, new: Sequence[BaseMessage]) -> str:
+        self.calls.append(len(new))
+        return f"{summary}+{len(new)}" if summary else f"{len(new)}"
+
+
+@pytest.mark.asyncio
+async def test_keeps_recent_turns_verbatim_and_summarizes_the_rest():
+    summarizer = _RecordingSummarizer()
+    memory = SummarizingMemory(_Histories(), summarizer, keep_turns=2)
+    for i in range(5):
+        await memory.save_turn("s1", f"q{i}", f"a{i}")
+    await memory.wait_for_summaries()
+
+    loaded = await memory.load("s1")
+
+    assert isinstance(loaded[0], SystemMessage)
+    assert [m.content for m in loaded[1:]] == ["q3", "a3", "q4", "a4"]
+
+
+@pytest.mark.asyncio
+async def test_summary_is_updated_incrementally():
+    summarizer = _RecordingSummarizer()
+    memory = SummarizingMemory(_Histories(), summarizer, keep_turns=2)
+    for i in range(6):
+        await memory.save_turn("s1", f"q{i}", f"a{i}")
+        await memory.wait_for_summaries()
+
+    # Each overflowing turn folds only the exchange that just left the window.
+    assert summarizer.calls == [2, 2, 2, 2]
+    assert "+2+2+2" in (await memory.load("s1"))[0].content
+
+
+@pytest.mark.asyncio
+async def test_token_budget_forces_earlier_summarization():
+    summarizer = _RecordingSummarizer()
+    memory = SummarizingMemory(
+        _Histories(), summarizer, keep_turns=10, token_budget=30
+    )
+    for i in range(4):
+        await memory.save_turn("s1", "x" * 40, "y" * 40)  # ~20 tokens per turn
+    await memory.wait_for_summaries()
+
+    loaded = await memory.load("s1")
+
+    assert len(loaded) == 3  # summary + only the latest exchange
+    assert sum(summarizer.calls) == 6
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_isolated():
+    histories = _Histories()
+    memory = SummarizingMemory(histories, _RecordingSummarizer(), keep_turns=1)
+    await memory.save_turn("a", "qa", "aa")
+    await memory.save_turn("b", "qb", "ab")
+    assert [m.content for m in await memory.load("a")] == ["qa", "aa"]
+
+
+@pytest.mark.asyncio
+async def test_summary_is_dropped_when_raw_history_was_evicted():
+    histories = _Histories()
+    memory = SummarizingMemory(histories, _RecordingSummarizer(), keep_turns=1)
+    for i in range(3):
+        await memory.save_turn("s1", f"q{i}", f"a{i}")
+    await memory.wait_for_summaries()
+    histories.store["s1"].clear()  # e.g. expired from the session store
+
+    await memory.save_turn("s1", "again", "fresh")
+    await memory.wait_for_summaries()
+
+    assert [m.content for m in await memory.load("s1")] == ["again", "fresh"]
+
+
+class _GatedSummarizer(_RecordingSummarizer):
+    def __init__(self) -> None:
+        super().__init__()
+        self.gate = asyncio.Event()
+
+    async def __call__(self, summary: str, new: Sequence[BaseMessage]) -> str:
+        await self.gate.wait()
+        return await super().__call__(summary, new)
+
+
+@pytest.mark.asyncio
+async def test_summarizing_runs_off_the_response_path_one_fold_per_session():
+    summarizer = _GatedSummarizer()
+    memory = SummarizingMemory(_Histories(), summarizer, keep_turns=1)
+    for i in range(4):
+        # Returns while the summarizer is still blocked.
+        await asyncio.wait_for(memory.save_turn("s1", f"q{i}", f"a{i}"), 1)
+        await asyncio.sleep(0)
+    assert [m.content for m in await memory.load("s1")][-2:] == ["q3", "a3"]
+
+    summarizer.gate.set()
+    await memory.wait_for_summaries()
+
+    # The fold in flight took one exchange; the turns saved meanwhile were
+    # folded together in a single follow-up call.
+    assert summarizer.calls == [2, 4]
+    assert [m.content for m in (await memory.load("s1"))[1:]] == ["q3", "a3"]
+
+
+class _TailOnlyHistory(InMemoryChatMessageHistory):
+    async def aget_messages(self) -> List[BaseMessage]:
+        raise AssertionError("read the whole history")
+
+    async def aget_messages_from(self, start: int):
+        return len(self.messages), self.messages[start:]
+
+
+@pytest.mark.asyncio
+async def test_reads_skip_summarized_messages_when_the_history_allows():
+    store: Dict[str, InMemoryChatMessageHistory] = {}
+
+    def factory(session_id: str) -> InMemoryChatMessageHistory:
+        cls = InMemoryChatMessageHistory if session_id.endswith("_summary") else _TailOnlyHistory
+        return store.setdefault(session_id, cls())
+
+    memory = SummarizingMemory(factory, _RecordingSummarizer(), keep_turns=1)
+    for i in range(3):
+        await memory.save_turn("s1", f"q{i}", f"a{i}")
+        await memory.wait_for_summaries()
+    assert [m.content for m in (await memory.load("s1"))[1:]] == ["q2", "a2"]
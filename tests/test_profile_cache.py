@@ -0,0 +1,167 @@
+"""ProfileCache: tiers, TTL, stale-while-revalidate and single flight."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+from fakeredis import aioredis
+from langchain_core.language_models.fake import FakeListLLM
+
+from data.knowledge_base import JSONKnowledgeBase
+from data.profile_cache import ProfileCache
+from handlers.company import CompanyHandler
+from handlers.entity_extractor import EntityExtractor
+from hooks.metrics import MetricsHook
+
+
+class _Profiles:
+    """Counted fetch; `gate` holds calls open until it is set."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.calls = 0
+        self.fail = fail
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def __call__(self, company_name: str) -> str:
+        self.calls += 1
+        await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("LLM unavailable")
+        return f"{company_name} profile v{self.calls}"
+
+
+@pytest.mark.asyncio
+async def test_hit_shares_normalized_key():
+    cache, fetch = ProfileCache(), _Profiles()
+    first = await cache.get_or_fetch("Initech", fetch)
+    again = await cache.get_or_fetch("  INITECH Inc. ", fetch)
+    assert first == again == "Initech profile v1"
+    assert fetch.calls == 1
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_make_one_call():
+    cache, fetch = ProfileCache(), _Profiles()
+    fetch.gate.clear()
+    waiters = [asyncio.ensure_future(cache.get_or_fetch("Initech", fetch)) for _ in range(10)]
+    await asyncio.sleep(0)
+    fetch.gate.set()
+    assert set(await asyncio.gather(*waiters)) == {"Initech profile v1"}
+    assert fetch.calls == 1
+    assert cache.stats()["collapsed"] == 9
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_while_it_refreshes(clock):
+    fetch = _Profiles()
+    cache = ProfileCache(ttl_s=60, stale_s=30, clock=clock)
+    await cache.get_or_fetch("Initech", fetch)
+
+    clock.now += 70  # past the TTL, inside the stale window
+    assert await cache.get_or_fetch("Initech", fetch) == "Initech profile v1"
+    await cache.wait_for_refreshes()
+    assert await cache.get_or_fetch("Initech", fetch) == "Initech profile v2"
+    assert cache.stats()["stale_hits"] == 1 and cache.stats()["refreshes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_entry_expires_after_the_stale_window(clock):
+    fetch = _Profiles()
+    cache = ProfileCache(ttl_s=60, stale_s=30, clock=clock)
+    await cache.get_or_fetch("Initech", fetch)
+    clock.now += 91
+    assert await cache.get_or_fetch("Initech", fetch) == "Initech profile v2"
+    assert cache.stats()["refreshes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failures_reach_every_waiter_and_are_not_cached():
+    cache, fetch = ProfileCache(), _Profiles(fail=True)
+    fetch.gate.clear()
+    waiters = [asyncio.ensure_future(cache.get_or_fetch("Initech", fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    fetch.gate.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results) and fetch.calls == 1
+
+    fetch.fail = False
+    assert await cache.get_or_fetch("Initech", fetch) == "Initech profile v2"
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_the_stale_profile(clock):
+    fetch = _Profiles()
+    cache = ProfileCache(ttl_s=60, stale_s=30, clock=clock)
+    await cache.get_or_fetch("Initech", fetch)
+    clock.now += 70
+    fetch.fail = True
+    await cache.get_or_fetch("Initech", fetch)
+    await cache.wait_for_refreshes()
+    assert await cache.get_or_fetch("Initech", fetch) == "Initech profile v1"
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_is_shared_between_workers():
+    redis = aioredis.FakeRedis()
+    fetch = _Profiles()
+    worker_a, worker_b = ProfileCache(redis=redis), ProfileCache(redis=redis)
+
+    await worker_a.get_or_fetch("Initech", fetch)
+    assert await worker_b.get_or_fetch("initech", fetch) == "Initech profile v1"
+    assert fetch.calls == 1
+    stored = json.loads(await redis.get("essales:profile:initech"))
+    assert stored["profile"] == "Initech profile v1"
+    assert 0 < await redis.ttl("essales:profile:initech") <= 6 * 3600 + 3600
+
+
+@pytest.mark.asyncio
+async def test_workers_wait_for_a_peer_generating_the_same_profile():
+    redis = aioredis.FakeRedis()
+    fetch = _Profiles()
+    fetch.gate.clear()
+    worker_a, worker_b = ProfileCache(redis=redis), ProfileCache(redis=redis)
+
+    first = asyncio.ensure_future(worker_a.get_or_fetch("Initech", fetch))
+    await asyncio.sleep(0.01)  # worker A holds the lock
+    second = asyncio.ensure_future(worker_b.get_or_fetch("Initech", fetch))
+    await asyncio.sleep(0.01)
+    fetch.gate.set()
+    assert await first == await second == "Initech profile v1"
+    assert fetch.calls == 1
+
+
+class _BrokenRedis:
+    async def get(self, *args, **kwargs):
+        raise ConnectionError("redis down")
+
+    set = delete = get
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_fall_back_to_the_local_tier():
+    cache, fetch = ProfileCache(redis=_BrokenRedis()), _Profiles()
+    await cache.get_or_fetch("Initech", fetch)
+    assert await cache.get_or_fetch("Initech", fetch) == "Initech profile v1"
+    assert fetch.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_company_handler_reuses_cached_profiles(tmp_path):
+    path = tmp_path / "known.json"
+    path.write_text("[]")
+    metrics = MetricsHook()
+    llm = FakeListLLM(responses=["Initech makes TPS reports", "second call"])
+    handler = CompanyHandler(
+        llm,
+        extractor=EntityExtractor(JSONKnowledgeBase(str(path))),
+        profile_cache=ProfileCache(metrics=metrics),
+    )
+    for session in ("rep-1", "rep-2"):
+        reply = await handler.handle("Tell me about Initech", session)
+        assert reply == "Initech makes TPS reports"
+    assert llm.i == 1
+    assert metrics.counters()["profile_cache_hits"] == 1
@@ -7,7 +7,6 @@ registry and hook plumbing against tiny in-test skills.
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict
 
 import pytest
 
@@ -15,24 +14,11 @@ from hooks.base import Hook, HookManager
 from hooks.validation import JSONSchemaValidationHook
 from hooks.metrics import MetricsHook
 from hooks.error_hook import RetryAndFallbackHook
+from mcp.jsonrpc import INVALID_REQUEST, MAX_BATCH_SIZE
 from mcp.registry import ToolRegistry
 from mcp.server import handle_mcp_request
 from skills.base import Skill, SkillContext, SkillResult
-
-
-class EchoSkill(Skill):
-    name = "echo"
-    description = "Echo the message back."
-    input_schema = {
-        "type": "object",
-        "properties": {"message": {"type": "string"}},
-        "required": ["message"],
-        "additionalProperties": False,
-    }
-    output_schema = {"type": "string"}
-
-    async def invoke(self, arguments: Dict[str, Any], ctx: SkillContext) -> SkillResult:
-        return SkillResult(success=True, output=arguments["message"])
+from tests.stubs import EchoSkill
 
 
 class FlakeySkill(Skill):
@@ -90,6 +76,40 @@ async def test_error_hook_retries_and_recovers():
     assert FlakeySkill.calls == 2  # first failure + successful retry
 
 
+class _HangsOnRetrySkill(Skill):
+    name = "hangs"
+    description = "Times out, then hangs on the retry."
+    input_schema = {"type": "object", "properties": {}, "additionalProperties": False}
+
+    def __init__(self):
+        self.calls = 0
+
+    async def invoke(self, arguments, ctx):
+        self.calls += 1
+        if self.calls == 1:
+            raise TimeoutError("first call always fails")
+        await asyncio.Event().wait()
+
+
+@pytest.mark.asyncio
+async def test_error_hook_lets_cancellation_propagate():
+    hook = RetryAndFallbackHook(max_retries=1, backoff_base_s=0)
+    reg = ToolRegistry(hook_manager=HookManager(error=[hook]))
+    skill = _HangsOnRetrySkill()
+    reg.register(skill)
+
+    task = asyncio.ensure_future(reg.invoke("hangs", {}, SkillContext()))
+    while skill.calls < 2:  # cancel during the retry
+        await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # A cancellation handed straight to the hook isn't turned into a result.
+    with pytest.raises(asyncio.CancelledError):
+        await hook.on_error(reg.get("hangs"), {}, SkillContext(), asyncio.CancelledError())
+
+
 @pytest.mark.asyncio
 async def test_metrics_hook_captures_counts():
     metrics = MetricsHook()
@@ -127,3 +147,153 @@ async def test_mcp_server_facade_list_and_call():
 
     unknown = await handle_mcp_request({"method": "foo"}, reg, ctx)
     assert unknown["isError"] is True
+
+
+class _ExplodingHook(Hook):
+    async def post(self, spec, arguments, ctx, result, duration_ms):
+        raise RuntimeError("observer bug")
+
+    async def on_error(self, spec, arguments, ctx, exc):
+        raise RuntimeError("error-hook bug")
+
+
+@pytest.mark.asyncio
+async def test_failing_post_hook_does_not_fail_the_call():
+    metrics = MetricsHook()
+    hm = HookManager(post=[_ExplodingHook(), metrics])
+    reg = ToolRegistry(hook_manager=hm)
+    reg.register(EchoSkill())
+    result = await reg.invoke("echo", {"message": "hi"}, SkillContext())
+    assert result.success
+    assert metrics.snapshot()["echo"]["success"] == 1  # later hooks still ran
+
+
+@pytest.mark.asyncio
+async def test_failing_error_hook_falls_through_to_next():
+    FlakeySkill.calls = 0
+    hm = HookManager(error=[_ExplodingHook(), RetryAndFallbackHook(max_retries=1)])
+    reg = ToolRegistry(hook_manager=hm)
+    reg.register(FlakeySkill())
+    result = await reg.invoke("flakey", {}, SkillContext())
+    assert result.success
+
+
+class SleepySkill(Skill):
+    name = "sleepy"
+    description = "Sleeps, reporting the budget it saw."
+    input_schema = {"type": "object", "properties": {}, "additionalProperties": False}
+    timeout_s = 0.05
+
+    def __init__(self, delay: float = 1.0):
+        self.delay = delay
+        self.seen_remaining = None
+
+    async def invoke(self, arguments, ctx):
+        from utils.deadline import remaining_s
+
+        self.seen_remaining = remaining_s()
+        await asyncio.sleep(self.delay)
+        return SkillResult(success=True, output="awake")
+
+
+@pytest.mark.asyncio
+async def test_tool_timeout_from_spec_is_enforced():
+    from mcp.registry import ToolTimeoutError
+
+    reg = ToolRegistry()
+    spec = reg.register(SleepySkill())
+    assert spec.timeout_s == 0.05
+    with pytest.raises(ToolTimeoutError):
+        await reg.invoke("sleepy", {}, SkillContext())
+
+
+@pytest.mark.asyncio
+async def test_turn_deadline_caps_tool_budget_and_is_visible_to_handlers():
+    import time
+
+    reg = ToolRegistry(default_timeout_s=5)
+    skill = SleepySkill(delay=0)
+    reg.register(skill, timeout_s=5)
+    ctx = SkillContext(deadline=time.monotonic() + 0.5)
+    assert 0 < reg.get("sleepy").budget_s(ctx) <= 0.5
+
+    result = await reg.invoke("sleepy", {}, ctx)
+    assert result.success
+    assert 0 < skill.seen_remaining <= 0.5
+
+
+@pytest.mark.asyncio
+async def test_call_after_deadline_is_skipped():
+    import time
+
+    reg = ToolRegistry()
+    skill = SleepySkill(delay=0)
+    reg.register(skill)
+    result = await reg.invoke("sleepy", {}, SkillContext(deadline=time.monotonic() - 1))
+    assert not result.success
+    assert result.metadata["deadline_exceeded"] is True
+    assert skill.seen_remaining is None  # never ran
+
+
+class _DelayEchoSkill(EchoSkill):
+    def __init__(self):
+        self.inflight = 0
+        self.peak = 0
+
+    async def invoke(self, arguments, ctx):
+        self.inflight += 1
+        self.peak = max(self.peak, self.inflight)
+        await asyncio.sleep(0.01 if arguments["message"] != "slow" else 0.05)
+        self.inflight -= 1
+        return SkillResult(success=True, output=arguments["message"])
+
+
+@pytest.mark.asyncio
+async def test_invoke_many_keeps_order_bounds_concurrency_and_runs_hooks():
+    skill = _DelayEchoSkill()
+    metrics = MetricsHook()
+    reg = ToolRegistry(hook_manager=HookManager(post=[metrics]))
+    reg.register(skill)
+
+    messages = ["slow"] + [f"m{i}" for i in range(9)]
+    calls = [("echo", {"message": m}, SkillContext()) for m in messages]
+    calls.append(("missing", {}, SkillContext()))
+    results = await reg.invoke_many(calls, max_concurrency=3)
+
+    assert [r.output for r in results[:-1]] == messages
+    assert not results[-1].success and "Unknown tool" in results[-1].error
+    assert skill.peak == 3
+    assert metrics.snapshot()["echo"]["invocations"] == 10
+
+
+@pytest.mark.asyncio
+async def test_mcp_batch_routes_calls_through_invoke_many():
+    reg = ToolRegistry()
+    reg.register(EchoSkill())
+    batch = [
+        {"method": "tools/call", "params": {"name": "echo", "arguments": {"message": "a"}}},
+        {"method": "tools/list"},
+        {"method": "tools/call", "params": {}},
+        {"method": "tools/call", "params": {"name": "echo", "arguments": {"message": "b"}}},
+        "junk",
+    ]
+    responses = await handle_mcp_request(batch, reg, SkillContext(session_id="s"))
+
+    assert [r.get("isError") for r in responses] == [False, None, True, False, True]
+    assert responses[0]["content"][0]["text"] == "a"
+    assert responses[1]["tools"][0]["name"] == "echo"
+    assert responses[3]["content"][0]["text"] == "b"
+
+
+@pytest.mark.asyncio
+async def test_mcp_batch_over_the_size_cap_is_rejected():
+    reg = ToolRegistry()
+    reg.register(EchoSkill())
+    call = {"method": "tools/call", "params": {"name": "echo", "arguments": {"message": "x"}}}
+
+    rejected = await handle_mcp_request([call] * (MAX_BATCH_SIZE + 1), reg, SkillContext())
+    assert rejected["isError"] is True and rejected["code"] == INVALID_REQUEST
+    assert "Batch too large" in rejected["content"][0]["text"]
+
+    accepted = await handle_mcp_request([call] * MAX_BATCH_SIZE, reg, SkillContext())
+    assert len(accepted) == MAX_BATCH_SIZE
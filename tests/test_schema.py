@@ -0,0 +1,73 @@
+"""Compiled tool-argument validators: flat fast path vs. jsonschema."""
+
+from __future__ import annotations
+
+import pytest
+
+from mcp.registry import ToolRegistry
+from mcp.schema import compile_validator
+from skills.base import Skill, SkillResult
+
+FLAT = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "description": "who"},
+        "amount": {"type": "number"},
+        "count": {"type": "integer"},
+        "urgent": {"type": "boolean"},
+        "stage": {"type": "string", "enum": ["open", "won", "lost"]},
+    },
+    "required": ["name"],
+    "additionalProperties": False,
+}
+
+CASES = [
+    {"name": "Acme"},
+    {"name": "Acme", "amount": 1.5, "count": 3, "urgent": True, "stage": "won"},
+    {},
+    {"name": 5},
+    {"name": "Acme", "amount": "lots"},
+    {"name": "Acme", "amount": True},
+    {"name": "Acme", "count": 2.0},
+    {"name": "Acme", "count": 2.5},
+    {"name": "Acme", "urgent": 1},
+    {"name": "Acme", "stage": "pending"},
+    {"name": "Acme", "extra": 1},
+    {"amount": "x", "extra": 1},
+]
+
+
+@pytest.mark.parametrize("arguments", CASES)
+def test_flat_fast_path_agrees_with_jsonschema(arguments):
+    fast = compile_validator(FLAT)
+    full = compile_validator(FLAT, fast_path=False)
+    assert bool(fast(arguments)) == bool(full(arguments))
+    assert sorted(fast(arguments)) == sorted(full(arguments))
+
+
+def test_rich_schema_falls_back_to_jsonschema():
+    schema = {
+        "type": "object",
+        "properties": {"tags": {"type": "array", "items": {"type": "string"}}},
+    }
+    validate = compile_validator(schema)
+    assert validate({"tags": ["a"]}) == []
+    assert validate({"tags": [1]})
+
+
+class _FlatSkill(Skill):
+    name = "flat"
+    description = "d"
+    input_schema = FLAT
+
+    async def invoke(self, arguments, ctx):
+        return SkillResult(success=True, output="ok")
+
+
+def test_register_compiles_validator_once():
+    spec = ToolRegistry().register(_FlatSkill())
+    validator = spec.validator
+    assert validator is not None
+    assert spec.validate({"name": "Acme"}) == []
+    assert spec.validate({}) == ["<root>: 'name' is a required property"]
+    assert spec.validator is validator
@@ -0,0 +1,115 @@
+"""Session slots: in-process and Redis stores, and CompanyHandler's use of them."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from fakeredis import aioredis
+from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableLambda
+
+from data.chat_history import get_chat_history
+from data.knowledge_base import JSONKnowledgeBase
+from data.session_state import (
+    COMPANY_PROFILE,
+    CURRENT_COMPANY,
+    InMemorySessionState,
+    RedisSessionState,
+    get_session_state,
+)
+from handlers.company import CompanyHandler
+from handlers.entity_extractor import EntityExtractor
+
+
+@pytest.fixture(params=["memory", "redis"])
+def state(request):
+    if request.param == "memory":
+        return InMemorySessionState()
+    return RedisSessionState(client=aioredis.FakeRedis())
+
+
+@pytest.mark.asyncio
+async def test_update_merges_and_none_removes(state):
+    assert await state.get("s1") == {}
+    await state.update("s1", current_company="acme", company_profile="Rockets")
+    await state.update("s1", company_profile=None, stage="discovery")
+    assert await state.get("s1") == {"current_company": "acme", "stage": "discovery"}
+    assert await state.get_slot("s1", "current_company") == "acme"
+    assert await state.get("s2") == {}
+
+    await state.clear("s1")
+    assert await state.get("s1") == {}
+
+
+@pytest.mark.asyncio
+async def test_in_memory_slots_expire_and_evict(clock):
+    state = InMemorySessionState(max_sessions=2, ttl_s=10, clock=clock)
+    for session in ("a", "b", "c"):
+        await state.update(session, current_company=session)
+    assert await state.get("a") == {} and len(state) == 2
+
+    clock.now = 11
+    assert await state.get("c") == {}
+
+
+@pytest.mark.asyncio
+async def test_redis_slots_are_one_hash_with_a_ttl():
+    redis = aioredis.FakeRedis()
+    state = RedisSessionState(client=redis, ttl_s=60)
+    await state.update("s1", current_company="acme")
+    assert await redis.hgetall("session_state:s1") == {b"current_company": b"acme"}
+    assert 0 < await redis.ttl("session_state:s1") <= 60
+
+
+class _ScriptedLLM:
+    """Answers extraction prompts with `extraction`, everything else with "ok"."""
+
+    def __init__(self, extraction: dict):
+        self.extraction = json.dumps(extraction)
+        self.prompts = []
+
+    def __call__(self, prompt) -> str:
+        text = prompt.to_string()
+        if "Output JSON" in text:
+            return self.extraction
+        self.prompts.append(text)
+        return "ok"
+
+
+@pytest.mark.asyncio
+async def test_company_context_lives_in_slots_not_history(tmp_path):
+    path = tmp_path / "known.json"
+    path.write_text(
+        json.dumps(
+            [
+                {
+                    "company_name": "Globex",
+                    "project_details": "Support chatbot",
+                    "worked_with": "2022",
+                    "contacts": ["Hank"],
+                }
+            ]
+        )
+    )
+    scripted = _ScriptedLLM({"company_name": "none", "is_company_query": False, "change_company": False})
+    handler = CompanyHandler(
+        RunnableLambda(scripted), extractor=EntityExtractor(JSONKnowledgeBase(str(path)))
+    )
+    history = get_chat_history("s1")
+    earlier = [HumanMessage(content="we met Acme last week")]
+    await history.aadd_messages(earlier)
+
+    reply = await handler.handle("switch to Globex", "s1")
+    assert reply == "Company context changed to Globex."
+    assert await get_session_state().get("s1") == {CURRENT_COMPANY: "globex"}
+
+    await handler.handle("tell me about Globex", "s1")
+    slots = await get_session_state().get("s1")
+    assert "Support chatbot" in slots[COMPANY_PROFILE]
+
+    await handler.handle("how many seats did they buy?", "s1")
+    (prompt,) = scripted.prompts
+    assert "Current company: globex" in prompt and "Support chatbot" in prompt
+    # Switching company no longer wipes the conversation.
+    assert await history.aget_messages() == earlier
@@ -0,0 +1,99 @@
+"""SessionStore: per-session persistence with LRU, idle-TTL and byte caps."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from data.chat_history import get_chat_history
+from data.session_store import SessionStore, message_size
+
+
+def _turn(text: str):
+    return [HumanMessage(content=text), AIMessage(content=f"re: {text}")]
+
+
+@pytest.mark.asyncio
+async def test_history_survives_across_calls_and_sessions_are_isolated():
+    await get_chat_history("a").aadd_messages(_turn("first"))
+    await get_chat_history("b").aadd_messages(_turn("other"))
+    await get_chat_history("a").aadd_messages(_turn("second"))
+
+    contents = [m.content for m in await get_chat_history("a").aget_messages()]
+
+    assert contents == ["first", "re: first", "second", "re: second"]
+
+
+def test_lru_evicts_least_recently_used_session():
+    store = SessionStore(max_sessions=2)
+    store.append("a", _turn("a"))
+    store.append("b", _turn("b"))
+    store.get("a")  # touch: b is now least recent
+    store.append("c", _turn("c"))
+
+    assert store.get("b") == []
+    assert store.get("a") and store.get("c")
+    assert store.stats()["evicted_lru"] == 1
+
+
+def test_idle_sessions_expire(clock):
+    store = SessionStore(idle_ttl_s=10, clock=clock)
+    store.append("old", _turn("x"))
+    clock.now = 5
+    store.append("fresh", _turn("y"))
+    clock.now = 12
+
+    assert store.get("old") == []
+    assert store.get("fresh")
+    assert store.stats()["evicted_idle"] == 1
+
+
+def test_byte_cap_evicts_oldest_but_keeps_the_writer():
+    per_turn = sum(message_size(m) for m in _turn("x" * 100))
+    store = SessionStore(max_bytes=per_turn * 2)
+    store.append("a", _turn("x" * 100))
+    store.append("b", _turn("x" * 100))
+    store.append("c", _turn("x" * 100))
+
+    stats = store.stats()
+    assert stats["bytes"] <= per_turn * 2
+    assert stats["evicted_bytes"] == 1
+    assert store.get("a") == [] and store.get("c")
+
+
+def test_byte_cap_trims_a_single_oversized_session():
+    per_turn = sum(message_size(m) for m in _turn("x" * 100))
+    store = SessionStore(max_bytes=per_turn * 2)
+    for i in range(5):
+        store.append("a", _turn(f"{i}" + "x" * 99))
+
+    stats = store.stats()
+    assert stats["bytes"] <= per_turn * 2
+    assert stats["trimmed_messages"] == 6 and stats["evicted_bytes"] == 0
+    assert [m.content[0] for m in store.get("a")] == ["3", "r", "4", "r"]
+    # Positions stay absolute after the trim.
+    length, tail = store.get_from("a", 8)
+    assert length == 10 and [m.content[0] for m in tail] == ["4", "r"]
+
+
+def test_clear_releases_bytes():
+    store = SessionStore()
+    store.append("a", _turn("hello"))
+    store.clear("a")
+    assert store.stats()["bytes"] == 0 and store.get("a") == []
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writers_lose_nothing():
+    history = SessionStore().history("s1")
+
+    async def writer(i: int) -> None:
+        for j in range(20):
+            await history.aadd_messages([HumanMessage(content=f"{i}-{j}")])
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*(writer(i) for i in range(10)))
+
+    assert len(await history.aget_messages()) == 200
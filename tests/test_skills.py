@@ -5,6 +5,7 @@ from __future__ import annotations
 import pytest
 
 from skills.base import SkillContext
+from skills.create_opportunity import CreateOpportunitySkill
 from skills.farewell import FarewellSkill
 from skills.fallback import FallbackSkill
 from skills.greeting import GreetingSkill
@@ -63,3 +64,48 @@ async def test_past_projects_hit(tmp_path):
     assert result.metadata["found"] is True
     assert result.output["company_name"] == "Acme"
     assert "jane@acme.com" in result.output["contacts"]
+
+
+@pytest.mark.asyncio
+async def test_past_projects_matches_variants_and_typos(tmp_path):
+    data_file = tmp_path / "known.json"
+    data_file.write_text(
+        '[{"company_name": "Acme Corporation", "aliases": ["Roadrunner Supply"]}]'
+    )
+    skill = PastProjectsSkill(data_path=str(data_file))
+    for query, how in [
+        ("ACME Corp.", "exact"),
+        ("roadrunner supply", "alias"),
+        ("Road Runner Suply", "fuzzy"),
+    ]:
+        result = await skill.invoke({"company_name": query}, SkillContext())
+        assert result.output["company_name"] == "Acme Corporation"
+        assert result.metadata["match"] == how
+
+
+class _StubOpportunityHandler:
+    def __init__(self, reply: str):
+        self.reply = reply
+
+    async def handle(self, user_message, session_id):
+        return self.reply
+
+
+@pytest.mark.asyncio
+async def test_create_opportunity_marks_missing_fields_prompt_direct():
+    handler = _StubOpportunityHandler(
+        "Please provide the following missing fields: amount, close_date."
+    )
+    result = await CreateOpportunitySkill(handler).invoke(
+        {"user_message": "new deal with Acme"}, SkillContext()
+    )
+    assert result.metadata["return_direct"] is True
+
+
+@pytest.mark.asyncio
+async def test_create_opportunity_other_replies_not_direct():
+    handler = _StubOpportunityHandler("Sorry, I couldn't understand that. Please rephrase.")
+    result = await CreateOpportunitySkill(handler).invoke(
+        {"user_message": "???"}, SkillContext()
+    )
+    assert result.metadata["return_direct"] is False
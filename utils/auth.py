@@ -0,0 +1,45 @@
+"""API-key authentication for the HTTP routes the Bot Framework doesn't cover.
+
+`/bot` is authenticated by the Bot Framework adapter. `/agent/stream` and
+`/mcp` run turns and tools directly, so callers must present a key:
+``Authorization: Bearer <key>``. Keys come from `AGENT_API_KEYS`, a
+comma-separated list of ``principal=key`` pairs. The principal names the
+caller in logs and namespaces its session ids, so one caller can never
+read or write another caller's (or a Teams conversation's) memory.
+
+With no keys configured, every request is rejected.
+"""
+
+from __future__ import annotations
+
+import hmac
+from typing import Dict, Optional
+
+
+def parse_api_keys(raw: str) -> Dict[str, str]:
+    """``"ci=abc,crm=def"`` -> ``{"abc": "ci", "def": "crm"}`` (key -> principal)."""
+    keys: Dict[str, str] = {}
+    for item in raw.split(","):
+        principal, sep, key = item.strip().partition("=")
+        if sep and principal.strip() and key.strip():
+            keys[key.strip()] = principal.strip()
+    return keys
+
+
+def principal_for(authorization: Optional[str], keys: Dict[str, str]) -> Optional[str]:
+    """The principal whose key is in a ``Bearer`` `authorization` header, else `None`."""
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token.strip():
+        return None
+    token = token.strip().encode()
+    principal = None
+    # Compare against every key in constant time, so timing leaks nothing.
+    for key, name in keys.items():
+        if hmac.compare_digest(token, key.encode()):
+            principal = name
+    return principal
+
+
+def api_session_id(principal: str, session_id: str) -> str:
+    """Session id for an API caller, namespaced away from Teams conversations."""
+    return f"api:{principal}:{session_id}"
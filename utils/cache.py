@@ -0,0 +1,68 @@
+"""Small in-process LRU cache with per-entry TTL.
+
+Shared by the caching layers (tool results, company profiles) so they agree
+on eviction and expiry semantics. Not thread-safe by design: it's used from
+the event loop, where each call runs to completion without interleaving.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+#: Returned by `TTLCache.get` on a miss (cached values may legitimately be None).
+MISSING: Any = object()
+
+
+class TTLCache(Generic[V]):
+    """Bounded LRU map whose entries also expire after a TTL.
+
+    Args:
+        max_entries: least recently used entries are evicted beyond this.
+        ttl_s: default lifetime of an entry; `None` means no expiry.
+        clock: monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_s: Optional[float] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[Optional[float], V]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> V:
+        """The cached value, or `MISSING` if absent or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return MISSING
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= self._clock():
+            del self._data[key]
+            return MISSING
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V, ttl_s: Optional[float] = None) -> None:
+        ttl = self.ttl_s if ttl_s is None else ttl_s
+        expires_at = None if ttl is None else self._clock() + ttl
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,46 @@
+"""Turn deadlines, visible to code that doesn't receive a `SkillContext`.
+
+A deadline is a `time.monotonic()` timestamp. The registry binds the
+calling context's deadline with `deadline_scope` while a skill runs, so the
+handlers behind a skill (LLM chains, Blob uploads, ...) can size their own
+timeouts with `remaining_s()` without changing their signatures. Backed by
+a `ContextVar`, so concurrent turns each see their own deadline.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_DEADLINE: ContextVar[Optional[float]] = ContextVar("essales_deadline", default=None)
+
+
+def current_deadline() -> Optional[float]:
+    return _DEADLINE.get()
+
+
+def remaining_s(deadline: Optional[float] = None) -> Optional[float]:
+    """Seconds left before `deadline` (default: the bound one), floored at 0.
+
+    Returns `None` when there is no deadline.
+    """
+    if deadline is None:
+        deadline = _DEADLINE.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[float]) -> Iterator[None]:
+    """Bind `deadline` for the block. A nested scope can only tighten it."""
+    outer = _DEADLINE.get()
+    if deadline is None or (outer is not None and outer <= deadline):
+        deadline = outer
+    token = _DEADLINE.set(deadline)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)